@@ -0,0 +1,94 @@
+"""Shared Databricks workspace clients for long-running provisioning work.
+
+Every SDK helper builds its own WorkspaceClient from a freshly generated token, which
+costs an OAuth round trip plus a new HTTP session (and TLS handshake) per call. A
+provisioning run issues hundreds of these calls against one workspace, so functions
+decorated with ``shared_workspace_clients`` get one client per workspace for their whole
+run instead; helpers get their client through ``get_workspace_client``, which returns the
+run's shared client and falls back to building a new one when called outside such a run
+(API routes, tests).
+"""
+
+import contextvars
+import functools
+import threading
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+from typing import Any
+from typing import Awaitable
+from typing import Callable
+from typing import Dict
+from typing import Optional
+from typing import Tuple
+from typing import TypeVar
+
+try:
+    from databricks.sdk import WorkspaceClient
+except ImportError:
+    print("failed to import libraries")
+
+from dbrx_api.dbrx_auth.token_gen import get_auth_token
+
+R = TypeVar("R")
+
+# Rebuild a shared client this long before its token expires
+TOKEN_REFRESH_MARGIN = timedelta(minutes=5)
+
+
+class _WorkspaceClients:
+    """Per-run cache of one WorkspaceClient per workspace host, rebuilt when its token nears expiry."""
+
+    def __init__(self):
+        self._clients: Dict[str, Tuple[Any, datetime]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, host: str) -> Any:
+        """Return the client for host, creating it (or replacing an expiring one) under the lock."""
+        key = host.rstrip("/")
+        with self._lock:
+            now = datetime.now(timezone.utc)
+            cached = self._clients.get(key)
+            if cached is None or now >= cached[1] - TOKEN_REFRESH_MARGIN:
+                token, expires_at = get_auth_token(now)
+                cached = (WorkspaceClient(host=host, token=token), expires_at)
+                self._clients[key] = cached
+            return cached[0]
+
+
+_run_clients: contextvars.ContextVar[Optional[_WorkspaceClients]] = contextvars.ContextVar(
+    "dbrx_shared_workspace_clients", default=None
+)
+
+
+def get_shared_workspace_client(host: str) -> Optional[Any]:
+    """
+    Return the current run's shared client for host, or None outside a shared-client run.
+
+    The run's clients live in a context variable, so they follow the work into the SDK
+    thread pool (run_sync copies the context) and never leak between runs.
+    """
+    clients = _run_clients.get()
+    return clients.get(host) if clients is not None else None
+
+
+def get_workspace_client(host: str) -> Any:
+    """Return the current run's shared client for host, else a new one with a fresh token."""
+    shared = get_shared_workspace_client(host)
+    if shared is not None:
+        return shared
+    return WorkspaceClient(host=host, token=get_auth_token(datetime.now(timezone.utc))[0])
+
+
+def shared_workspace_clients(fn: Callable[..., Awaitable[R]]) -> Callable[..., Awaitable[R]]:
+    """Decorate an async function so SDK helpers share one client per workspace while it runs."""
+
+    @functools.wraps(fn)
+    async def wrapper(*args: Any, **kwargs: Any) -> R:
+        token = _run_clients.set(_WorkspaceClients())
+        try:
+            return await fn(*args, **kwargs)
+        finally:
+            _run_clients.reset(token)
+
+    return wrapper
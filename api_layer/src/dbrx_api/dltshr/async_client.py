@@ -0,0 +1,66 @@
+"""Shared async HTTP client for Delta Sharing REST calls.
+
+The synchronous SDK helpers in this package build a new WorkspaceClient (and
+HTTP session) per call. For concurrent fan-outs in the workflow orchestrator,
+this module keeps a single httpx.AsyncClient so requests share pooled
+connections, multiplexed over HTTP/2 when the optional ``h2`` package is
+installed.
+"""
+
+import importlib.util
+from typing import Optional
+from urllib.parse import quote
+
+import httpx
+from loguru import logger
+
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """Return the shared AsyncClient, creating it on first use.
+
+    Returns:
+        httpx.AsyncClient shared by all callers in this process
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            http2=_HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+            timeout=30,
+        )
+        logger.debug("Created shared Delta Sharing async client", http2=_HTTP2_AVAILABLE)
+    return _client
+
+
+async def close_async_client() -> None:
+    """Close the shared AsyncClient if it was created."""
+    global _client
+    if _client is not None and not _client.is_closed:
+        await _client.aclose()
+    _client = None
+
+
+async def aget_recipient(recipient_name: str, dltshr_workspace_url: str, session_token: str) -> Optional[dict]:
+    """Get recipient details by name over the shared async client.
+
+    Args:
+        recipient_name: Name of the recipient (case-sensitive)
+        dltshr_workspace_url: Databricks workspace URL
+        session_token: Databricks access token
+
+    Returns:
+        Recipient JSON dict, or None if the recipient does not exist
+
+    Raises:
+        httpx.HTTPError: On transport errors or non-404 error responses
+    """
+    url = f"{dltshr_workspace_url.rstrip('/')}/api/2.1/unity-catalog/recipients/{quote(recipient_name, safe='')}"
+    response = await get_async_client().get(url, headers={"Authorization": f"Bearer {session_token}"})
+    if response.status_code == 404:
+        return None
+    response.raise_for_status()
+    return response.json()
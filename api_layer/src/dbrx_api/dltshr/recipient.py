@@ -7,14 +7,13 @@ from typing import List
 from typing import Optional
 
 try:
-    from databricks.sdk import WorkspaceClient
     from databricks.sdk.service.sharing import AuthenticationType
     from databricks.sdk.service.sharing import IpAccessList
 
 except ImportError:
     print("failed to import libraries")
 
-from dbrx_api.dbrx_auth.token_gen import get_auth_token
+from dbrx_api.dbrx_auth.shared_client import get_workspace_client
 
 # DLTSHR_WORKSPACE_URL = os.getenv("DLTSHR_WORKSPACE_URL")
 
@@ -34,8 +33,7 @@ def list_recipients(
     Returns:
         List of recipient objects
     """
-    session_token = get_auth_token(datetime.now(timezone.utc))[0]
-    w_client = WorkspaceClient(host=dltshr_workspace_url, token=session_token)
+    w_client = get_workspace_client(dltshr_workspace_url)
     all_recipients = []
 
     # The list() method returns an iterator that automatically handles
@@ -62,10 +60,7 @@ def get_recipients(recipient_name: str, dltshr_workspace_url: str):
     """
     try:
         # Get authentication token
-        session_token = get_auth_token(datetime.now(timezone.utc))[0]
-
-        # Create workspace client
-        w_client = WorkspaceClient(host=dltshr_workspace_url, token=session_token)
+        w_client = get_workspace_client(dltshr_workspace_url)
 
         # Get recipient by name
         response = w_client.recipients.get(name=recipient_name)
@@ -99,10 +94,7 @@ def create_recipient_d2d(
         D2D recipients do NOT support IP access lists.
     """
     # Get authentication token
-    session_token = get_auth_token(datetime.now(timezone.utc))[0]
-
-    # Create workspace client
-    w_client = WorkspaceClient(host=dltshr_workspace_url, token=session_token)
+    w_client = get_workspace_client(dltshr_workspace_url)
     try:
         # Create D2D recipient (no ip_access_list for D2D type)
         response = w_client.recipients.create(
@@ -152,35 +144,21 @@ def create_recipient_d2o(
     if ip_access_list:
         # Strip whitespace from each IP address
         cleaned_ips = [ip.strip() for ip in ip_access_list if ip.strip()]
-        print(f"DEBUG: Received ip_access_list for {recipient_name}: {ip_access_list}")
-        print(f"DEBUG: Cleaned IPs: {cleaned_ips}")
 
         if cleaned_ips:
             ip_access = IpAccessList(allowed_ip_addresses=cleaned_ips)
-            print(f"DEBUG: Created IpAccessList object with {len(cleaned_ips)} IPs")
-    else:
-        print(f"DEBUG: No ip_access_list provided for {recipient_name}")
 
     try:
         # Get authentication token
-        session_token = get_auth_token(datetime.now(timezone.utc))[0]
-
-        # Create workspace client
-        w_client = WorkspaceClient(host=dltshr_workspace_url, token=session_token)
+        w_client = get_workspace_client(dltshr_workspace_url)
 
         # Create TOKEN recipient with optional IP access list
-        print(f"DEBUG: Creating recipient {recipient_name}")
-        print(f"DEBUG: - Description being passed: '{description}'")
-        print(f"DEBUG: - IP access: {'None' if ip_access is None else f'{len(ip_access.allowed_ip_addresses)} IPs'}")
         response = w_client.recipients.create(
             name=recipient_name,
             comment=description,
             authentication_type=AuthenticationType.TOKEN,
             ip_access_list=ip_access,
         )
-        print(
-            f"DEBUG: Recipient created, comment in response: '{response.comment if hasattr(response, 'comment') else 'N/A'}'"
-        )
 
         return response
     except Exception as ex:
@@ -210,10 +188,7 @@ def rotate_recipient_token(
     """
     try:
         # Get authentication token
-        session_token = get_auth_token(datetime.now(timezone.utc))[0]
-
-        # Create workspace client
-        w_client = WorkspaceClient(host=dltshr_workspace_url, token=session_token)
+        w_client = get_workspace_client(dltshr_workspace_url)
 
         # Rotate token for recipient
         response = w_client.recipients.rotate_token(
@@ -267,10 +242,7 @@ def add_recipient_ip(
 
     try:
         # Get authentication token
-        session_token = get_auth_token(datetime.now(timezone.utc))[0]
-
-        # Create workspace client
-        w_client = WorkspaceClient(host=dltshr_workspace_url, token=session_token)
+        w_client = get_workspace_client(dltshr_workspace_url)
 
         # Get current recipient to retrieve existing IPs
         recipient = w_client.recipients.get(name=recipient_name)
@@ -333,10 +305,7 @@ def revoke_recipient_ip(
 
     try:
         # Get authentication token
-        session_token = get_auth_token(datetime.now(timezone.utc))[0]
-
-        # Create workspace client
-        w_client = WorkspaceClient(host=dltshr_workspace_url, token=session_token)
+        w_client = get_workspace_client(dltshr_workspace_url)
 
         # Get current recipient details
         recipient = w_client.recipients.get(name=recipient_name)
@@ -408,10 +377,7 @@ def update_recipient_description(
 
     try:
         # Get authentication token
-        session_token = get_auth_token(datetime.now(timezone.utc))[0]
-
-        # Create workspace client
-        w_client = WorkspaceClient(host=dltshr_workspace_url, token=session_token)
+        w_client = get_workspace_client(dltshr_workspace_url)
 
         # Update recipient description
         response = w_client.recipients.update(name=recipient_name, comment=description)
@@ -445,10 +411,7 @@ def update_recipient_expiration_time(
     """
     try:
         # Get authentication token
-        session_token = get_auth_token(datetime.now(timezone.utc))[0]
-
-        # Create workspace client
-        w_client = WorkspaceClient(host=dltshr_workspace_url, token=session_token)
+        w_client = get_workspace_client(dltshr_workspace_url)
 
         # Convert days to epoch milliseconds
         expiration_datetime = datetime.now(timezone.utc) + timedelta(days=expiration_time)
@@ -489,10 +452,7 @@ def delete_recipient(
 
     try:
         # Get authentication token
-        session_token = get_auth_token(datetime.now(timezone.utc))[0]
-
-        # Create workspace client
-        w_client = WorkspaceClient(host=dltshr_workspace_url, token=session_token)
+        w_client = get_workspace_client(dltshr_workspace_url)
 
         # Delete recipient
         response = w_client.recipients.delete(name=recipient_name)
@@ -1,13 +1,11 @@
 """Module for managing Databricks recipients for Delta Sharing."""
-from datetime import datetime
-from datetime import timezone
+
 from typing import List
 from typing import Optional
 
 from loguru import logger
 
 try:
-    from databricks.sdk import WorkspaceClient
     from databricks.sdk.service.sharing import PermissionsChange
     from databricks.sdk.service.sharing import SharedDataObject
     from databricks.sdk.service.sharing import SharedDataObjectDataObjectType
@@ -19,7 +17,7 @@ except ImportError:
 
 import os
 
-from dbrx_api.dbrx_auth.token_gen import get_auth_token
+from dbrx_api.dbrx_auth.shared_client import get_workspace_client
 
 ###################################
 
@@ -46,8 +44,7 @@ def list_shares_all(
         workspace_url=dltshr_workspace_url,
     )
     try:
-        session_token = get_auth_token(datetime.now(timezone.utc))[0]
-        w_client = WorkspaceClient(host=dltshr_workspace_url, token=session_token)
+        w_client = get_workspace_client(dltshr_workspace_url)
 
         all_shares = []
 
@@ -79,10 +76,7 @@ def get_shares(share_name: str, dltshr_workspace_url: str):
     logger.debug("Getting share from business logic", share_name=share_name, workspace_url=dltshr_workspace_url)
     try:
         # Get authentication token
-        session_token = get_auth_token(datetime.now(timezone.utc))[0]
-
-        # Create workspace client
-        w_client = WorkspaceClient(host=dltshr_workspace_url, token=session_token)
+        w_client = get_workspace_client(dltshr_workspace_url)
 
         # Get recipient by name
         response = w_client.shares.get(name=share_name)
@@ -105,8 +99,7 @@ def get_share_recipients(share_name: str, dltshr_workspace_url: str) -> List[str
         List of recipient/principal names; empty list if none or on error
     """
     try:
-        session_token = get_auth_token(datetime.now(timezone.utc))[0]
-        w_client = WorkspaceClient(host=dltshr_workspace_url, token=session_token)
+        w_client = get_workspace_client(dltshr_workspace_url)
         perms = w_client.shares.share_permissions(name=share_name)
         if not perms or not getattr(perms, "privilege_assignments", None):
             return []
@@ -129,8 +122,7 @@ def get_share_objects(share_name: str, dltshr_workspace_url: str) -> dict:
     """
     out: dict = {"tables": [], "views": [], "schemas": []}
     try:
-        session_token = get_auth_token(datetime.now(timezone.utc))[0]
-        w_client = WorkspaceClient(host=dltshr_workspace_url, token=session_token)
+        w_client = get_workspace_client(dltshr_workspace_url)
         share_info = w_client.shares.get(name=share_name, include_shared_data=True)
         objs = getattr(share_info, "shared_data_objects", None) or getattr(share_info, "objects", None)
         if not share_info or not objs:
@@ -170,10 +162,7 @@ def create_share(
         ShareInfo object on success, error message string on failure
     """
     # Get authentication token
-    session_token = get_auth_token(datetime.now(timezone.utc))[0]
-
-    # Create workspace client
-    w_client = WorkspaceClient(host=dltshr_workspace_url, token=session_token)
+    w_client = get_workspace_client(dltshr_workspace_url)
     try:
         # Create share
         print(f"DEBUG: Creating share {share_name}")
@@ -226,8 +215,7 @@ def update_share_description(
         None on success, error message string on failure
     """
     try:
-        session_token = get_auth_token(datetime.now(timezone.utc))[0]
-        w_client = WorkspaceClient(host=dltshr_workspace_url, token=session_token)
+        w_client = get_workspace_client(dltshr_workspace_url)
         w_client.shares.update(name=share_name, comment=description)
         logger.info(f"Updated share description for '{share_name}'")
         return None
@@ -253,10 +241,7 @@ def add_data_object_to_share(
         ShareInfo object on success, error message string on failure
     """
     # Get authentication token
-    session_token = get_auth_token(datetime.now(timezone.utc))[0]
-
-    # Create workspace client
-    w_client = WorkspaceClient(host=dltshr_workspace_url, token=session_token)
+    w_client = get_workspace_client(dltshr_workspace_url)
     try:
         if objects_to_add is None or len(objects_to_add) == 0:
             return "No data objects provided to add to share."
@@ -293,28 +278,11 @@ def add_data_object_to_share(
             ]
 
         if schemas_to_add:
-            # Extract schema names from tables and views being added
-            table_schemas = set()
-            view_schemas = set()
-
-            for table_name in tables_to_add:
-                # Extract schema from fully qualified name (catalog.schema.table)
-                parts = table_name.split(".")
-                if len(parts) >= 2:
-                    schema_fqn = ".".join(parts[:-1])  # catalog.schema
-                    table_schemas.add(schema_fqn)
-
-            for view_name in views_to_add:
-                parts = view_name.split(".")
-                if len(parts) >= 2:
-                    schema_fqn = ".".join(parts[:-1])
-                    view_schemas.add(schema_fqn)
+            # Schemas (catalog.schema) of the tables and views being added
+            object_schemas = {name.rpartition(".")[0] for name in (*tables_to_add, *views_to_add) if "." in name}
 
             # Check for conflicts
-            conflicting_schemas = []
-            for schema_name in schemas_to_add:
-                if schema_name in table_schemas or schema_name in view_schemas:
-                    conflicting_schemas.append(schema_name)
+            conflicting_schemas = [schema_name for schema_name in schemas_to_add if schema_name in object_schemas]
 
             if conflicting_schemas:
                 conflict_msg = f"Cannot add schemas {conflicting_schemas} as individual tables/views from these schemas are already part of same request"
@@ -379,10 +347,7 @@ def revoke_data_object_from_share(
         ShareInfo object on success, error message string on failure
     """
     # Get authentication token
-    session_token = get_auth_token(datetime.now(timezone.utc))[0]
-
-    # Create workspace client
-    w_client = WorkspaceClient(host=dltshr_workspace_url, token=session_token)
+    w_client = get_workspace_client(dltshr_workspace_url)
     try:
         if objects_to_revoke is None or len(objects_to_revoke) == 0:
             return "No data objects provided to revoke from share."
@@ -419,28 +384,11 @@ def revoke_data_object_from_share(
             ]
 
         if schemas_to_revoke:
-            # Extract schema names from tables and views being revoked
-            table_schemas = set()
-            view_schemas = set()
-
-            for table_name in tables_to_revoke:
-                # Extract schema from fully qualified name (catalog.schema.table)
-                parts = table_name.split(".")
-                if len(parts) >= 2:
-                    schema_fqn = ".".join(parts[:-1])  # catalog.schema
-                    table_schemas.add(schema_fqn)
-
-            for view_name in views_to_revoke:
-                parts = view_name.split(".")
-                if len(parts) >= 2:
-                    schema_fqn = ".".join(parts[:-1])
-                    view_schemas.add(schema_fqn)
+            # Schemas (catalog.schema) of the tables and views being revoked
+            object_schemas = {name.rpartition(".")[0] for name in (*tables_to_revoke, *views_to_revoke) if "." in name}
 
             # Check for conflicts
-            conflicting_schemas = []
-            for schema_name in schemas_to_revoke:
-                if schema_name in table_schemas or schema_name in view_schemas:
-                    conflicting_schemas.append(schema_name)
+            conflicting_schemas = [schema_name for schema_name in schemas_to_revoke if schema_name in object_schemas]
 
             if conflicting_schemas:
                 conflict_msg = f"Cannot remove schemas {conflicting_schemas} as individual tables/views from these schemas are already part of same request"
@@ -502,8 +450,7 @@ def add_recipients_to_share(
     Returns:
         UpdateSharePermissionsResponse on success, error message string on failure
     """
-    session_token = get_auth_token(datetime.now(timezone.utc))[0]
-    w_client = WorkspaceClient(host=dltshr_workspace_url, token=session_token)
+    w_client = get_workspace_client(dltshr_workspace_url)
     try:
         # Get share details to check ownership
         share_info = w_client.shares.get(name=share_name)
@@ -576,6 +523,69 @@ def add_recipients_to_share(
             raise
 
 
+def add_recipients_to_share_bulk(
+    dltshr_workspace_url: str,
+    share_name: str,
+    recipient_names: List[str],
+):
+    """Grant several recipients SELECT permission on a share with one permissions update.
+
+    Same checks as add_recipients_to_share, but the share owner, current user and
+    existing grants are read once, and every missing grant goes out in a single
+    update_permissions call. Recipients that already have access are skipped.
+
+    Args:
+        dltshr_workspace_url: Databricks workspace URL
+        share_name: Share name
+        recipient_names: Recipient names
+
+    Returns:
+        UpdateSharePermissionsResponse on success, None if every recipient already
+        had access, error message string on failure
+    """
+    w_client = get_workspace_client(dltshr_workspace_url)
+    try:
+        share_info = w_client.shares.get(name=share_name)
+        current_username = w_client.current_user.me().user_name
+        if share_info.owner != current_username:
+            return f"Permission denied to add recipient. User is not an owner of Share: {share_name}"
+
+        perms = w_client.shares.share_permissions(name=share_name)
+        granted = {
+            assignment.principal
+            for assignment in (getattr(perms, "privilege_assignments", None) or [])
+            if assignment.privileges
+        }
+        to_add = [name for name in dict.fromkeys(recipient_names) if name not in granted]
+        if not to_add:
+            return None
+
+        for recipient_name in to_add:
+            try:
+                recipient_info = w_client.recipients.get(name=recipient_name)
+            except Exception as recipient_error:
+                if "does not exist" in str(recipient_error).lower():
+                    return f"Recipient not found: {recipient_name}"
+                raise
+            if recipient_info.owner != current_username:
+                return f"Permission denied to add recipient. User is not an owner of Recipient: {recipient_name}"
+
+        return w_client.shares.update_permissions(
+            name=share_name,
+            changes=[PermissionsChange(principal=name, add=["SELECT"]) for name in to_add],
+        )
+    except Exception as e:
+        error_msg = str(e)
+        if "PERMISSION_DENIED" in error_msg:
+            return f"Permission denied to add recipients to share: {share_name}"
+        if "RESOURCE_DOES_NOT_EXIST" in error_msg or "does not exist" in error_msg.lower():
+            return f"Share or recipient not found: {error_msg}"
+        logger.error(
+            "Error adding recipients to share", share_name=share_name, recipients=recipient_names, error=error_msg
+        )
+        raise
+
+
 def remove_recipients_from_share(
     dltshr_workspace_url: str,
     share_name: str,
@@ -591,8 +601,7 @@ def remove_recipients_from_share(
     Returns:
         UpdateSharePermissionsResponse on success, error message string on failure
     """
-    session_token = get_auth_token(datetime.now(timezone.utc))[0]
-    w_client = WorkspaceClient(host=dltshr_workspace_url, token=session_token)
+    w_client = get_workspace_client(dltshr_workspace_url)
     try:
         # Get share details to check ownership
         try:
@@ -682,8 +691,7 @@ def delete_share(
     # Validate parameters
 
     try:
-        session_token = get_auth_token(datetime.now(timezone.utc))[0]
-        w_client = WorkspaceClient(host=dltshr_workspace_url, token=session_token)
+        w_client = get_workspace_client(dltshr_workspace_url)
 
         # Delete share
         w_client.shares.delete(name=share_name)
@@ -1,8 +1,6 @@
 """Module for managing Databricks DLT pipelines for Delta Sharing."""
 
 import time
-from datetime import datetime
-from datetime import timezone
 from typing import List
 from typing import Optional
 
@@ -26,9 +24,12 @@ except ImportError:
     UpdateInfo = None  # type: ignore[misc, assignment]
     PipelineStateInfo = None  # type: ignore[misc, assignment]
 
-from dbrx_api.dbrx_auth.token_gen import get_auth_token
+from dbrx_api.dbrx_auth.shared_client import get_workspace_client
 from dbrx_api.monitoring.logger import logger
 
+# Prefix of the message create_pipeline returns when the pipeline name is taken
+PIPELINE_EXISTS_PREFIX = "Pipeline already exists: "
+
 
 def list_pipelines(
     dltshr_workspace_url: str,
@@ -57,8 +58,7 @@ def list_pipelines(
     if not DATABRICKS_SDK_AVAILABLE:
         raise ImportError("Databricks SDK is not available")
 
-    session_token = get_auth_token(datetime.now(timezone.utc))[0]
-    w_client = WorkspaceClient(host=dltshr_workspace_url, token=session_token)
+    w_client = get_workspace_client(dltshr_workspace_url)
 
     all_pipelines = []
 
@@ -97,8 +97,7 @@ def list_pipelines_with_search_criteria(
     if not DATABRICKS_SDK_AVAILABLE:
         raise ImportError("Databricks SDK is not available")
 
-    session_token = get_auth_token(datetime.now(timezone.utc))[0]
-    w_client = WorkspaceClient(host=dltshr_workspace_url, token=session_token)
+    w_client = get_workspace_client(dltshr_workspace_url)
 
     all_pipelines = []
     filter_expr_name = f"name like '%{filter_expr}%'"
@@ -130,8 +129,7 @@ def get_pipeline_by_name(
         raise ImportError("Databricks SDK is not available")
 
     try:
-        session_token = get_auth_token(datetime.now(timezone.utc))[0]
-        w_client = WorkspaceClient(host=dltshr_workspace_url, token=session_token)
+        w_client = get_workspace_client(dltshr_workspace_url)
 
         # Filter by exact name match - list_pipelines returns PipelineStateInfo
         pipelines = w_client.pipelines.list_pipelines(filter=f"name like '{pipeline_name}'")
@@ -642,8 +640,7 @@ def create_pipeline(
         raise ImportError("Databricks SDK is not available")
 
     try:
-        session_token = get_auth_token(datetime.now(timezone.utc))[0]
-        w_client = WorkspaceClient(host=dltshr_workspace_url, token=session_token)
+        w_client = get_workspace_client(dltshr_workspace_url)
         pipelines = w_client.pipelines.list_pipelines(filter=f"name like '{pipeline_name}'")
 
         # Initialize pipeline_id to None
@@ -652,7 +649,7 @@ def create_pipeline(
             pipeline_id = pipeline.pipeline_id
 
         if pipeline_id:
-            return f"Pipeline already exists: {pipeline_name}"
+            return f"{PIPELINE_EXISTS_PREFIX}{pipeline_name}"
 
         # Extract required configuration values for validation
         source_table = configuration.get("pipelines.source_table")
@@ -825,8 +822,7 @@ def delete_pipeline(
         raise ImportError("Databricks SDK is not available")
 
     try:
-        session_token = get_auth_token(datetime.now(timezone.utc))[0]
-        w_client = WorkspaceClient(host=dltshr_workspace_url, token=session_token)
+        w_client = get_workspace_client(dltshr_workspace_url)
         w_client.pipelines.delete(pipeline_id=pipeline_id)
         return None
 
@@ -863,8 +859,7 @@ def find_pipelines_by_source_and_target(
     matched: List[GetPipelineResponse] = []
 
     try:
-        session_token = get_auth_token(datetime.now(timezone.utc))[0]
-        w_client = WorkspaceClient(host=dltshr_workspace_url, token=session_token)
+        w_client = get_workspace_client(dltshr_workspace_url)
 
         for pipeline_info in w_client.pipelines.list_pipelines():
             try:
@@ -931,8 +926,7 @@ def update_pipeline_target_configuration(
     if not DATABRICKS_SDK_AVAILABLE:
         raise ImportError("Databricks SDK is not available")
     try:
-        session_token = get_auth_token(datetime.now(timezone.utc))[0]
-        w_client = WorkspaceClient(host=dltshr_workspace_url, token=session_token)
+        w_client = get_workspace_client(dltshr_workspace_url)
 
         # Build update parameters - always include pipeline_id, name, and configuration
         update_params = {
@@ -991,8 +985,7 @@ def update_pipeline_notifications_add(
     if not DATABRICKS_SDK_AVAILABLE:
         raise ImportError("Databricks SDK is not available")
     try:
-        session_token = get_auth_token(datetime.now(timezone.utc))[0]
-        w_client = WorkspaceClient(host=dltshr_workspace_url, token=session_token)
+        w_client = get_workspace_client(dltshr_workspace_url)
         pipelines = w_client.pipelines.list_pipelines(filter=f"name like '{pipeline_name}'")
 
         # Initialize pipeline_id to None
@@ -1034,8 +1027,7 @@ def update_pipeline_notifications_remove(
     if not DATABRICKS_SDK_AVAILABLE:
         raise ImportError("Databricks SDK is not available")
     try:
-        session_token = get_auth_token(datetime.now(timezone.utc))[0]
-        w_client = WorkspaceClient(host=dltshr_workspace_url, token=session_token)
+        w_client = get_workspace_client(dltshr_workspace_url)
         pipelines = w_client.pipelines.list_pipelines(filter=f"name like '{pipeline_name}'")
 
         # Initialize pipeline_id to None
@@ -1076,8 +1068,7 @@ def update_pipeline_name(dltshr_workspace_url: str, pipeline_name: str, new_pipe
     if not DATABRICKS_SDK_AVAILABLE:
         raise ImportError("Databricks SDK is not available")
     try:
-        session_token = get_auth_token(datetime.now(timezone.utc))[0]
-        w_client = WorkspaceClient(host=dltshr_workspace_url, token=session_token)
+        w_client = get_workspace_client(dltshr_workspace_url)
         pipelines = w_client.pipelines.list_pipelines(filter=f"name like '{pipeline_name}'")
 
         # Initialize pipeline_id to None
@@ -1117,8 +1108,7 @@ def update_pipeline_continuous(dltshr_workspace_url: str, pipeline_name: str, co
             return f"Pipeline not found: {pipeline_name}"
 
         # Initialize workspace client to get full pipeline spec
-        session_token = get_auth_token(datetime.now(timezone.utc))[0]
-        w_client = WorkspaceClient(host=dltshr_workspace_url, token=session_token)
+        w_client = get_workspace_client(dltshr_workspace_url)
 
         # Get full pipeline specification to preserve all settings
         full_pipeline = w_client.pipelines.get(pipeline_id=existing_pipeline.pipeline_id)
@@ -1220,8 +1210,7 @@ def pipeline_full_refresh(
             return f"Pipeline not found: {pipeline_name}"
 
         # Initialize workspace client
-        session_token = get_auth_token(datetime.now(timezone.utc))[0]
-        w_client = WorkspaceClient(host=dltshr_workspace_url, token=session_token)
+        w_client = get_workspace_client(dltshr_workspace_url)
 
         # Get full pipeline state
         full_pipeline = w_client.pipelines.get(pipeline_id=existing_pipeline.pipeline_id)
@@ -1,14 +1,11 @@
 """Module for managing Databricks job schedules and notifications."""
 
-from datetime import datetime
-from datetime import timezone as dt_timezone
 from typing import Any
 from typing import Dict
 from typing import List
 from typing import Optional
 
 try:
-    from databricks.sdk import WorkspaceClient
     from databricks.sdk.service.jobs import CronSchedule
     from databricks.sdk.service.jobs import JobEmailNotifications
     from databricks.sdk.service.jobs import PauseStatus
@@ -27,7 +24,7 @@ except ImportError:
     UpdateInfo = None  # type: ignore[misc, assignment]
     PipelineStateInfo = None  # type: ignore[misc, assignment]
 
-from dbrx_api.dbrx_auth.token_gen import get_auth_token
+from dbrx_api.dbrx_auth.shared_client import get_workspace_client
 
 # list schedules
 # get schedule for pipeline
@@ -104,8 +101,7 @@ def list_schedules(
     if not DATABRICKS_SDK_AVAILABLE:
         raise ImportError("Databricks SDK is not available")
 
-    session_token = get_auth_token(datetime.now(dt_timezone.utc))[0]
-    w_client = WorkspaceClient(host=dltshr_workspace_url, token=session_token)
+    w_client = get_workspace_client(dltshr_workspace_url)
 
     # Set default max_results if not provided
     if max_results is None:
@@ -213,12 +209,12 @@ def list_schedules(
                 if settings.trigger.file_arrival:
                     trigger_schedule["type"] = "file_arrival"
                     trigger_schedule["url"] = settings.trigger.file_arrival.url
-                    trigger_schedule[
-                        "min_time_between_triggers_seconds"
-                    ] = settings.trigger.file_arrival.min_time_between_triggers_seconds
-                    trigger_schedule[
-                        "wait_after_last_change_seconds"
-                    ] = settings.trigger.file_arrival.wait_after_last_change_seconds
+                    trigger_schedule["min_time_between_triggers_seconds"] = (
+                        settings.trigger.file_arrival.min_time_between_triggers_seconds
+                    )
+                    trigger_schedule["wait_after_last_change_seconds"] = (
+                        settings.trigger.file_arrival.wait_after_last_change_seconds
+                    )
 
                 # Pipeline update trigger
                 elif hasattr(settings.trigger, "table_update") and settings.trigger.table_update:
@@ -366,8 +362,7 @@ def create_schedule_for_pipeline(
         return "Error: Databricks SDK is not available"
 
     try:
-        session_token = get_auth_token(datetime.now(dt_timezone.utc))[0]
-        w_client = WorkspaceClient(host=dltshr_workspace_url, token=session_token)
+        w_client = get_workspace_client(dltshr_workspace_url)
 
         # Check if job already exists
         existing_jobs = list(w_client.jobs.list(name=job_name))
@@ -431,8 +426,7 @@ def delete_schedule_for_pipeline(
         return "Error: Databricks SDK is not available"
 
     try:
-        session_token = get_auth_token(datetime.now(dt_timezone.utc))[0]
-        w_client = WorkspaceClient(host=dltshr_workspace_url, token=session_token)
+        w_client = get_workspace_client(dltshr_workspace_url)
 
         if job_name:
             # Delete specific job by name
@@ -495,8 +489,7 @@ def update_schedule_for_pipeline(
     cron_expression = cron_expression.strip().strip('"').strip("'")
 
     try:
-        session_token = get_auth_token(datetime.now(dt_timezone.utc))[0]
-        w_client = WorkspaceClient(host=dltshr_workspace_url, token=session_token)
+        w_client = get_workspace_client(dltshr_workspace_url)
 
         # Get current job settings
         job = w_client.jobs.get(job_id=job_id)
@@ -547,8 +540,7 @@ def update_timezone_for_schedule(
     if not DATABRICKS_SDK_AVAILABLE:
         return "Error: Databricks SDK is not available"
     try:
-        session_token = get_auth_token(datetime.now(dt_timezone.utc))[0]
-        w_client = WorkspaceClient(host=dltshr_workspace_url, token=session_token)
+        w_client = get_workspace_client(dltshr_workspace_url)
 
         # Get current job settings
         job = w_client.jobs.get(job_id=job_id)
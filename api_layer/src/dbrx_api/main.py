@@ -276,11 +276,17 @@ def create_app(settings: Settings | None = None) -> FastAPI:
 
         @app.on_event("shutdown")
         async def shutdown_workflow():
-            """Close workflow database connections."""
+            """Close workflow database connections, the shared Delta Sharing HTTP client and SDK thread pool."""
             if hasattr(app.state, "domain_db_pool"):
                 await app.state.domain_db_pool.close()
                 logger.info("Workflow database closed")
 
+            from dbrx_api.dltshr.async_client import close_async_client
+            from dbrx_api.workflow.orchestrator.concurrency import shutdown_executor
+
+            await close_async_client()
+            shutdown_executor()
+
     else:
         logger.info("Workflow system disabled (enable_workflow=false or domain_db_connection_string not set)")
 
@@ -298,6 +304,13 @@ def create_app(settings: Settings | None = None) -> FastAPI:
 
     app.middleware("http")(handle_broad_exceptions)
 
+    async def flush_logs():
+        """Wait for the stdout sink's background writer (enqueue=True) to drain queued log records."""
+        await logger.complete()
+
+    # Registered last so it runs after the other shutdown hooks and flushes their messages too
+    app.router.add_event_handler("shutdown", flush_logs)
+
     # Override OpenAPI schema generation to produce 3.0.3 compatible spec
     app.openapi = lambda: custom_openapi_schema(app)
 
@@ -76,10 +76,12 @@ def configure_logger(
 
     logger.remove()  # remove the default logger
 
-    # Add stdout handler (always enabled for console output)
+    # Add stdout handler (always enabled for console output). enqueue=True hands records to a
+    # background writer thread so provisioning runs do not block the event loop on console I/O.
     logger.add(
         sink=sys.stdout,
         diagnose=False,
+        enqueue=True,
         format="<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> | <bold><white>{message}</white></bold> | <dim>{extra}</dim> {stacktrace}",
         filter=process_log_record,
     )
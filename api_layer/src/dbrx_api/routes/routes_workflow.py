@@ -133,6 +133,12 @@ async def upload_and_validate_sharepack(
         logger.info(f"Reusing existing share pack: {share_pack_id} ({share_pack_name})")
         logger.info("Updating share pack with new configuration...")
 
+        # Actions journaled for the previous upload must not be skipped by this one's run
+        # (e.g. a share deleted, recreated by a later upload, then deleted again)
+        from dbrx_api.workflow.db.repository_idempotency import IdempotencyRepository
+
+        await IdempotencyRepository(db_pool.pool).clear(share_pack_id)
+
         # Update the existing share pack with new config
         # This creates a new version in the history while maintaining the same share_pack_id
         await repo.create_from_config(
@@ -16,7 +16,7 @@ async def run_migrations(pool: asyncpg.Pool) -> None:
     This function:
     1. Reads the schema.sql file
     2. Executes it against the database
-    3. Creates deltashare schema and all 16 tables if they don't exist
+    3. Creates deltashare schema and all 17 tables if they don't exist
 
     All SQL uses CREATE TABLE IF NOT EXISTS, so it's safe to run multiple times.
 
@@ -51,7 +51,7 @@ async def run_migrations(pool: asyncpg.Pool) -> None:
             await conn.execute(schema_sql)
             logger.info("✅ Workflow database migrations completed successfully")
             logger.info("   - Created deltashare schema")
-            logger.info("   - Created 16 tables (11 SCD2 + 5 append-only)")
+            logger.info("   - Created 17 tables (11 SCD2 + 6 append-only)")
             logger.info("   - Created all indexes")
 
         except Exception as e:
@@ -161,6 +161,7 @@ async def verify_schema(pool: asyncpg.Pool) -> dict:
         "sync_jobs",
         "notifications",
         "audit_trail",
+        "idempotency_log",
     ]
 
     async with pool.acquire() as conn:
@@ -265,7 +266,7 @@ if __name__ == "__main__":
             # Verify
             verification = await verify_schema(pool)
             if verification["all_present"]:
-                logger.info("✅ All 16 tables present")
+                logger.info("✅ All 17 tables present")
             else:
                 logger.warning(f"⚠️  Missing tables: {verification['missing_tables']}")
 
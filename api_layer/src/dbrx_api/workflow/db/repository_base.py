@@ -5,10 +5,14 @@ Base class providing common SCD Type 2 operations for all repositories.
 All concrete repositories inherit from this class and add domain-specific queries.
 """
 
+import json
 from typing import Any
 from typing import Dict
 from typing import List
+from typing import NamedTuple
 from typing import Optional
+from typing import Tuple
+from typing import Union
 from uuid import UUID
 
 import asyncpg
@@ -21,6 +25,15 @@ from dbrx_api.workflow.db.scd2 import get_history
 from dbrx_api.workflow.db.scd2 import get_point_in_time_version
 from dbrx_api.workflow.db.scd2 import restore_deleted_entity
 from dbrx_api.workflow.db.scd2 import soft_delete_scd2
+from dbrx_api.workflow.db.scd2 import soft_delete_scd2_many
+
+
+class ConfigWrite(NamedTuple):
+    """Outcome of one create_many_from_config row."""
+
+    entity_id: UUID  # business key actually written (may be an existing or soft-deleted entity's)
+    record_id: UUID  # record_id of the current version
+    action: str  # "created", "updated" or "unchanged"
 
 
 class BaseRepository:
@@ -31,7 +44,13 @@ class BaseRepository:
     Provides generic CRUD operations using SCD2 pattern.
     """
 
-    def __init__(self, pool: asyncpg.Pool, table_name: str, entity_id_column: str):
+    def __init__(
+        self,
+        pool: asyncpg.Pool,
+        table_name: str,
+        entity_id_column: str,
+        name_column: Optional[str] = None,
+    ):
         """
         Initialize base repository.
 
@@ -39,10 +58,13 @@ class BaseRepository:
             pool: asyncpg connection pool
             table_name: Database table name (without schema prefix)
             entity_id_column: Business key column name (e.g., "tenant_id", "share_pack_id")
+            name_column: Natural key column (e.g., "share_name") that share pack provisioning
+                resolves existing business keys by; required for create_many_from_config
         """
         self.pool = pool
         self.table = table_name
         self.entity_id_col = entity_id_column
+        self.name_col = name_column
 
     async def get_current(
         self,
@@ -139,46 +161,161 @@ class BaseRepository:
         """
         async with self.pool.acquire() as conn:
             async with conn.transaction():
-                # Check if data changed before creating version
-                current_row = await get_current_version(conn, self.table, self.entity_id_col, entity_id, False)
-                is_new = current_row is None
-
-                record_id = await expire_and_insert_scd2(
-                    conn,
-                    self.table,
-                    self.entity_id_col,
-                    entity_id,
-                    fields,
-                    created_by,
-                    change_reason,
-                    skip_if_unchanged=skip_if_unchanged,
+                return await self._create_or_update_on(
+                    conn, entity_id, fields, created_by, change_reason, skip_if_unchanged
                 )
 
-                # Check if a new version was actually created
-                new_row = await get_current_version(conn, self.table, self.entity_id_col, entity_id, False)
-                version_created = is_new or (
-                    new_row and new_row.get("record_id") != current_row.get("record_id") if current_row else True
-                )
+    async def _create_or_update_on(
+        self,
+        conn: asyncpg.Connection,
+        entity_id: UUID,
+        fields: Dict[str, Any],
+        created_by: str,
+        change_reason: str = "",
+        skip_if_unchanged: bool = True,
+    ) -> UUID:
+        """
+        create_or_update on a caller-supplied connection.
+
+        Callers MUST already be inside a transaction on conn; this lets bulk writers
+        run many SCD2 operations on one connection and one transaction.
+        """
+        record_id, _ = await self._create_or_update_action_on(
+            conn, entity_id, fields, created_by, change_reason, skip_if_unchanged
+        )
+        return record_id
+
+    async def _create_or_update_action_on(
+        self,
+        conn: asyncpg.Connection,
+        entity_id: UUID,
+        fields: Dict[str, Any],
+        created_by: str,
+        change_reason: str = "",
+        skip_if_unchanged: bool = True,
+    ) -> Tuple[UUID, str]:
+        """
+        _create_or_update_on that also reports what happened.
+
+        Returns:
+            (record_id, action) with action "created", "updated" or "unchanged"
+        """
+        # Check if data changed before creating version
+        current_row = await get_current_version(conn, self.table, self.entity_id_col, entity_id, False)
+        is_new = current_row is None
+
+        record_id = await expire_and_insert_scd2(
+            conn,
+            self.table,
+            self.entity_id_col,
+            entity_id,
+            fields,
+            created_by,
+            change_reason,
+            skip_if_unchanged=skip_if_unchanged,
+        )
+
+        # Check if a new version was actually created
+        new_row = await get_current_version(conn, self.table, self.entity_id_col, entity_id, False)
+        version_created = is_new or (
+            new_row and new_row.get("record_id") != current_row.get("record_id") if current_row else True
+        )
+
+        # Write to audit trail only if a new version was created
+        # Skip audit if data was unchanged (no version created)
+        if version_created:
+            try:
+                async with conn.transaction():
+                    await self._write_audit(
+                        conn,
+                        entity_id,
+                        "CREATED" if is_new else "UPDATED",
+                        created_by,
+                        current_row if not is_new else None,
+                        fields,
+                    )
+            except Exception as e:
+                logger.opt(exception=True).warning(f"Audit trail write failed (SCD2 operation preserved): {e}")
+        else:
+            logger.debug(f"Skipping audit trail for {self.table}.{entity_id}: no changes detected")
+
+        if is_new:
+            return record_id, "created"
+        return record_id, "updated" if version_created else "unchanged"
+
+    def _config_fields(self, **config: Any) -> Dict[str, Any]:
+        """
+        Build the row fields for one share pack provisioned entity.
+
+        Repositories supporting create_many_from_config override this; config is one
+        create_from_config call's keyword arguments, minus the business key and created_by.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not build rows from share pack config")
+
+    async def create_many_from_config(
+        self,
+        rows: List[Dict[str, Any]],
+        created_by: str = "orchestrator",
+    ) -> List[Optional[ConfigWrite]]:
+        """
+        Create many entities from provisioning on one connection and in one transaction.
+
+        Each row takes the same keyword arguments as the repository's create_from_config
+        (minus created_by). Existing business keys are resolved for all names with a single
+        query, using the same precedence as create_from_config (active record first, then
+        soft-deleted). Each row runs in its own savepoint, so one bad row does not undo the others.
+
+        Args:
+            rows: Per-entity create_from_config keyword arguments
+            created_by: Who/what is creating these versions
+
+        Returns:
+            ConfigWrite per row (same order): the business key actually written, which is
+            the existing entity's when one was reused, its new record_id and whether the
+            row was created, updated or unchanged; None where that row failed
+        """
+        if not rows:
+            return []
+
+        names = [r[self.name_col] for r in rows]
+        results: List[Optional[ConfigWrite]] = []
+        async with self.pool.acquire() as conn:
+            existing = await conn.fetch(
+                f"""
+                SELECT {self.name_col}, {self.entity_id_col}, is_deleted FROM deltashare.{self.table}
+                WHERE {self.name_col} = ANY($1::text[]) AND is_current = true
+                ORDER BY share_pack_id NULLS LAST
+                """,
+                names,
+            )
+            active_ids: Dict[str, UUID] = {}
+            any_ids: Dict[str, UUID] = {}
+            for rec in existing:
+                if not rec["is_deleted"]:
+                    active_ids.setdefault(rec[self.name_col], rec[self.entity_id_col])
+                any_ids.setdefault(rec[self.name_col], rec[self.entity_id_col])
 
-                # Write to audit trail only if a new version was created
-                # Skip audit if data was unchanged (no version created)
-                if version_created:
+            async with conn.transaction():
+                for row in rows:
+                    row = dict(row)
+                    name = row[self.name_col]
+                    new_id = row.pop(self.entity_id_col)
+                    entity_id = active_ids.get(name) or any_ids.get(name) or new_id
                     try:
                         async with conn.transaction():
-                            await self._write_audit(
+                            record_id, action = await self._create_or_update_action_on(
                                 conn,
                                 entity_id,
-                                "CREATED" if is_new else "UPDATED",
+                                self._config_fields(**row),
                                 created_by,
-                                current_row if not is_new else None,
-                                fields,
+                                "Provisioned from share pack",
                             )
+                        results.append(ConfigWrite(entity_id, record_id, action))
                     except Exception as e:
-                        logger.opt(exception=True).warning(f"Audit trail write failed (SCD2 operation preserved): {e}")
-                else:
-                    logger.debug(f"Skipping audit trail for {self.table}.{entity_id}: no changes detected")
+                        logger.opt(exception=True).warning(f"Failed to create {self.table} record '{name}': {e}")
+                        results.append(None)
 
-                return record_id
+        return results
 
     async def soft_delete(
         self,
@@ -201,36 +338,148 @@ class BaseRepository:
         """
         async with self.pool.acquire() as conn:
             async with conn.transaction():
-                # Get current version before deletion
-                current = await get_current_version(conn, self.table, self.entity_id_col, entity_id)
+                return await self._soft_delete_on(conn, entity_id, deleted_by, deletion_reason, request_source)
 
-                record_id = await soft_delete_scd2(
-                    conn,
-                    self.table,
-                    self.entity_id_col,
-                    entity_id,
-                    deleted_by,
-                    deletion_reason,
-                    request_source=request_source,
+    async def soft_delete_many(
+        self,
+        items: List[Tuple[UUID, str]],
+        deleted_by: str,
+        request_source: Optional[str] = None,
+        conn: Optional[asyncpg.Connection] = None,
+    ) -> List[Union[Optional[UUID], Exception]]:
+        """
+        Soft delete many entities on one connection and in one transaction.
+
+        All entities are deleted with a few set-based statements and their audit entries
+        are written in one batch. If the batch fails, each entity is retried in its own
+        savepoint, so one bad entity is rolled back on its own and does not abort the
+        others (same outcome as calling soft_delete per entity).
+
+        Args:
+            items: (entity_id, deletion_reason) pairs
+            deleted_by: Who/what is deleting these entities
+            request_source: Origin of delete (share_pack, api, sync)
+            conn: Connection to run on, already inside the caller's transaction (lets one
+                transaction span several repositories); acquired from the pool if omitted
+
+        Returns:
+            Per item, in order: record_id of the deleted version, None if not found, or the
+            exception that entity failed with
+        """
+        if not items:
+            return []
+        if conn is not None:
+            return await self._soft_delete_many_on(conn, items, deleted_by, request_source)
+        async with self.pool.acquire() as conn:
+            async with conn.transaction():
+                return await self._soft_delete_many_on(conn, items, deleted_by, request_source)
+
+    async def _soft_delete_many_on(
+        self,
+        conn: asyncpg.Connection,
+        items: List[Tuple[UUID, str]],
+        deleted_by: str,
+        request_source: Optional[str] = None,
+    ) -> List[Union[Optional[UUID], Exception]]:
+        """
+        soft_delete_many on a caller-supplied connection.
+
+        Callers MUST already be inside a transaction on conn.
+        """
+        try:
+            async with conn.transaction():
+                current, record_ids = await soft_delete_scd2_many(
+                    conn, self.table, self.entity_id_col, items, deleted_by, request_source
+                )
+        except Exception as e:
+            logger.opt(exception=True).warning(
+                f"Bulk soft_delete on {self.table} failed, deleting {len(items)} entities one at a time: {e}"
+            )
+            return await self._soft_delete_each_on(conn, items, deleted_by, request_source)
+
+        if record_ids:
+            try:
+                async with conn.transaction():
+                    await self._write_audit_many(
+                        conn,
+                        "DELETED",
+                        deleted_by,
+                        [(entity_id, current[entity_id], {"is_deleted": True}) for entity_id in record_ids],
+                    )
+            except Exception as e:
+                logger.opt(exception=True).warning(
+                    f"Audit trail write failed for soft_delete_many (operation preserved): {e}"
                 )
 
-                if record_id:
-                    try:
-                        async with conn.transaction():
-                            await self._write_audit(
-                                conn,
-                                entity_id,
-                                "DELETED",
-                                deleted_by,
-                                current,
-                                {"is_deleted": True},
-                            )
-                    except Exception as e:
-                        logger.opt(exception=True).warning(
-                            f"Audit trail write failed for soft_delete (operation preserved): {e}"
-                        )
+        # An entity listed twice was deleted once; later entries report not found, as with soft_delete
+        return [record_ids.pop(entity_id, None) for entity_id, _ in items]
 
-                return record_id
+    async def _soft_delete_each_on(
+        self,
+        conn: asyncpg.Connection,
+        items: List[Tuple[UUID, str]],
+        deleted_by: str,
+        request_source: Optional[str] = None,
+    ) -> List[Union[Optional[UUID], Exception]]:
+        """
+        soft_delete per entity on a caller-supplied connection, one savepoint per entity.
+
+        Callers MUST already be inside a transaction on conn.
+        """
+        results: List[Union[Optional[UUID], Exception]] = []
+        for entity_id, deletion_reason in items:
+            try:
+                async with conn.transaction():
+                    results.append(
+                        await self._soft_delete_on(conn, entity_id, deleted_by, deletion_reason, request_source)
+                    )
+            except Exception as e:
+                results.append(e)
+        return results
+
+    async def _soft_delete_on(
+        self,
+        conn: asyncpg.Connection,
+        entity_id: UUID,
+        deleted_by: str,
+        deletion_reason: str,
+        request_source: Optional[str] = None,
+    ) -> Optional[UUID]:
+        """
+        soft_delete on a caller-supplied connection.
+
+        Callers MUST already be inside a transaction on conn.
+        """
+        # Get current version before deletion
+        current = await get_current_version(conn, self.table, self.entity_id_col, entity_id)
+
+        record_id = await soft_delete_scd2(
+            conn,
+            self.table,
+            self.entity_id_col,
+            entity_id,
+            deleted_by,
+            deletion_reason,
+            request_source=request_source,
+        )
+
+        if record_id:
+            try:
+                async with conn.transaction():
+                    await self._write_audit(
+                        conn,
+                        entity_id,
+                        "DELETED",
+                        deleted_by,
+                        current,
+                        {"is_deleted": True},
+                    )
+            except Exception as e:
+                logger.opt(exception=True).warning(
+                    f"Audit trail write failed for soft_delete (operation preserved): {e}"
+                )
+
+        return record_id
 
     async def restore(
         self,
@@ -302,8 +551,6 @@ class BaseRepository:
             old_values: Previous values (for updates/deletes)
             new_values: New values (for creates/updates)
         """
-        import json
-
         await conn.execute(
             """
             INSERT INTO deltashare.audit_trail
@@ -318,6 +565,37 @@ class BaseRepository:
             json.dumps(new_values, default=str) if new_values else None,
         )
 
+    async def _write_audit_many(
+        self,
+        conn: asyncpg.Connection,
+        action: str,
+        performed_by: str,
+        entries: List[Tuple[UUID, Optional[Dict[str, Any]], Optional[Dict[str, Any]]]],
+    ) -> None:
+        """
+        Write one audit trail entry per (entity_id, old_values, new_values) in a single batch.
+
+        Same savepoint requirement as _write_audit.
+        """
+        await conn.executemany(
+            """
+            INSERT INTO deltashare.audit_trail
+                (entity_type, entity_id, action, performed_by, old_values, new_values)
+            VALUES ($1, $2, $3, $4, $5::jsonb, $6::jsonb)
+            """,
+            [
+                (
+                    self.table,
+                    entity_id,
+                    action,
+                    performed_by,
+                    json.dumps(old_values, default=str) if old_values else None,
+                    json.dumps(new_values, default=str) if new_values else None,
+                )
+                for entity_id, old_values, new_values in entries
+            ],
+        )
+
     async def exists(self, entity_id: UUID, include_deleted: bool = False) -> bool:
         """
         Check if an entity exists.
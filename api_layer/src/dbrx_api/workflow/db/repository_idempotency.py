@@ -0,0 +1,86 @@
+"""
+Idempotency Log Repository
+
+Repository for the Databricks actions a share pack run has started or completed. Rows
+are journaled STARTED before an irreversible call and moved to OK (or FAILED) after it,
+and cleared when a new config is uploaded for the share pack.
+"""
+
+from typing import Dict
+from typing import List
+from typing import Optional
+from uuid import UUID
+
+import asyncpg
+
+
+class IdempotencyRepository:
+    """Idempotency log repository (one row per action, no SCD2)."""
+
+    def __init__(self, pool: asyncpg.Pool):
+        self.pool = pool
+
+    async def list_statuses(self, share_pack_id: UUID) -> Dict[str, str]:
+        """Return {action_key: status} for every action journaled for a share pack."""
+        async with self.pool.acquire() as conn:
+            rows = await conn.fetch(
+                """
+                SELECT action_key, status FROM deltashare.idempotency_log
+                WHERE share_pack_id = $1
+                """,
+                share_pack_id,
+            )
+        return {row["action_key"]: row["status"] for row in rows}
+
+    async def clear(self, share_pack_id: UUID) -> None:
+        """
+        Remove every action journaled for a share pack.
+
+        Called when a new config is uploaded under an existing share_pack_id, so the
+        new upload's run does not skip deletes that belonged to an earlier upload.
+        """
+        async with self.pool.acquire() as conn:
+            await conn.execute("DELETE FROM deltashare.idempotency_log WHERE share_pack_id = $1", share_pack_id)
+
+    async def record_status(
+        self,
+        share_pack_id: UUID,
+        action_keys: List[str],
+        status: str,
+        conn: Optional[asyncpg.Connection] = None,
+    ) -> None:
+        """
+        Set the status of action keys for a share pack (STARTED, OK or FAILED).
+
+        Keys already recorded as OK are left as-is, so a completed action is never
+        moved back to STARTED. Pass conn to write inside the caller's transaction.
+        """
+        if not action_keys:
+            return
+        query = """
+            INSERT INTO deltashare.idempotency_log (share_pack_id, action_key, status, completed_at)
+            VALUES ($1, $2, $3, NOW())
+            ON CONFLICT (share_pack_id, action_key) DO UPDATE
+            SET status = EXCLUDED.status, completed_at = EXCLUDED.completed_at
+            WHERE deltashare.idempotency_log.status <> 'OK'
+        """
+        args = [(share_pack_id, key, status) for key in action_keys]
+        if conn is not None:
+            await conn.executemany(query, args)
+            return
+        async with self.pool.acquire() as conn:
+            await conn.executemany(query, args)
+
+    async def record_completed(
+        self,
+        share_pack_id: UUID,
+        action_keys: List[str],
+        conn: Optional[asyncpg.Connection] = None,
+    ) -> None:
+        """
+        Record completed action keys for a share pack.
+
+        Pass conn to write inside the caller's transaction (e.g. together with the
+        soft-deletes for the same actions).
+        """
+        await self.record_status(share_pack_id, action_keys, "OK", conn=conn)
@@ -10,10 +10,10 @@ from typing import Dict
 from typing import List
 from typing import Optional
 from uuid import UUID
-from uuid import uuid4
 
 import asyncpg
 
+from dbrx_api.workflow.db.ids import uuid7
 from dbrx_api.workflow.db.repository_base import BaseRepository
 
 
@@ -47,11 +47,50 @@ def _normalize_json_data(data: Any) -> Any:
         return data
 
 
+def _share_pack_fields(
+    share_id: UUID,
+    share_pack_id: UUID,
+    pipeline_name: str,
+    databricks_pipeline_id: str,
+    asset_name: str,
+    source_table: str,
+    target_table: str,
+    scd_type: str = "2",
+    key_columns: str = "",
+    schedule_type: str = "CRON",
+    cron_expression: str = "",
+    timezone: str = "UTC",
+    serverless: bool = False,
+    tags: Optional[Dict[str, str]] = None,
+    notification_emails: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """Build the pipelines row fields for a share pack provisioned pipeline."""
+    return {
+        "share_id": share_id,
+        "share_pack_id": share_pack_id,
+        "pipeline_name": pipeline_name,
+        "databricks_pipeline_id": databricks_pipeline_id,
+        "asset_name": asset_name,
+        "source_table": source_table,
+        "target_table": target_table,
+        "scd_type": scd_type,
+        "key_columns": key_columns,
+        "schedule_type": schedule_type,
+        "cron_expression": cron_expression,
+        "cron_timezone": timezone,
+        "serverless": serverless,
+        "tags": json.dumps(_normalize_json_data(tags or {})),
+        "notification_list": json.dumps(_normalize_json_data(notification_emails or [])),
+        "is_deleted": False,
+        "request_source": "share_pack",
+    }
+
+
 class PipelineRepository(BaseRepository):
     """Pipeline repository with domain-specific queries."""
 
     def __init__(self, pool: asyncpg.Pool):
-        super().__init__(pool, "pipelines", "pipeline_id")
+        super().__init__(pool, "pipelines", "pipeline_id", name_column="pipeline_name")
 
     async def create_from_config(
         self,
@@ -88,28 +127,30 @@ class PipelineRepository(BaseRepository):
             if deleted:
                 pipeline_id = deleted[0]["pipeline_id"]
 
-        fields = {
-            "share_id": share_id,
-            "share_pack_id": share_pack_id,
-            "pipeline_name": pipeline_name,
-            "databricks_pipeline_id": databricks_pipeline_id,
-            "asset_name": asset_name,
-            "source_table": source_table,
-            "target_table": target_table,
-            "scd_type": scd_type,
-            "key_columns": key_columns,
-            "schedule_type": schedule_type,
-            "cron_expression": cron_expression,
-            "cron_timezone": timezone,
-            "serverless": serverless,
-            "tags": json.dumps(_normalize_json_data(tags or {})),
-            "notification_list": json.dumps(_normalize_json_data(notification_emails or [])),
-            "is_deleted": False,
-            "request_source": "share_pack",
-        }
+        fields = _share_pack_fields(
+            share_id=share_id,
+            share_pack_id=share_pack_id,
+            pipeline_name=pipeline_name,
+            databricks_pipeline_id=databricks_pipeline_id,
+            asset_name=asset_name,
+            source_table=source_table,
+            target_table=target_table,
+            scd_type=scd_type,
+            key_columns=key_columns,
+            schedule_type=schedule_type,
+            cron_expression=cron_expression,
+            timezone=timezone,
+            serverless=serverless,
+            tags=tags,
+            notification_emails=notification_emails,
+        )
 
         return await self.create_or_update(pipeline_id, fields, created_by, "Provisioned from share pack")
 
+    def _config_fields(self, **config: Any) -> Dict[str, Any]:
+        """Build the pipelines row fields for create_many_from_config."""
+        return _share_pack_fields(**config)
+
     async def upsert_from_config(
         self,
         share_id: UUID,
@@ -149,7 +190,7 @@ class PipelineRepository(BaseRepository):
                 # This prevents unique constraint violations when re-provisioning a deleted pipeline.
                 deleted_records = await self.list_by_pipeline_name(pipeline_name, include_deleted=True)
                 match = deleted_records[0] if deleted_records else None
-            pipeline_id = match["pipeline_id"] if match else uuid4()
+            pipeline_id = match["pipeline_id"] if match else uuid7()
             is_update = match is not None
         else:
             is_update = await self.exists(pipeline_id)
@@ -193,6 +234,34 @@ class PipelineRepository(BaseRepository):
             )
             return [dict(row) for row in rows]
 
+    async def list_by_pipeline_names(
+        self,
+        pipeline_names: List[str],
+        include_deleted: bool = False,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Batched list_by_pipeline_name: current pipeline records for many names in one query.
+
+        Returns a dict with an entry (possibly empty) for every requested name; each list
+        is ordered like list_by_pipeline_name.
+        """
+        by_name: Dict[str, List[Dict[str, Any]]] = {name: [] for name in pipeline_names}
+        if not by_name:
+            return by_name
+        deleted_filter = "" if include_deleted else "AND is_deleted = false"
+        async with self.pool.acquire() as conn:
+            rows = await conn.fetch(
+                f"""
+                SELECT * FROM deltashare.pipelines
+                WHERE pipeline_name = ANY($1::text[]) AND is_current = true {deleted_filter}
+                ORDER BY share_pack_id NULLS LAST
+                """,
+                list(by_name),
+            )
+        for row in rows:
+            by_name[row["pipeline_name"]].append(dict(row))
+        return by_name
+
     async def create_or_upsert_from_api(
         self,
         pipeline_name: str,
@@ -228,7 +297,7 @@ class PipelineRepository(BaseRepository):
             existing_cron = existing_list[0].get("cron_expression", "") or ""
             existing_tz = existing_list[0].get("cron_timezone", "UTC") or "UTC"
         else:
-            pipeline_id = uuid4()
+            pipeline_id = uuid7()
             change_reason = "Created via API"
             existing_share_pack_id = None
             existing_share_id = None
@@ -366,6 +435,40 @@ class PipelineRepository(BaseRepository):
             )
             return [dict(row) for row in rows]
 
+    async def list_by_share_names(
+        self,
+        share_names: List[str],
+        include_deleted: bool = False,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Batched list_by_share_name: pipelines for many share names in one query.
+
+        Matches against all historical share_ids of each name, like list_by_share_name.
+        Returns a dict with an entry (possibly empty) for every requested name; each list
+        is ordered by pipeline_name.
+        """
+        by_name: Dict[str, List[Dict[str, Any]]] = {name: [] for name in share_names}
+        if not by_name:
+            return by_name
+        deleted_filter = "" if include_deleted else "AND p.is_deleted = false"
+        async with self.pool.acquire() as conn:
+            rows = await conn.fetch(
+                f"""
+                SELECT s.share_name AS matched_share_name, p.* FROM deltashare.{self.table} p
+                JOIN (
+                    SELECT DISTINCT share_id, share_name FROM deltashare.shares
+                    WHERE share_name = ANY($1::text[])
+                ) s ON p.share_id = s.share_id
+                WHERE p.is_current = true {deleted_filter}
+                ORDER BY p.pipeline_name
+                """,
+                list(by_name),
+            )
+        for row in rows:
+            record = dict(row)
+            by_name[record.pop("matched_share_name")].append(record)
+        return by_name
+
     async def list_by_databricks_pipeline_id(
         self,
         databricks_pipeline_id: str,
@@ -4,15 +4,16 @@ Recipient Repository
 Repository for Delta Share recipient CRUD operations with SCD Type 2 tracking.
 """
 
+import json
 from typing import Any
 from typing import Dict
 from typing import List
 from typing import Optional
 from uuid import UUID
-from uuid import uuid4
 
 import asyncpg
 
+from dbrx_api.workflow.db.ids import uuid7
 from dbrx_api.workflow.db.repository_base import BaseRepository
 
 
@@ -46,11 +47,40 @@ def _normalize_json_data(data: Any) -> Any:
         return data
 
 
+def _share_pack_fields(
+    share_pack_id: UUID,
+    recipient_name: str,
+    databricks_recipient_id: str,
+    recipient_contact_email: str,
+    recipient_type: str,
+    recipient_databricks_org: Optional[str] = None,
+    ip_access_list: Optional[List[str]] = None,
+    token_expiry_days: int = 30,
+    token_rotation_enabled: bool = False,
+    description: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Build the recipients row fields for a share pack provisioned recipient."""
+    return {
+        "share_pack_id": share_pack_id,
+        "recipient_name": recipient_name,
+        "recipient_databricks_id": databricks_recipient_id,
+        "recipient_contact_email": recipient_contact_email,
+        "recipient_type": recipient_type,
+        "recipient_databricks_org": recipient_databricks_org,
+        "client_ip_addresses": json.dumps(_normalize_json_data(ip_access_list or [])),
+        "token_expiry_days": token_expiry_days,
+        "token_rotation": token_rotation_enabled,
+        "description": description or "",
+        "is_deleted": False,
+        "request_source": "share_pack",
+    }
+
+
 class RecipientRepository(BaseRepository):
     """Recipient repository with domain-specific queries."""
 
     def __init__(self, pool: asyncpg.Pool):
-        super().__init__(pool, "recipients", "recipient_id")
+        super().__init__(pool, "recipients", "recipient_id", name_column="recipient_name")
 
     async def create_from_config(
         self,
@@ -87,8 +117,6 @@ class RecipientRepository(BaseRepository):
         Returns:
             record_id (UUID) of created version
         """
-        import json
-
         # Check if recipient already exists (from previous share pack or API).
         # Reuse its recipient_id so the SCD2 layer properly expires the old version
         # instead of hitting a unique index violation on recipient_name.
@@ -103,23 +131,25 @@ class RecipientRepository(BaseRepository):
             if deleted:
                 recipient_id = deleted[0]["recipient_id"]
 
-        fields = {
-            "share_pack_id": share_pack_id,
-            "recipient_name": recipient_name,
-            "recipient_databricks_id": databricks_recipient_id,
-            "recipient_contact_email": recipient_contact_email,
-            "recipient_type": recipient_type,
-            "recipient_databricks_org": recipient_databricks_org,
-            "client_ip_addresses": json.dumps(_normalize_json_data(ip_access_list or [])),
-            "token_expiry_days": token_expiry_days,
-            "token_rotation": token_rotation_enabled,
-            "description": description or "",
-            "is_deleted": False,
-            "request_source": "share_pack",
-        }
+        fields = _share_pack_fields(
+            share_pack_id=share_pack_id,
+            recipient_name=recipient_name,
+            databricks_recipient_id=databricks_recipient_id,
+            recipient_contact_email=recipient_contact_email,
+            recipient_type=recipient_type,
+            recipient_databricks_org=recipient_databricks_org,
+            ip_access_list=ip_access_list,
+            token_expiry_days=token_expiry_days,
+            token_rotation_enabled=token_rotation_enabled,
+            description=description,
+        )
 
         return await self.create_or_update(recipient_id, fields, created_by, "Provisioned from share pack")
 
+    def _config_fields(self, **config: Any) -> Dict[str, Any]:
+        """Build the recipients row fields for create_many_from_config."""
+        return _share_pack_fields(**config)
+
     async def upsert_from_config(
         self,
         share_pack_id: UUID,
@@ -177,7 +207,7 @@ class RecipientRepository(BaseRepository):
                 # This prevents unique constraint violations when re-provisioning a deleted recipient.
                 deleted_records = await self.list_by_recipient_name(recipient_name, include_deleted=True)
                 match = deleted_records[0] if deleted_records else None
-            recipient_id = match["recipient_id"] if match else uuid4()
+            recipient_id = match["recipient_id"] if match else uuid7()
             is_update = match is not None
         else:
             is_update = await self.exists(recipient_id)
@@ -229,7 +259,7 @@ class RecipientRepository(BaseRepository):
             token_expiry = existing_list[0].get("token_expiry_days", 30) or 30
             token_rotation_val = existing_list[0].get("token_rotation", False)
         else:
-            recipient_id = uuid4()
+            recipient_id = uuid7()
             change_reason = "Created via API"
             token_expiry = 30
             token_rotation_val = False
@@ -304,3 +334,36 @@ class RecipientRepository(BaseRepository):
                 recipient_name,
             )
             return [dict(row) for row in rows]
+
+    async def list_by_recipient_names(
+        self,
+        recipient_names: List[str],
+        include_deleted: bool = False,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Batched list_by_recipient_name: current recipient records for many names in one query.
+
+        Args:
+            recipient_names: Recipient names
+            include_deleted: If True, include soft-deleted records (default: False)
+
+        Returns:
+            Dict with an entry (possibly empty) for every requested name; each list is
+            ordered like list_by_recipient_name
+        """
+        by_name: Dict[str, List[Dict[str, Any]]] = {name: [] for name in recipient_names}
+        if not by_name:
+            return by_name
+        deleted_filter = "" if include_deleted else "AND is_deleted = false"
+        async with self.pool.acquire() as conn:
+            rows = await conn.fetch(
+                f"""
+                SELECT * FROM deltashare.{self.table}
+                WHERE recipient_name = ANY($1::text[]) AND is_current = true {deleted_filter}
+                ORDER BY share_pack_id
+                """,
+                list(by_name),
+            )
+        for row in rows:
+            by_name[row["recipient_name"]].append(dict(row))
+        return by_name
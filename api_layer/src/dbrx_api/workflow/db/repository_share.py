@@ -10,10 +10,10 @@ from typing import Dict
 from typing import List
 from typing import Optional
 from uuid import UUID
-from uuid import uuid4
 
 import asyncpg
 
+from dbrx_api.workflow.db.ids import uuid7
 from dbrx_api.workflow.db.repository_base import BaseRepository
 
 
@@ -47,11 +47,40 @@ def _normalize_json_data(data: Any) -> Any:
         return data
 
 
+def _share_pack_fields(
+    share_pack_id: UUID,
+    share_name: str,
+    databricks_share_id: str,
+    description: str = "",
+    share_assets: Optional[List[str]] = None,
+    recipients_attached: Optional[List[str]] = None,
+    ext_catalog_name: Optional[str] = None,
+    ext_schema_name: Optional[str] = None,
+    prefix_assetname: Optional[str] = None,
+    share_tags: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """Build the shares row fields for a share pack provisioned share."""
+    return {
+        "share_pack_id": share_pack_id,
+        "share_name": share_name,
+        "databricks_share_id": databricks_share_id,
+        "description": description or "",
+        "share_assets": json.dumps(_normalize_json_data(share_assets or [])),
+        "recipients": json.dumps(_normalize_json_data(recipients_attached or [])),
+        "ext_catalog_name": ext_catalog_name or "",
+        "ext_schema_name": ext_schema_name or "",
+        "prefix_assetname": prefix_assetname or "",
+        "share_tags": json.dumps(_normalize_json_data(share_tags or [])),
+        "is_deleted": False,
+        "request_source": "share_pack",
+    }
+
+
 class ShareRepository(BaseRepository):
     """Share repository with domain-specific queries."""
 
     def __init__(self, pool: asyncpg.Pool):
-        super().__init__(pool, "shares", "share_id")
+        super().__init__(pool, "shares", "share_id", name_column="share_name")
 
     async def create_from_config(
         self,
@@ -84,22 +113,24 @@ class ShareRepository(BaseRepository):
             if deleted:
                 share_id = deleted[0]["share_id"]
 
-        fields = {
-            "share_pack_id": share_pack_id,
-            "share_name": share_name,
-            "databricks_share_id": databricks_share_id,
-            "description": description or "",
-            "share_assets": json.dumps(_normalize_json_data(share_assets or [])),
-            "recipients": json.dumps(_normalize_json_data(recipients_attached or [])),
-            "ext_catalog_name": ext_catalog_name or "",
-            "ext_schema_name": ext_schema_name or "",
-            "prefix_assetname": prefix_assetname or "",
-            "share_tags": json.dumps(_normalize_json_data(share_tags or [])),
-            "is_deleted": False,
-            "request_source": "share_pack",
-        }
+        fields = _share_pack_fields(
+            share_pack_id=share_pack_id,
+            share_name=share_name,
+            databricks_share_id=databricks_share_id,
+            description=description,
+            share_assets=share_assets,
+            recipients_attached=recipients_attached,
+            ext_catalog_name=ext_catalog_name,
+            ext_schema_name=ext_schema_name,
+            prefix_assetname=prefix_assetname,
+            share_tags=share_tags,
+        )
         return await self.create_or_update(share_id, fields, created_by, "Provisioned from share pack")
 
+    def _config_fields(self, **config: Any) -> Dict[str, Any]:
+        """Build the shares row fields for create_many_from_config."""
+        return _share_pack_fields(**config)
+
     async def upsert_from_config(
         self,
         share_pack_id: UUID,
@@ -124,8 +155,7 @@ class ShareRepository(BaseRepository):
         """
         if share_id is None:
             # First: try current share pack
-            existing_list = await self.list_by_share_pack(share_pack_id)
-            match = next((r for r in existing_list if r.get("share_name") == share_name), None)
+            match = await self.get_by_pack_and_name(share_pack_id, share_name)
             if not match:
                 # Fallback: search across ALL share packs by name.
                 # This handles cross-share-pack updates and avoids unique index violations
@@ -137,7 +167,7 @@ class ShareRepository(BaseRepository):
                 # This prevents unique constraint violations when re-provisioning a deleted share.
                 deleted_records = await self.list_by_share_name(share_name, include_deleted=True)
                 match = deleted_records[0] if deleted_records else None
-            share_id = match["share_id"] if match else uuid4()
+            share_id = match["share_id"] if match else uuid7()
             is_update = match is not None
         else:
             is_update = await self.exists(share_id)
@@ -176,6 +206,34 @@ class ShareRepository(BaseRepository):
             )
             return [dict(row) for row in rows]
 
+    async def list_by_share_names(
+        self,
+        share_names: List[str],
+        include_deleted: bool = False,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Batched list_by_share_name: current share records for many names in one query.
+
+        Returns a dict with an entry (possibly empty) for every requested name; each list
+        is ordered like list_by_share_name.
+        """
+        by_name: Dict[str, List[Dict[str, Any]]] = {name: [] for name in share_names}
+        if not by_name:
+            return by_name
+        deleted_filter = "" if include_deleted else "AND is_deleted = false"
+        async with self.pool.acquire() as conn:
+            rows = await conn.fetch(
+                f"""
+                SELECT * FROM deltashare.shares
+                WHERE share_name = ANY($1::text[]) AND is_current = true {deleted_filter}
+                ORDER BY share_pack_id NULLS LAST
+                """,
+                list(by_name),
+            )
+        for row in rows:
+            by_name[row["share_name"]].append(dict(row))
+        return by_name
+
     async def create_or_upsert_from_api(
         self,
         share_name: str,
@@ -202,7 +260,7 @@ class ShareRepository(BaseRepository):
             existing_prefix = existing_list[0].get("prefix_assetname", "") or ""
             existing_tags = existing_list[0].get("share_tags", "[]") or "[]"
         else:
-            share_id = uuid4()
+            share_id = uuid7()
             change_reason = "Created via API"
             existing_share_pack_id = None
             existing_ext_catalog = ""
@@ -242,6 +300,24 @@ class ShareRepository(BaseRepository):
             )
             return [dict(row) for row in rows]
 
+    async def get_by_pack_and_name(
+        self,
+        share_pack_id: UUID,
+        share_name: str,
+    ) -> Optional[Dict[str, Any]]:
+        """Get the current share with this name in a share pack, or None."""
+        async with self.pool.acquire() as conn:
+            row = await conn.fetchrow(
+                f"""
+                SELECT * FROM deltashare.{self.table}
+                WHERE share_pack_id = $1 AND share_name = $2 AND is_current = true AND is_deleted = false
+                LIMIT 1
+                """,
+                share_pack_id,
+                share_name,
+            )
+            return dict(row) if row else None
+
     async def list_all(
         self,
         include_deleted: bool = False,
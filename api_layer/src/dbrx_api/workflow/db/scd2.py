@@ -11,6 +11,7 @@ from typing import Dict
 from typing import List
 from typing import Optional
 from typing import Set
+from typing import Tuple
 from uuid import UUID
 
 import asyncpg
@@ -376,6 +377,105 @@ async def soft_delete_scd2(
     return record_id
 
 
+async def soft_delete_scd2_many(
+    conn: asyncpg.Connection,
+    table: str,
+    entity_id_column: str,
+    items: List[Tuple[UUID, str]],
+    deleted_by: str,
+    request_source: Optional[str] = None,
+) -> Tuple[Dict[UUID, Dict[str, Any]], Dict[UUID, UUID]]:
+    """
+    Soft delete many entities (SCD2 style) with three statements in total.
+
+    Same outcome as soft_delete_scd2 per entity: the current versions are locked and
+    expired, and each new is_deleted=true version is copied from its old row server-side.
+    An entity listed more than once is deleted with its first reason.
+
+    Args:
+        conn: Database connection (must be in a transaction)
+        table: Table name
+        entity_id_column: Business key column name
+        items: (entity_id, deletion_reason) pairs
+        deleted_by: Who/what is deleting these entities
+        request_source: Origin of delete request (share_pack, api, sync)
+
+    Returns:
+        (current rows before deletion, record_id of each deleted version), both keyed by
+        entity_id; entities not found (or already deleted) are absent from both
+
+    Raises:
+        Exception: If database operations fail
+    """
+    reasons: Dict[UUID, str] = {}
+    for entity_id, deletion_reason in items:
+        reasons.setdefault(entity_id, deletion_reason)
+
+    rows = await conn.fetch(
+        f"""
+        SELECT * FROM deltashare.{table}
+        WHERE {entity_id_column} = ANY($1::uuid[]) AND is_current = true AND is_deleted = false
+        FOR UPDATE
+        """,
+        list(reasons),
+    )
+    if not rows:
+        return {}, {}
+    current = {row[entity_id_column]: dict(row) for row in rows}
+
+    await conn.execute(
+        f"""
+        UPDATE deltashare.{table}
+        SET effective_to = NOW(), is_current = false
+        WHERE record_id = ANY($1::uuid[])
+        """,
+        [row["record_id"] for row in rows],
+    )
+
+    # Copy every business column from the expired row; override the delete flag and source
+    skipped = {
+        "record_id",
+        "version",
+        "created_by",
+        "change_reason",
+        "effective_from",
+        "effective_to",
+        "is_current",
+        "is_deleted",
+        "request_source",
+        entity_id_column,
+    }
+    copied = [column for column in rows[0].keys() if column not in skipped]
+    columns = [entity_id_column] + copied + ["is_deleted"]
+    values = [f"o.{entity_id_column}"] + [f"o.{column}" for column in copied] + ["true"]
+    args: List[Any] = [
+        [row["record_id"] for row in rows],
+        [reasons[row[entity_id_column]] for row in rows],
+        deleted_by,
+    ]
+    if "request_source" in rows[0].keys():
+        columns.append("request_source")
+        values.append("COALESCE($4::text, o.request_source)")
+        args.append(request_source)
+
+    inserted = await conn.fetch(
+        f"""
+        INSERT INTO deltashare.{table}
+            ({', '.join(columns)}, version, created_by, change_reason, effective_from, effective_to, is_current)
+        SELECT {', '.join(values)}, o.version + 1, $3, v.reason, NOW(), '9999-12-31'::timestamp, true
+        FROM deltashare.{table} o
+        JOIN unnest($1::uuid[], $2::text[]) AS v(record_id, reason) ON o.record_id = v.record_id
+        RETURNING {entity_id_column}, record_id
+        """,
+        *args,
+    )
+    record_ids = {row[entity_id_column]: row["record_id"] for row in inserted}
+
+    logger.info(f"Soft deleted {len(record_ids)} of {len(reasons)} entities from {table}")
+
+    return current, record_ids
+
+
 async def get_point_in_time_version(
     conn: asyncpg.Connection,
     table: str,
@@ -5,9 +5,9 @@
 -- This schema implements SCD Type 2 (Slowly Changing Dimension Type 2) pattern
 -- for mutable entities to preserve full historical changes.
 --
--- Tables: 16 total
+-- Tables: 17 total
 --   - 11 SCD Type 2 tables (mutable entities with version history)
---   - 5 Append-only tables (immutable event logs)
+--   - 6 Append-only tables (immutable event logs)
 --
 -- Database: PostgreSQL 14+
 -- Schema: deltashare
@@ -487,6 +487,17 @@ CREATE TABLE IF NOT EXISTS deltashare.audit_trail (
 CREATE INDEX IF NOT EXISTS idx_audit_entity ON deltashare.audit_trail(entity_type, entity_id);
 CREATE INDEX IF NOT EXISTS idx_audit_time ON deltashare.audit_trail(timestamp DESC);
 
+-- ────────────────────────────────────────────────────────────────────────────
+-- 17. IDEMPOTENCY LOG (Databricks actions journaled per share pack upload; cleared on re-upload)
+-- ────────────────────────────────────────────────────────────────────────────
+CREATE TABLE IF NOT EXISTS deltashare.idempotency_log (
+    share_pack_id           UUID NOT NULL,
+    action_key              VARCHAR(500) NOT NULL,            -- del_share:{name}, del_recipient:{name}
+    status                  VARCHAR(20) NOT NULL DEFAULT 'OK', -- STARTED (written before the call), OK, FAILED
+    completed_at            TIMESTAMPTZ NOT NULL DEFAULT NOW(), -- time of the last status change
+    PRIMARY KEY (share_pack_id, action_key)
+);
+
 -- ════════════════════════════════════════════════════════════════════════════
 -- END OF SCHEMA
 -- ════════════════════════════════════════════════════════════════════════════
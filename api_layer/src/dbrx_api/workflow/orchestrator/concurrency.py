@@ -0,0 +1,282 @@
+"""
+Bounded Fan-out Helpers
+
+Runs blocking Databricks SDK work on a dedicated thread pool with a concurrency cap and
+fail-fast semantics: the first failure cancels work that has not started yet,
+while calls already in flight are allowed to finish so any rollback entries
+they record are not lost.
+"""
+
+import asyncio
+import contextvars
+import functools
+import os
+import random
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from typing import Awaitable
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import TypeVar
+from typing import Union
+
+from loguru import logger
+
+from dbrx_api.workflow.orchestrator.ratelimit import databricks_item_limiter
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Default cap on concurrent Databricks calls issued by one provisioning step
+DEFAULT_FANOUT_CONCURRENCY = int(os.getenv("PROVISION_CONCURRENCY", "8"))
+
+# Cap for pipeline creation, which mostly waits on Databricks rather than issuing requests
+PIPELINE_FANOUT_CONCURRENCY = int(os.getenv("PIPELINE_PROVISION_CONCURRENCY", "16"))
+
+# Worker threads for blocking Databricks SDK calls, shared by all provisioning runs
+SDK_EXECUTOR_WORKERS = max(16, 2 * max(DEFAULT_FANOUT_CONCURRENCY, PIPELINE_FANOUT_CONCURRENCY))
+
+# Retries for throttled Databricks calls: attempts in total, and backoff base/cap in seconds
+RETRY_ATTEMPTS = int(os.getenv("DATABRICKS_RETRY_ATTEMPTS", "4"))
+RETRY_BASE_SECONDS = 1.0
+RETRY_CAP_SECONDS = 30.0
+
+# Error text for requests Databricks rejected without processing them, so they are safe to resend
+_THROTTLED_RE = re.compile(
+    r"\b429\b|too many requests|rate limit|request_limit_exceeded|temporarily[ _]unavailable", re.IGNORECASE
+)
+_RETRY_AFTER_RE = re.compile(r"retry[- _]after\D{0,3}(\d+(?:\.\d+)?)", re.IGNORECASE)
+
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Return the SDK thread pool, creating it on first use."""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=SDK_EXECUTOR_WORKERS, thread_name_prefix="dbrx-sdk")
+    return _executor
+
+
+def shutdown_executor() -> None:
+    """Shut down the SDK thread pool; queued calls are cancelled, running ones finish."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+def _retry_delay(error: str, attempt: int) -> float:
+    """Seconds to wait before retry `attempt`: Retry-After if the error carries one, else jittered backoff."""
+    match = _RETRY_AFTER_RE.search(error)
+    if match:
+        return min(RETRY_CAP_SECONDS, float(match.group(1)))
+    return min(RETRY_CAP_SECONDS, RETRY_BASE_SECONDS * 2 ** (attempt - 1)) + random.uniform(0, 0.25)
+
+
+def call_with_retry(fn: Callable[..., R], *args: Any, **kwargs: Any) -> R:
+    """
+    Call a blocking Databricks helper, retrying when the request was throttled.
+
+    The helpers report most failures as a returned error string rather than raising,
+    so both raised exceptions and returned strings are checked. Only throttling errors
+    (429 / temporarily unavailable) are retried; anything else is returned or raised
+    as-is. Meant for SDK worker threads: the backoff sleep blocks only the calling thread.
+    """
+    attempt = 1
+    while True:
+        try:
+            result = fn(*args, **kwargs)
+        except Exception as e:
+            if attempt == RETRY_ATTEMPTS or not _THROTTLED_RE.search(str(e)):
+                raise
+            error = str(e)
+        else:
+            if attempt == RETRY_ATTEMPTS or not (isinstance(result, str) and _THROTTLED_RE.search(result)):
+                return result
+            error = result
+        delay = _retry_delay(error, attempt)
+        logger.warning(
+            "Databricks call {} throttled (attempt {}/{}), retrying in {:.1f}s: {}",
+            getattr(fn, "__name__", fn),
+            attempt,
+            RETRY_ATTEMPTS,
+            delay,
+            error[:200],
+        )
+        time.sleep(delay)
+        attempt += 1
+
+
+async def run_sync(fn: Callable[..., R], *args: Any, **kwargs: Any) -> R:
+    """
+    Run a blocking call on the SDK thread pool so it does not stall the event loop.
+
+    Like asyncio.to_thread (context variables such as loguru's contextualize() are
+    carried over), but on a dedicated pool so Databricks calls cannot exhaust the
+    loop's default executor used by other libraries. Each call takes one permit from the
+    shared Databricks item limiter first, however many SDK requests fn makes.
+    """
+    await databricks_item_limiter.acquire()
+    return await _submit(fn, *args, **kwargs)
+
+
+async def _submit(fn: Callable[..., R], *args: Any, **kwargs: Any) -> R:
+    """Hand fn to the SDK thread pool and await its result."""
+    call = functools.partial(contextvars.copy_context().run, fn, *args, **kwargs)
+    return await asyncio.get_running_loop().run_in_executor(_get_executor(), call)
+
+
+async def _run_in_thread(sem: asyncio.Semaphore, failed: asyncio.Event, fn: Callable[..., R], *args: Any) -> R:
+    """
+    Run fn(*args) in a worker thread once a rate-limit permit and a semaphore slot are free.
+
+    failed is shared by the sibling calls: it is set before a failing call gives up its
+    slot, so the waiter woken by that slot does not start its call before being cancelled.
+    """
+    # One permit per item (not per SDK request it makes). Wait for it before taking a slot,
+    # so a throttled item does not hold a slot while idle
+    await databricks_item_limiter.acquire()
+    async with sem:
+        if failed.is_set():
+            raise asyncio.CancelledError()
+        fut = asyncio.ensure_future(_submit(fn, *args))
+        try:
+            return await asyncio.shield(fut)
+        except asyncio.CancelledError:
+            # A sibling failed: let the in-flight call finish so its side effects are recorded
+            await asyncio.wait([fut])
+            raise
+        except Exception:
+            failed.set()
+            raise
+
+
+async def run_bounded(
+    fn: Callable[[T], R],
+    items: Iterable[T],
+    limit: int = DEFAULT_FANOUT_CONCURRENCY,
+) -> List[R]:
+    """
+    Run a blocking function over items concurrently, at most `limit` at a time.
+
+    Uses asyncio.TaskGroup so the first raised exception cancels all pending
+    peers. The original exception (not the ExceptionGroup) is re-raised so
+    callers and status messages see the real error.
+
+    Args:
+        fn: Blocking callable taking one item
+        items: Items to process
+        limit: Maximum concurrent calls
+
+    Returns:
+        Results in the same order as items
+
+    Raises:
+        Exception: The first failure raised by fn
+    """
+    sem = asyncio.Semaphore(max(1, limit))
+    failed = asyncio.Event()
+    try:
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(_run_in_thread(sem, failed, fn, item)) for item in items]
+    except* Exception as eg:
+        raise eg.exceptions[0]
+    return [t.result() for t in tasks]
+
+
+async def gather_bounded(
+    coro_fn: Callable[[T], Awaitable[R]],
+    items: Iterable[T],
+    limit: int = DEFAULT_FANOUT_CONCURRENCY,
+) -> List[Union[R, BaseException]]:
+    """
+    Await coro_fn(item) for every item concurrently, at most `limit` at a time.
+
+    For per-entity work that mixes DB awaits with run_sync'd Databricks calls. Like
+    asyncio.gather(return_exceptions=True): every item runs to completion even when
+    another fails, and each failure is returned in place of its result, so callers can
+    keep the side effects of the items that succeeded before re-raising.
+
+    Args:
+        coro_fn: Coroutine function taking one item
+        items: Items to process
+        limit: Maximum concurrent items
+
+    Returns:
+        Results (or exceptions) in the same order as items
+    """
+    sem = asyncio.Semaphore(max(1, limit))
+
+    async def _one(item: T) -> R:
+        async with sem:
+            return await coro_fn(item)
+
+    return await asyncio.gather(*(_one(item) for item in items), return_exceptions=True)
+
+
+async def provision_entities(
+    provision_fn: Callable[[T, Dict[str, List]], None],
+    items: Iterable[T],
+    outcome_keys: Iterable[str],
+    merge: Callable[[Dict[str, List]], None],
+    limit: int = DEFAULT_FANOUT_CONCURRENCY,
+) -> None:
+    """
+    Provision independent entities concurrently, each recording into its own outcome.
+
+    Every item gets an outcome dict with an empty list per key (rollback entries, DB
+    entries, ...), so workers never share mutable state. Once all workers are done, the
+    outcomes are handed to merge in item order, also when one failed, so entities that
+    finished still get their rollback entries recorded.
+
+    Args:
+        provision_fn: Blocking callable taking (item, outcome)
+        items: Entity configs to provision
+        outcome_keys: Lists each outcome holds
+        merge: Folds one outcome into the caller's accumulators
+        limit: Maximum concurrent calls
+
+    Raises:
+        Exception: The first failure raised by provision_fn
+    """
+    keys = tuple(outcome_keys)
+    jobs = [(item, {key: [] for key in keys}) for item in items]
+    try:
+        await run_bounded(lambda job: provision_fn(*job), jobs, limit)
+    finally:
+        for _, outcome in jobs:
+            merge(outcome)
+
+
+async def rollback_by_resource(
+    rollback_fn: Callable[[List[Any], str], None],
+    rollback_list: List[Any],
+    workspace_url: str,
+    key: Callable[[Any], Any],
+    limit: int = DEFAULT_FANOUT_CONCURRENCY,
+) -> None:
+    """
+    Run a reverse-order rollback function once per resource, resources in parallel.
+
+    Entries are grouped by key (the resource name) so every entry for one resource is
+    still undone in reverse order by a single call, while different resources are
+    rolled back concurrently. rollback_fn is one of the _rollback_* helpers, which log
+    and swallow per-entry failures.
+
+    Args:
+        rollback_fn: Blocking rollback helper taking (entries, workspace_url)
+        rollback_list: Rollback entries in the order they were recorded
+        workspace_url: Databricks workspace URL
+        key: Returns the resource an entry belongs to
+        limit: Maximum resources rolled back at once
+    """
+    groups: Dict[Any, List[Any]] = {}
+    for item in rollback_list:
+        groups.setdefault(key(item), []).append(item)
+    await run_bounded(lambda entries: rollback_fn(entries, workspace_url), list(groups.values()), limit)
@@ -0,0 +1,69 @@
+"""
+Share Pack Config Index
+
+Single pre-pass over a validated share pack config that builds the lookup
+tables the provisioning steps need, so later steps index into them instead
+of re-walking the raw config.
+"""
+
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Set
+
+
+@dataclass(slots=True)
+class ConfigIndex:
+    """Lookup tables built once from a share pack config."""
+
+    metadata: Dict[str, Any]
+    recipient_configs: List[Dict[str, Any]]
+    share_configs: List[Dict[str, Any]]
+    recipient_names: Set[str] = field(default_factory=set)
+    referenced_recipients: Set[str] = field(default_factory=set)
+
+
+def _dedupe_share_lists(share_config: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a copy of share_config with order-preserving de-duplicated asset/recipient lists."""
+    deduped = dict(share_config)
+    if isinstance(share_config.get("share_assets"), list):
+        deduped["share_assets"] = list(dict.fromkeys(str(a).strip() for a in share_config["share_assets"]))
+    for key in ("recipients", "recipients_to_add", "recipients_to_remove"):
+        if isinstance(share_config.get(key), list):
+            deduped[key] = list(dict.fromkeys(share_config[key]))
+    return deduped
+
+
+def index_config(config: Dict[str, Any]) -> ConfigIndex:
+    """
+    Build a ConfigIndex from a share pack config.
+
+    Expects a config that already passed validate_sharepack_config. Duplicate
+    share assets and recipient names within a share are dropped (first
+    occurrence wins), and share_configs holds the de-duplicated share dicts so
+    downstream steps do not issue redundant Databricks calls.
+
+    Args:
+        config: Full sharepack configuration dictionary
+
+    Returns:
+        ConfigIndex with the de-duplicated share configs and recipient name sets
+    """
+    recipient_configs = config.get("recipient") or []
+    idx = ConfigIndex(
+        metadata=config.get("metadata") or {},
+        recipient_configs=recipient_configs,
+        share_configs=[],
+    )
+
+    for recip in recipient_configs:
+        idx.recipient_names.add(str(recip["name"]).strip())
+
+    for share_config in config.get("share") or []:
+        share_config = _dedupe_share_lists(share_config)
+        idx.share_configs.append(share_config)
+        idx.referenced_recipients.update(share_config.get("recipients") or [])
+
+    return idx
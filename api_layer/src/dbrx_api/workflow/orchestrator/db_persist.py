@@ -6,14 +6,19 @@ happen on the happy path. If any ensure_* step fails, Databricks is
 rolled back and no DB writes are attempted.
 """
 
+import asyncio
 import json
 from typing import Any
 from typing import Dict
 from typing import List
+from typing import Optional
+from typing import Tuple
 from uuid import UUID
 
 from loguru import logger
 
+from dbrx_api.workflow.db.ids import uuid7_batch
+
 
 async def persist_recipients_to_db(
     db_entries: List[Dict[str, Any]],
@@ -21,14 +26,23 @@ async def persist_recipients_to_db(
     configurator: str,
     recipient_repo: Any,
 ) -> None:
-    """Persist recipient db_entries to the database after all Databricks ops succeed."""
+    """
+    Persist recipient db_entries to the database after all Databricks ops succeed.
+
+    Updated recipients are upserted one by one; newly created ones are written together
+    with recipient_repo.create_many_from_config (one connection, one transaction).
+    """
+    # (entry, create_from_config kwargs) for new recipients
+    pending_creates: List[Tuple[Dict[str, Any], Dict[str, Any]]] = []
+
     for entry in db_entries:
         action = entry["action"]
         recipient_name = entry["recipient_name"]
         recipient_id = entry.get("recipient_id")
 
-        # If recipient_id not in entry, look it up by name
-        if not recipient_id:
+        # If recipient_id not in entry, look it up by name (new recipients are
+        # resolved by name for the whole batch in create_many_from_config)
+        if not recipient_id and action != "created":
             try:
                 existing = await recipient_repo.list_by_recipient_name(recipient_name)
                 if existing:
@@ -69,20 +83,26 @@ async def persist_recipients_to_db(
                     entry["token_expiry_days"] = current_before["token_expiry_days"]
 
             if action == "created":
-                await recipient_repo.create_from_config(
-                    recipient_id=recipient_id,
-                    share_pack_id=share_pack_id,
-                    recipient_name=recipient_name,
-                    databricks_recipient_id=entry["databricks_recipient_id"],
-                    recipient_contact_email=configurator,
-                    recipient_type=entry["recipient_type"],
-                    recipient_databricks_org=entry.get("recipient_databricks_org"),
-                    ip_access_list=entry.get("ip_access_list", []),
-                    token_expiry_days=entry.get("token_expiry_days", 0),
-                    token_rotation_enabled=entry.get("token_rotation_enabled", False),
-                    description=entry.get("description", ""),
-                    created_by="orchestrator",
+                # New recipients are written together after the loop in one transaction
+                pending_creates.append(
+                    (
+                        entry,
+                        {
+                            "recipient_id": recipient_id,
+                            "share_pack_id": share_pack_id,
+                            "recipient_name": recipient_name,
+                            "databricks_recipient_id": entry["databricks_recipient_id"],
+                            "recipient_contact_email": configurator,
+                            "recipient_type": entry["recipient_type"],
+                            "recipient_databricks_org": entry.get("recipient_databricks_org"),
+                            "ip_access_list": entry.get("ip_access_list", []),
+                            "token_expiry_days": entry.get("token_expiry_days", 0),
+                            "token_rotation_enabled": entry.get("token_rotation_enabled", False),
+                            "description": entry.get("description", ""),
+                        },
+                    )
                 )
+                continue
             else:
                 await recipient_repo.upsert_from_config(
                     share_pack_id=share_pack_id,
@@ -127,6 +147,36 @@ async def persist_recipients_to_db(
                 f"Failed to persist recipient '{recipient_name}' ({action}) to DB: {db_err}"
             )
 
+    if not pending_creates:
+        return
+
+    # ids for recipients without an existing record, generated in one batch
+    new_ids = iter(uuid7_batch(sum(1 for _, kwargs in pending_creates if not kwargs["recipient_id"])))
+    for _, kwargs in pending_creates:
+        if not kwargs["recipient_id"]:
+            kwargs["recipient_id"] = next(new_ids)
+
+    try:
+        results = await recipient_repo.create_many_from_config(
+            [kwargs for _, kwargs in pending_creates],
+            created_by="orchestrator",
+        )
+    except Exception as db_err:
+        logger.opt(exception=True).warning(
+            f"Failed to persist {len(pending_creates)} new recipient(s) (created) to DB: {db_err}"
+        )
+        return
+
+    for (entry, _), result in zip(pending_creates, results):
+        recipient_name = entry["recipient_name"]
+        if result is None:
+            logger.warning(f"Failed to persist recipient '{recipient_name}' (created) to DB")
+            continue
+        # The repository may have reused an existing or soft-deleted recipient's id
+        entry["recipient_id"] = result.entity_id
+        entry["action"] = result.action
+        logger.info(f"Persisted recipient '{recipient_name}' to DB ({entry['action']})")
+
 
 async def persist_shares_to_db(
     db_entries: List[Dict[str, Any]],
@@ -136,18 +186,24 @@ async def persist_shares_to_db(
     """
     Persist share db_entries to the database after all Databricks ops succeed.
 
+    Updated shares are upserted one by one; newly created ones are written together
+    with share_repo.create_many_from_config (one connection, one transaction).
+
     Returns:
         Mapping of share_name -> share_id for pipeline DB writes.
     """
     share_name_to_id: Dict[str, UUID] = {}
+    # (entry, create_from_config kwargs) for new shares
+    pending_creates: List[Tuple[Dict[str, Any], Dict[str, Any]]] = []
 
     for entry in db_entries:
         action = entry["action"]
         share_name = entry["share_name"]
         share_id = entry.get("share_id")
 
-        # If share_id not in entry, look it up by name
-        if not share_id:
+        # If share_id not in entry, look it up by name (new shares are resolved
+        # by name for the whole batch in create_many_from_config)
+        if not share_id and action != "created":
             try:
                 existing = await share_repo.list_by_share_name(share_name)
                 if existing:
@@ -188,8 +244,10 @@ async def persist_shares_to_db(
                     # so no SCD2 version is triggered for a cosmetic difference.
                     if stored_dbrx_id != new_dbrx_id:
                         logger.debug(
-                            f"Share '{share_name}': preserving databricks_share_id case from DB "
-                            f"('{new_dbrx_id}' → '{stored_dbrx_id}')"
+                            "Share '{}': preserving databricks_share_id case from DB ('{}' → '{}')",
+                            share_name,
+                            new_dbrx_id,
+                            stored_dbrx_id,
                         )
                     entry["databricks_share_id"] = stored_dbrx_id
 
@@ -213,21 +271,26 @@ async def persist_shares_to_db(
                             entry["share_tags"] = _raw_tags
 
             if action == "created":
-                returned_id = await share_repo.create_from_config(
-                    share_id=share_id,
-                    share_pack_id=share_pack_id,
-                    share_name=share_name,
-                    databricks_share_id=entry["databricks_share_id"],
-                    description=entry.get("description", ""),
-                    storage_root=entry.get("storage_root", ""),
-                    share_assets=entry.get("share_assets", []),
-                    recipients_attached=entry.get("recipients_attached", []),
-                    ext_catalog_name=entry.get("ext_catalog_name", ""),
-                    ext_schema_name=entry.get("ext_schema_name", ""),
-                    prefix_assetname=entry.get("prefix_assetname", ""),
-                    share_tags=entry.get("share_tags", []),
-                    created_by="orchestrator",
+                # New shares are written together after the loop in one transaction
+                pending_creates.append(
+                    (
+                        entry,
+                        {
+                            "share_id": share_id,
+                            "share_pack_id": share_pack_id,
+                            "share_name": share_name,
+                            "databricks_share_id": entry["databricks_share_id"],
+                            "description": entry.get("description", ""),
+                            "share_assets": entry.get("share_assets", []),
+                            "recipients_attached": entry.get("recipients_attached", []),
+                            "ext_catalog_name": entry.get("ext_catalog_name", ""),
+                            "ext_schema_name": entry.get("ext_schema_name", ""),
+                            "prefix_assetname": entry.get("prefix_assetname", ""),
+                            "share_tags": entry.get("share_tags", []),
+                        },
+                    )
                 )
+                continue
             else:
                 returned_id = await share_repo.upsert_from_config(
                     share_pack_id=share_pack_id,
@@ -251,7 +314,7 @@ async def persist_shares_to_db(
                     existing = await share_repo.list_by_share_name(share_name)
                     if existing:
                         share_id = existing[0]["share_id"]
-                        logger.debug(f"Looked up permanent share_id for '{share_name}': {share_id}")
+                        logger.debug("Looked up permanent share_id for '{}': {}", share_name, share_id)
                 except Exception:
                     pass
 
@@ -281,9 +344,77 @@ async def persist_shares_to_db(
         except Exception as db_err:
             logger.opt(exception=True).warning(f"Failed to persist share '{share_name}' ({action}) to DB: {db_err}")
 
+    if not pending_creates:
+        return share_name_to_id
+
+    # ids for shares without an existing record, generated in one batch
+    new_ids = iter(uuid7_batch(sum(1 for _, kwargs in pending_creates if not kwargs["share_id"])))
+    for _, kwargs in pending_creates:
+        if not kwargs["share_id"]:
+            kwargs["share_id"] = next(new_ids)
+
+    try:
+        results = await share_repo.create_many_from_config(
+            [kwargs for _, kwargs in pending_creates],
+            created_by="orchestrator",
+        )
+    except Exception as db_err:
+        logger.opt(exception=True).warning(
+            f"Failed to persist {len(pending_creates)} new share(s) (created) to DB: {db_err}"
+        )
+        return share_name_to_id
+
+    for (entry, _), result in zip(pending_creates, results):
+        share_name = entry["share_name"]
+        if result is None:
+            logger.warning(f"Failed to persist share '{share_name}' (created) to DB")
+            continue
+
+        # CRITICAL: Use the share_id actually written (the repository may have reused an
+        # existing or soft-deleted share's), NOT the id generated above or the record_id
+        share_name_to_id[share_name] = result.entity_id
+        entry["share_id"] = result.entity_id
+        entry["action"] = result.action
+        logger.info(f"Persisted share '{share_name}' to DB ({entry['action']})")
+
     return share_name_to_id
 
 
+async def persist_recipients_and_shares_to_db(
+    recipient_db_entries: List[Dict[str, Any]],
+    share_db_entries: List[Dict[str, Any]],
+    share_pack_id: UUID,
+    configurator: str,
+    recipient_repo: Any,
+    share_repo: Any,
+) -> Dict[str, UUID]:
+    """
+    Persist recipient and share db_entries concurrently.
+
+    The two writes touch different tables and do not depend on each other, so their
+    database latency overlaps instead of adding up. Pipelines are not included: they
+    need the share_name -> share_id mapping this returns.
+
+    Returns:
+        Mapping of share_name -> share_id for pipeline DB writes.
+
+    Raises:
+        Exception: The first failure from either write
+    """
+    shares_write = None
+    try:
+        async with asyncio.TaskGroup() as tg:
+            if recipient_db_entries:
+                tg.create_task(
+                    persist_recipients_to_db(recipient_db_entries, share_pack_id, configurator, recipient_repo)
+                )
+            if share_db_entries:
+                shares_write = tg.create_task(persist_shares_to_db(share_db_entries, share_pack_id, share_repo))
+    except* Exception as eg:
+        raise eg.exceptions[0]
+    return shares_write.result() if shares_write is not None else {}
+
+
 async def persist_pipelines_to_db(
     db_entries: List[Dict[str, Any]],
     share_pack_id: UUID,
@@ -291,7 +422,19 @@ async def persist_pipelines_to_db(
     share_repo: Any,
     pipeline_repo: Any,
 ) -> None:
-    """Persist pipeline db_entries to the database after all Databricks ops succeed."""
+    """
+    Persist pipeline db_entries to the database after all Databricks ops succeed.
+
+    Updated pipelines are upserted one by one; newly created ones are written together
+    with pipeline_repo.create_many_from_config (one connection, one transaction).
+    """
+    # Fallback share lookup for this share pack, loaded at most once for all entries
+    pack_share_ids: Optional[Dict[str, UUID]] = None
+    # Cross-pack fallback results (None = not found), so each share name is queried once
+    other_share_ids: Dict[str, Optional[UUID]] = {}
+    # (entry, create_from_config kwargs) for new pipelines
+    pending_creates: List[Tuple[Dict[str, Any], Dict[str, Any]]] = []
+
     for entry in db_entries:
         action = entry["action"]
         pipeline_name = entry["pipeline_name"]
@@ -313,11 +456,13 @@ async def persist_pipelines_to_db(
             # Fallback: Query database for current share
             # First try: shares in this share pack
             try:
-                share_pack_shares = await share_repo.list_by_share_pack(share_pack_id)
-                match = next((s for s in share_pack_shares if s["share_name"] == share_name), None)
-                if match:
-                    share_id = match["share_id"]
-                else:
+                if pack_share_ids is None:
+                    share_pack_shares = await share_repo.list_by_share_pack(share_pack_id)
+                    pack_share_ids = {s["share_name"]: s["share_id"] for s in share_pack_shares}
+                share_id = pack_share_ids.get(share_name)
+                if not share_id and share_name in other_share_ids:
+                    share_id = other_share_ids[share_name]
+                elif not share_id:
                     # Second try: shares across all share packs
                     all_share_records = await share_repo.list_by_share_name(share_name)
                     # Prefer share from same share_pack if multiple exist
@@ -328,6 +473,7 @@ async def persist_pipelines_to_db(
                     # If no match in same share_pack, use first current share
                     if not share_id and all_share_records:
                         share_id = all_share_records[0]["share_id"]
+                    other_share_ids[share_name] = share_id
             except Exception:
                 pass
 
@@ -403,25 +549,31 @@ async def persist_pipelines_to_db(
                     entry["key_columns"] = current_before["key_columns"]
 
             if action == "created":
-                await pipeline_repo.create_from_config(
-                    pipeline_id=pipeline_id,
-                    share_id=share_id,
-                    share_pack_id=share_pack_id,
-                    pipeline_name=pipeline_name,
-                    databricks_pipeline_id=entry["databricks_pipeline_id"],
-                    asset_name=entry.get("asset_name", ""),
-                    source_table=entry.get("source_table", ""),
-                    target_table=entry.get("target_table", ""),
-                    scd_type=entry.get("scd_type", "2"),
-                    key_columns=entry.get("key_columns", ""),
-                    schedule_type=entry.get("schedule_type", "CRON"),
-                    cron_expression=entry.get("cron_expression", ""),
-                    timezone=entry.get("timezone", "UTC"),
-                    serverless=entry.get("serverless", False),
-                    tags=entry.get("tags", {}),
-                    notification_emails=entry.get("notification_emails", []),
-                    created_by="orchestrator",
+                # New pipelines are written together after the loop in one transaction
+                pending_creates.append(
+                    (
+                        entry,
+                        {
+                            "pipeline_id": pipeline_id,
+                            "share_id": share_id,
+                            "share_pack_id": share_pack_id,
+                            "pipeline_name": pipeline_name,
+                            "databricks_pipeline_id": entry["databricks_pipeline_id"],
+                            "asset_name": entry.get("asset_name", ""),
+                            "source_table": entry.get("source_table", ""),
+                            "target_table": entry.get("target_table", ""),
+                            "scd_type": entry.get("scd_type", "2"),
+                            "key_columns": entry.get("key_columns", ""),
+                            "schedule_type": entry.get("schedule_type", "CRON"),
+                            "cron_expression": entry.get("cron_expression", ""),
+                            "timezone": entry.get("timezone", "UTC"),
+                            "serverless": entry.get("serverless", False),
+                            "tags": entry.get("tags", {}),
+                            "notification_emails": entry.get("notification_emails", []),
+                        },
+                    )
                 )
+                continue
             else:
                 await pipeline_repo.upsert_from_config(
                     share_id=share_id,
@@ -470,6 +622,30 @@ async def persist_pipelines_to_db(
                 f"Failed to persist pipeline '{pipeline_name}' ({action}) " f"to DB: {db_err}"
             )
 
+    if not pending_creates:
+        return
+
+    try:
+        results = await pipeline_repo.create_many_from_config(
+            [kwargs for _, kwargs in pending_creates],
+            created_by="orchestrator",
+        )
+    except Exception as db_err:
+        logger.opt(exception=True).warning(
+            f"Failed to persist {len(pending_creates)} new pipeline(s) (created) to DB: {db_err}"
+        )
+        return
+
+    for (entry, _), result in zip(pending_creates, results):
+        pipeline_name = entry["pipeline_name"]
+        if result is None:
+            logger.warning(f"Failed to persist pipeline '{pipeline_name}' (created) to DB")
+            continue
+        # The repository may have reused an existing or soft-deleted pipeline's id
+        entry["pipeline_id"] = result.entity_id
+        entry["action"] = result.action
+        logger.info(f"Persisted pipeline '{pipeline_name}' to DB ({entry['action']})")
+
 
 async def propagate_share_ids_to_pipelines(
     share_name_to_id: Dict[str, UUID],
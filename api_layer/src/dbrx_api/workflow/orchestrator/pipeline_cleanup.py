@@ -6,10 +6,13 @@ that were processing those assets. It intelligently decides whether to delete
 pipelines from Databricks based on whether the asset exists in other shares.
 """
 
+import json
+import re
 from typing import Any
 from typing import Dict
 from typing import List
 from typing import Set
+from typing import Tuple
 from uuid import UUID
 
 from loguru import logger
@@ -18,6 +21,11 @@ from dbrx_api.jobs.dbrx_pipelines import delete_pipeline
 from dbrx_api.jobs.dbrx_schedule import delete_schedule_for_pipeline
 from dbrx_api.workflow.db.repository_pipeline import PipelineRepository
 from dbrx_api.workflow.db.repository_share import ShareRepository
+from dbrx_api.workflow.orchestrator.resources import ApiResult
+from dbrx_api.workflow.orchestrator.resources import ApiStatus
+
+# delete_schedule_for_pipeline result text when there is nothing to delete
+_SCHEDULE_MISSING_RE = re.compile(r"no schedules found|not found", re.IGNORECASE)
 
 
 async def cleanup_orphaned_pipelines(
@@ -47,7 +55,7 @@ async def cleanup_orphaned_pipelines(
     # Get all pipelines for this share pack
     pipelines = await pipeline_repo.list_by_share_pack(share_pack_id)
     if not pipelines:
-        logger.debug(f"No pipelines found for share pack {share_pack_id}, skipping cleanup")
+        logger.debug("No pipelines found for share pack {}, skipping cleanup", share_pack_id)
         return
 
     # Build mapping of share_id -> current assets
@@ -69,8 +77,6 @@ async def cleanup_orphaned_pipelines(
                 )
                 # Parse JSON if needed
                 if isinstance(share_assets, str):
-                    import json
-
                     share_assets = json.loads(share_assets) if share_assets else []
                     logger.info(f"DEBUG: Parsed JSON: {share_assets}")
                 share_id_to_assets[share_id] = set(share_assets)
@@ -111,7 +117,7 @@ async def cleanup_orphaned_pipelines(
         databricks_pipeline_id = pipeline_rec.get("databricks_pipeline_id")
 
         if not source_asset or not share_id:
-            logger.debug(f"Pipeline '{pipeline_name}' missing source_asset or " f"share_id, skipping")
+            logger.debug("Pipeline '{}' missing source_asset or share_id, skipping", pipeline_name)
             continue
 
         # Check if we have share info for this share_id
@@ -127,7 +133,7 @@ async def cleanup_orphaned_pipelines(
         current_share_assets = share_id_to_assets[share_id]
         if source_asset in current_share_assets:
             # Asset still exists in share, pipeline is still needed
-            logger.debug(f"Pipeline '{pipeline_name}' asset '{source_asset}' still in share, keeping")
+            logger.debug("Pipeline '{}' asset '{}' still in share, keeping", pipeline_name, source_asset)
             continue
 
         # Asset removed from share - pipeline is orphaned
@@ -150,8 +156,9 @@ async def cleanup_orphaned_pipelines(
                     # No other DB records - safe to delete from Databricks
                     should_delete_from_databricks = True
                     logger.debug(
-                        f"Pipeline '{pipeline_name}': No other DB records "
-                        f"for databricks_pipeline_id={databricks_pipeline_id}"
+                        "Pipeline '{}': No other DB records for databricks_pipeline_id={}",
+                        pipeline_name,
+                        databricks_pipeline_id,
                     )
                 else:
                     logger.info(
@@ -186,7 +193,9 @@ async def cleanup_orphaned_pipelines(
 
     logger.info(f"Found {len(orphaned_pipelines)} orphaned pipeline(s) to clean up")
 
-    # Process each orphaned pipeline
+    # Process each orphaned pipeline; DB soft-deletes are collected and written in one batch
+    soft_deletes: List[Tuple[UUID, str]] = []
+    soft_delete_names: List[str] = []
     for orphan in orphaned_pipelines:
         pipeline_name = orphan["pipeline_name"]
         pipeline_id = orphan["pipeline_id"]
@@ -210,11 +219,11 @@ async def cleanup_orphaned_pipelines(
                             dltshr_workspace_url=workspace_url,
                             pipeline_id=databricks_pipeline_id,
                         )
-                        if isinstance(sch_result, str):
-                            if "no schedules found" in sch_result.lower() or "not found" in sch_result.lower():
-                                logger.debug(f"No schedule found for pipeline '{pipeline_name}', skipping")
-                            elif "error" in sch_result.lower():
-                                logger.warning(f"Failed to delete schedule for '{pipeline_name}': {sch_result}")
+                        outcome = ApiResult.of_message(sch_result, missing=_SCHEDULE_MISSING_RE)
+                        if outcome.status is ApiStatus.NOT_FOUND:
+                            logger.debug("No schedule found for pipeline '{}', skipping", pipeline_name)
+                        elif outcome.status is ApiStatus.ERROR:
+                            logger.warning(f"Failed to delete schedule for '{pipeline_name}': {sch_result}")
                         else:
                             logger.info(f"Deleted schedule for pipeline '{pipeline_name}'")
                     except Exception as sch_err:
@@ -240,18 +249,30 @@ async def cleanup_orphaned_pipelines(
                 )
 
             # Soft-delete the pipeline DB record in both cases
-            await pipeline_repo.soft_delete(
-                entity_id=pipeline_id,
-                deleted_by="orchestrator",
-                deletion_reason=f"Asset '{source_asset}' removed from share (share pack {share_pack_id})",
-                request_source="share_pack",
+            soft_deletes.append(
+                (pipeline_id, f"Asset '{source_asset}' removed from share (share pack {share_pack_id})")
             )
-            logger.info(f"Soft-deleted pipeline '{pipeline_name}' from database")
+            soft_delete_names.append(pipeline_name)
 
         except Exception as e:
             logger.opt(exception=True).error(f"Failed to clean up orphaned pipeline '{pipeline_name}': {e}")
             # Continue with other pipelines even if one fails
 
+    if not soft_deletes:
+        return
+    try:
+        results = await pipeline_repo.soft_delete_many(
+            soft_deletes, deleted_by="orchestrator", request_source="share_pack"
+        )
+    except Exception as e:
+        # Connection or transaction failure: none of the records were written
+        results = [e] * len(soft_deletes)
+    for pipeline_name, result in zip(soft_delete_names, results):
+        if isinstance(result, Exception):
+            logger.error("Failed to soft-delete orphaned pipeline '{}' from database: {}", pipeline_name, result)
+        else:
+            logger.info("Soft-deleted pipeline '{}' from database", pipeline_name)
+
 
 async def get_assets_being_removed(
     share_pack_id: UUID,
@@ -7,19 +7,27 @@ Unified pipeline provisioning for workflow (strategy-agnostic).
 """
 
 import copy
+import re
+import threading
 from typing import Any
 from typing import Dict
 from typing import List
 from typing import Optional
 from typing import Tuple
-from uuid import uuid4
+from uuid import UUID
 
 from loguru import logger
 
+try:
+    from databricks.sdk.service.pipelines import Notifications
+except ImportError:
+    Notifications = None  # type: ignore[misc, assignment]
+
 from dbrx_api.jobs.dbrx_pipelines import create_pipeline
 from dbrx_api.jobs.dbrx_pipelines import delete_pipeline
 from dbrx_api.jobs.dbrx_pipelines import find_pipelines_by_source_and_target
 from dbrx_api.jobs.dbrx_pipelines import get_pipeline_by_name
+from dbrx_api.jobs.dbrx_pipelines import list_pipelines
 from dbrx_api.jobs.dbrx_pipelines import list_pipelines_with_search_criteria
 from dbrx_api.jobs.dbrx_pipelines import update_pipeline_target_configuration
 from dbrx_api.jobs.dbrx_schedule import create_schedule_for_pipeline
@@ -27,47 +35,83 @@ from dbrx_api.jobs.dbrx_schedule import delete_schedule_for_pipeline
 from dbrx_api.jobs.dbrx_schedule import list_schedules
 from dbrx_api.jobs.dbrx_schedule import update_schedule_for_pipeline
 from dbrx_api.jobs.dbrx_schedule import update_timezone_for_schedule
+from dbrx_api.workflow.db.ids import uuid7
+from dbrx_api.workflow.db.ids import uuid7_batch
 from dbrx_api.workflow.db.repository_pipeline import PipelineRepository
+from dbrx_api.workflow.orchestrator.concurrency import PIPELINE_FANOUT_CONCURRENCY
+from dbrx_api.workflow.orchestrator.concurrency import call_with_retry
+from dbrx_api.workflow.orchestrator.concurrency import provision_entities
+from dbrx_api.workflow.orchestrator.concurrency import run_sync
+from dbrx_api.workflow.orchestrator.resources import ApiResult
+
+# Databricks error text meaning the pipeline being created is already there
+_EXISTS_RE = re.compile(r"already\s+exists|already\s+present|duplicate", re.IGNORECASE)
+# create_schedule_for_pipeline result meaning the pipeline already has a schedule job
+_SCHEDULE_EXISTS_RE = re.compile(r"already exists", re.IGNORECASE)
+
+
+# Keys of a schedule dict that are settings rather than a v1.0 asset name
+_SCHEDULE_FIELDS = frozenset(("cron", "timezone", "action"))
+# Settings keys for the v1.0 checks that do not treat "action" as a setting
+_V1_SCHEDULE_FIELDS = frozenset(("cron", "timezone"))
+
+
+def _single_schedule_asset(schedule: Dict[str, Any], reserved: frozenset = _SCHEDULE_FIELDS) -> Optional[Any]:
+    """
+    Return the only non-reserved key of a schedule dict (the v1.0 asset key), else None.
+
+    Stops at the second non-reserved key instead of collecting them all.
+    """
+    asset_key = None
+    found = False
+    for key in schedule:
+        if key in reserved:
+            continue
+        if found:
+            return None
+        asset_key, found = key, True
+    return asset_key
 
 
-def _resolve_source_asset(pipeline_config: Dict[str, Any], pipeline_name: str) -> str:
-    """Extract source_asset from v2.0 (source_asset) or v1.0 (schedule key)."""
+def _parse_schedule(schedule: Any) -> Tuple[str, str, Optional[str]]:
+    """
+    Parse a pipeline schedule once into (cron_expression, timezone, schedule_asset).
+
+    Handles "continuous" (empty cron), v2.0 {cron, timezone} and v1.0
+    {<asset>: {cron, timezone}}. schedule_asset is the v1.0 asset key when exactly
+    one is present, else None.
+    """
+    if not isinstance(schedule, dict):
+        return "", "UTC", None
+    asset_key = _single_schedule_asset(schedule)
+    schedule_asset = str(asset_key).strip() if asset_key is not None else None
+    cron = schedule.get("cron") or ""
+    tz = schedule.get("timezone", "UTC") or "UTC"
+    if not cron and schedule_asset is not None:
+        nested = schedule[asset_key]
+        if isinstance(nested, dict):
+            cron = nested.get("cron") or ""
+            tz = nested.get("timezone", "UTC") or "UTC"
+    return cron.strip(), tz, schedule_asset
+
+
+def _resolve_source_asset(
+    pipeline_config: Dict[str, Any],
+    pipeline_name: str,
+    schedule_asset: Optional[str],
+) -> str:
+    """Pick source_asset from v2.0 (source_asset) or v1.0 (schedule_asset from _parse_schedule)."""
     source_asset = pipeline_config.get("source_asset")
     if source_asset and str(source_asset).strip():
         return str(source_asset).strip()
-    schedule = pipeline_config.get("schedule", {})
-    if isinstance(schedule, dict):
-        schedule_keys = [k for k in schedule.keys() if k not in ("cron", "timezone", "action")]
-        if len(schedule_keys) == 1:
-            return str(schedule_keys[0]).strip()
+    if schedule_asset:
+        return schedule_asset
     raise ValueError(
         f"Pipeline '{pipeline_name}': Cannot determine source_asset. "
         "Use v2.0 format with explicit source_asset or v1.0 schedule with single asset key."
     )
 
 
-def _extract_cron_timezone(
-    pipeline_config: Dict[str, Any],
-    pipeline_name: str,
-) -> Tuple[str, str]:
-    """Extract (cron_expression, timezone) from schedule; empty cron if continuous."""
-    schedule = pipeline_config.get("schedule")
-    if isinstance(schedule, str) and str(schedule).strip().lower() == "continuous":
-        return "", "UTC"
-    if isinstance(schedule, dict):
-        cron = schedule.get("cron") or ""
-        tz = schedule.get("timezone", "UTC") or "UTC"
-        if not cron:
-            schedule_keys = [k for k in schedule.keys() if k not in ("cron", "timezone", "action")]
-            if len(schedule_keys) == 1:
-                nested = schedule.get(schedule_keys[0])
-                if isinstance(nested, dict):
-                    cron = nested.get("cron", "")
-                    tz = nested.get("timezone", "UTC") or "UTC"
-        return (cron.strip(), tz)
-    return "", "UTC"
-
-
 def _config_dict_to_list(config: Dict[str, Any]) -> List[Dict[str, str]]:
     """Convert configuration dict to list of key-value for pipelines.update API."""
     if not config:
@@ -75,6 +119,72 @@ def _config_dict_to_list(config: Dict[str, Any]) -> List[Dict[str, str]]:
     return [{"key": k, "value": str(v)} for k, v in config.items()]
 
 
+def _index_pipelines_by_name(workspace_url: str) -> Optional[Dict[str, str]]:
+    """
+    List the workspace's pipelines once and index pipeline_id by exact name.
+
+    Returns None if the listing fails, in which case callers fall back to per-name lookups.
+    """
+    try:
+        return {p.name: p.pipeline_id for p in list_pipelines(dltshr_workspace_url=workspace_url) if p.name}
+    except Exception as e:
+        logger.warning(f"Could not list pipelines in {workspace_url}, falling back to per-pipeline lookups: {e}")
+        return None
+
+
+class _PipelineIdIndex:
+    """
+    pipeline_id-by-name index shared by the workers of one ensure_pipelines run.
+
+    Seeded with the up-front workspace listing. A create that reports "already exists"
+    (a race with another creator, or a failed up-front listing) looks the id up here:
+    the first miss re-lists the workspace once for the whole run, instead of every such
+    pipeline running its own paginated name search.
+    """
+
+    def __init__(self, workspace_url: str, ids: Optional[Dict[str, str]]):
+        self.workspace_url = workspace_url
+        self.ids = ids
+        self._refreshed = False
+        self._lock = threading.Lock()
+
+    def get(self, pipeline_name: str) -> Optional[str]:
+        """Return the pipeline_id for an exact name, re-listing at most once per run on a miss."""
+        with self._lock:
+            if (self.ids is None or pipeline_name not in self.ids) and not self._refreshed:
+                self._refreshed = True
+                ids = _index_pipelines_by_name(self.workspace_url)
+                if ids is not None:
+                    self.ids = ids
+            return (self.ids or {}).get(pipeline_name)
+
+
+def _schedules_by_pipeline(workspace_url: str, pipeline_ids: List[str]) -> Optional[Dict[str, List[Dict[str, Any]]]]:
+    """
+    List schedule jobs for many pipelines with one jobs listing, grouped by pipeline_id.
+
+    list_schedules scans the workspace's jobs on every call, so this replaces one scan per
+    pipeline. Returns None if the listing fails, in which case callers list per pipeline.
+    """
+    if not pipeline_ids:
+        return {}
+    try:
+        schedules, _ = list_schedules(
+            dltshr_workspace_url=workspace_url,
+            pipeline_ids=pipeline_ids,
+            max_results=max(100, 10 * len(pipeline_ids)),
+        )
+    except Exception as e:
+        logger.warning(f"Could not list schedules in {workspace_url}, falling back to per-pipeline lookups: {e}")
+        return None
+    grouped: Dict[str, List[Dict[str, Any]]] = {pid: [] for pid in pipeline_ids}
+    for schedule in schedules:
+        for pid in schedule.get("pipeline_ids") or []:
+            if pid in grouped:
+                grouped[pid].append(schedule)
+    return grouped
+
+
 def _rollback_pipelines(
     rollback_list: List[Tuple[str, ...]],
     workspace_url: str,
@@ -171,13 +281,18 @@ def _create_pipeline_and_schedule(
     pipeline_config: Dict[str, Any],
     pipeline_name: str,
     created_resources: Dict[str, List],
+    pipeline_id_db: Optional[UUID] = None,
+    pipeline_index: Optional[_PipelineIdIndex] = None,
 ) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
     """
     Create pipeline and optional schedule. Returns (databricks_pipeline_id, db_entry) or (None, None) on skip.
     Raises on failure. Does not append to rollback list (caller does).
+    pipeline_id_db is the DB business key for the new record; generated here if not given.
+    pipeline_index resolves the id of a pipeline that turns out to exist already.
     """
     delta_share_config = share_config.get("delta_share") or {}
-    source_asset = _resolve_source_asset(pipeline_config, pipeline_name)
+    cron_expr, timezone, schedule_asset = _parse_schedule(pipeline_config.get("schedule"))
+    source_asset = _resolve_source_asset(pipeline_config, pipeline_name, schedule_asset)
     target_asset = pipeline_config.get("target_asset") or source_asset.split(".")[-1]
 
     target_catalog = pipeline_config.get("ext_catalog_name") or delta_share_config.get("ext_catalog_name")
@@ -185,41 +300,52 @@ def _create_pipeline_and_schedule(
     if not target_catalog or not target_schema:
         raise ValueError(f"Pipeline '{pipeline_name}': delta_share must contain ext_catalog_name and ext_schema_name.")
 
+    key_columns = pipeline_config.get("key_columns", "")
+    scd_type = pipeline_config.get("scd_type", "2")
+    notification_list = pipeline_config.get("notification", [])
+    tags = pipeline_config.get("tags", {})
+    serverless = pipeline_config.get("serverless", False)
+
     configuration = {
         "pipelines.source_table": source_asset,
         "pipelines.target_table": target_asset,
-        "pipelines.keys": pipeline_config.get("key_columns", ""),
-        "pipelines.scd_type": pipeline_config.get("scd_type", "2"),
+        "pipelines.keys": key_columns,
+        "pipelines.scd_type": scd_type,
     }
 
-    result = create_pipeline(
-        dltshr_workspace_url=workspace_url,
-        pipeline_name=pipeline_name,
-        target_catalog_name=target_catalog,
-        target_schema_name=target_schema,
-        configuration=configuration,
-        notifications_list=pipeline_config.get("notification", []),
-        tags=pipeline_config.get("tags", {}),
-        serverless=pipeline_config.get("serverless", False),
+    # create_pipeline's own pre-check reports a taken name as PIPELINE_EXISTS_PREFIX + name,
+    # which the regex matches along with SDK errors from a concurrent create
+    result = ApiResult.of(
+        call_with_retry(
+            create_pipeline,
+            dltshr_workspace_url=workspace_url,
+            pipeline_name=pipeline_name,
+            target_catalog_name=target_catalog,
+            target_schema_name=target_schema,
+            configuration=configuration,
+            notifications_list=notification_list,
+            tags=tags,
+            serverless=serverless,
+        ),
+        _EXISTS_RE,
     )
 
-    if isinstance(result, str):
-        err_lower = result.lower()
-        if any(k in err_lower for k in ["already exists", "already present", "duplicate"]):
+    if not result.success:
+        if result.already_exists:
             logger.warning(f"Pipeline {pipeline_name} already exists, treating as update")
-            pipelines_list = list_pipelines_with_search_criteria(
-                dltshr_workspace_url=workspace_url,
-                filter_expr=pipeline_name,
-            )
-            existing_pipeline_id = None
-            for p in pipelines_list:
-                if p.name == pipeline_name:
-                    existing_pipeline_id = p.pipeline_id
-                    break
+            existing_pipeline_id = pipeline_index.get(pipeline_name) if pipeline_index is not None else None
+            if not existing_pipeline_id:
+                # Created after the shared index was refreshed: fall back to a name search
+                pipelines_list = list_pipelines_with_search_criteria(
+                    dltshr_workspace_url=workspace_url,
+                    filter_expr=pipeline_name,
+                )
+                # Search is a substring match; index the hits by exact name once
+                ids_by_name = {p.name: p.pipeline_id for p in pipelines_list if p.name}
+                existing_pipeline_id = ids_by_name.get(pipeline_name)
             if not existing_pipeline_id:
                 raise RuntimeError(f"Pipeline '{pipeline_name}' reported as existing but could not be found")
 
-            cron_expr, tz = _extract_cron_timezone(pipeline_config, pipeline_name)
             db_entry = {
                 "action": "already_exists",
                 "share_name": share_name,
@@ -228,69 +354,70 @@ def _create_pipeline_and_schedule(
                 "asset_name": target_asset,
                 "source_table": source_asset,
                 "target_table": target_asset,
-                "scd_type": pipeline_config.get("scd_type", "2"),
-                "key_columns": pipeline_config.get("key_columns", ""),
+                "scd_type": scd_type,
+                "key_columns": key_columns,
                 "schedule_type": "CRON" if cron_expr else "CONTINUOUS",
                 "cron_expression": cron_expr,
-                "timezone": tz,
-                "serverless": pipeline_config.get("serverless", False),
+                "timezone": timezone,
+                "serverless": serverless,
                 "tags": pipeline_config.get("tags"),
-                "notification_emails": pipeline_config.get("notification", []),
+                "notification_emails": notification_list,
             }
 
             return existing_pipeline_id, db_entry
-        raise RuntimeError(f"Failed to create pipeline {pipeline_name}: {result}")
+        raise RuntimeError(f"Failed to create pipeline {pipeline_name}: {result.error}")
 
-    pipeline_id = result.pipeline_id
+    pipeline_id = result.obj.pipeline_id
     created_resources["pipelines"].append(pipeline_name)
 
-    cron_expr, timezone = _extract_cron_timezone(pipeline_config, pipeline_name)
     if cron_expr:
         job_name = f"{pipeline_name}_schedule"
-        schedule_result = create_schedule_for_pipeline(
-            dltshr_workspace_url=workspace_url,
-            job_name=job_name,
-            pipeline_id=pipeline_id,
-            cron_expression=cron_expr,
-            time_zone=timezone,
-            paused=False,
-            email_notifications=pipeline_config.get("notification", []),
-            tags=pipeline_config.get("tags", {}),
-            description=pipeline_config.get("description"),
+        schedule_result = ApiResult.of_message(
+            call_with_retry(
+                create_schedule_for_pipeline,
+                dltshr_workspace_url=workspace_url,
+                job_name=job_name,
+                pipeline_id=pipeline_id,
+                cron_expression=cron_expr,
+                time_zone=timezone,
+                paused=False,
+                email_notifications=notification_list,
+                tags=tags,
+                description=pipeline_config.get("description"),
+            ),
+            _SCHEDULE_EXISTS_RE,
         )
-        if isinstance(schedule_result, str):
-            if "already exists" in schedule_result.lower():
-                logger.info(
-                    "Schedule %s already exists for %s, updating cron/timezone",
-                    job_name,
-                    pipeline_name,
+        if schedule_result.already_exists:
+            logger.info(
+                "Schedule {} already exists for {}, updating cron/timezone",
+                job_name,
+                pipeline_name,
+            )
+            schedules_after, _ = list_schedules(
+                dltshr_workspace_url=workspace_url,
+                pipeline_id=pipeline_id,
+            )
+            if schedules_after:
+                update_schedule_for_pipeline(
+                    dltshr_workspace_url=workspace_url,
+                    job_id=schedules_after[0]["job_id"],
+                    cron_expression=cron_expr,
                 )
-                schedules_after, _ = list_schedules(
+                update_timezone_for_schedule(
                     dltshr_workspace_url=workspace_url,
-                    pipeline_id=pipeline_id,
+                    job_id=schedules_after[0]["job_id"],
+                    time_zone=timezone,
                 )
-                if schedules_after:
-                    update_schedule_for_pipeline(
-                        dltshr_workspace_url=workspace_url,
-                        job_id=schedules_after[0]["job_id"],
-                        cron_expression=cron_expr,
-                    )
-                    update_timezone_for_schedule(
-                        dltshr_workspace_url=workspace_url,
-                        job_id=schedules_after[0]["job_id"],
-                        time_zone=timezone,
-                    )
-                    created_resources.setdefault("schedules", []).append(f"{pipeline_name} (schedule updated)")
-                else:
-                    created_resources.setdefault("schedules", []).append(f"{pipeline_name} (created)")
-            elif "error" in schedule_result.lower():
-                raise RuntimeError(f"Failed to create schedule for {pipeline_name}: {schedule_result}")
+                created_resources.setdefault("schedules", []).append(f"{pipeline_name} (schedule updated)")
             else:
                 created_resources.setdefault("schedules", []).append(f"{pipeline_name} (created)")
+        elif not schedule_result.success:
+            raise RuntimeError(f"Failed to create schedule for {pipeline_name}: {schedule_result.error}")
         else:
             created_resources.setdefault("schedules", []).append(f"{pipeline_name} (created)")
 
-    pipeline_id_db = uuid4()
+    if pipeline_id_db is None:
+        pipeline_id_db = uuid7()
     db_entry = {
         "action": "created",
         "pipeline_id": pipeline_id_db,
@@ -300,14 +427,14 @@ def _create_pipeline_and_schedule(
         "asset_name": target_asset,
         "source_table": source_asset,
         "target_table": target_asset,
-        "scd_type": pipeline_config.get("scd_type", "2"),
-        "key_columns": pipeline_config.get("key_columns", ""),
+        "scd_type": scd_type,
+        "key_columns": key_columns,
         "schedule_type": "CRON" if cron_expr else "CONTINUOUS",
         "cron_expression": cron_expr,
         "timezone": timezone,
-        "serverless": pipeline_config.get("serverless", False),
-        "tags": pipeline_config.get("tags", {}),
-        "notification_emails": pipeline_config.get("notification", []),
+        "serverless": serverless,
+        "tags": tags,
+        "notification_emails": notification_list,
     }
 
     return pipeline_id, db_entry
@@ -321,8 +448,14 @@ def _update_pipeline_and_schedule(
     share_config: Dict[str, Any],
     share_name: str,
     created_resources: Dict[str, List],
+    schedules: Optional[List[Dict[str, Any]]] = None,
 ) -> Dict[str, Any]:
-    """Update existing pipeline configuration and schedule; return db_entry for deferred DB write."""
+    """
+    Update existing pipeline configuration and schedule; return db_entry for deferred DB write.
+
+    schedules is the pipeline's current list_schedules result when the caller already has it
+    (ensure_pipelines fetches it for rollback); it is only listed here when not passed.
+    """
     existing = get_pipeline_by_name(
         dltshr_workspace_url=workspace_url,
         pipeline_name=pipeline_name,
@@ -362,8 +495,6 @@ def _update_pipeline_and_schedule(
     # When absent/empty, preserve existing Databricks notifications to avoid clearing them.
     notifications_list = pipeline_config.get("notification", [])
     if notifications_list:
-        from databricks.sdk.service.pipelines import Notifications
-
         notifications = [
             Notifications(
                 email_recipients=notifications_list,
@@ -411,25 +542,30 @@ def _update_pipeline_and_schedule(
 
     created_resources["pipelines"].append(f"{pipeline_name} (updated)")
 
-    cron_expr, timezone = _extract_cron_timezone(pipeline_config, pipeline_name)
-    schedules, _ = list_schedules(dltshr_workspace_url=workspace_url, pipeline_id=pipeline_id)
+    cron_expr, timezone, schedule_asset = _parse_schedule(pipeline_config.get("schedule"))
+    if schedules is None:
+        schedules, _ = list_schedules(dltshr_workspace_url=workspace_url, pipeline_id=pipeline_id)
     if cron_expr:
         if not schedules:
             job_name = f"{pipeline_name}_schedule"
-            create_result = create_schedule_for_pipeline(
-                dltshr_workspace_url=workspace_url,
-                job_name=job_name,
-                pipeline_id=pipeline_id,
-                cron_expression=cron_expr,
-                time_zone=timezone,
-                paused=False,
-                email_notifications=pipeline_config.get("notification", []),
-                tags=pipeline_config.get("tags", {}),
-                description=pipeline_config.get("description"),
+            create_result = ApiResult.of_message(
+                call_with_retry(
+                    create_schedule_for_pipeline,
+                    dltshr_workspace_url=workspace_url,
+                    job_name=job_name,
+                    pipeline_id=pipeline_id,
+                    cron_expression=cron_expr,
+                    time_zone=timezone,
+                    paused=False,
+                    email_notifications=notifications_list,
+                    tags=pipeline_config.get("tags", {}),
+                    description=pipeline_config.get("description"),
+                ),
+                _SCHEDULE_EXISTS_RE,
             )
-            if isinstance(create_result, str) and "already exists" in create_result.lower():
+            if create_result.already_exists:
                 logger.info(
-                    "Schedule %s already exists for %s, updating cron/timezone",
+                    "Schedule {} already exists for {}, updating cron/timezone",
                     job_name,
                     pipeline_name,
                 )
@@ -463,7 +599,7 @@ def _update_pipeline_and_schedule(
             )
             created_resources.setdefault("schedules", []).append(f"{pipeline_name} (schedule updated)")
 
-    source_asset = _resolve_source_asset(pipeline_config, pipeline_name)
+    source_asset = _resolve_source_asset(pipeline_config, pipeline_name, schedule_asset)
     target_asset = pipeline_config.get("target_asset") or source_asset.split(".")[-1]
     db_entry = {
         "action": "updated",
@@ -479,13 +615,121 @@ def _update_pipeline_and_schedule(
         "cron_expression": cron_expr,
         "timezone": timezone,
         "serverless": pipeline_config.get("serverless", False),
-        "tags": pipeline_config.get("tags"),
-        "notification_emails": pipeline_config.get("notification", []),
+        "tags": tags_from_yaml,
+        "notification_emails": notifications_list,
     }
 
     return db_entry
 
 
+def _ensure_pipeline(
+    workspace_url: str,
+    share_name: str,
+    share_config: Dict[str, Any],
+    pipeline_config: Dict[str, Any],
+    pipeline_name: str,
+    outcome: Dict[str, List],
+    pipeline_ids_by_name: Optional[Dict[str, str]] = None,
+    schedules_by_pipeline: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+    pipeline_id_db: Optional[UUID] = None,
+    pipeline_index: Optional[_PipelineIdIndex] = None,
+) -> None:
+    """
+    Create or update a single pipeline (and its schedule), recording into this pipeline's own outcome.
+
+    outcome holds "rollback", "db_entries", "pipelines" and "schedules" lists; ensure_pipelines
+    merges them in config order once all pipelines have finished. pipeline_ids_by_name is the
+    workspace listing taken up front: names missing from it go straight to create (a race with
+    another creator is handled by the "already exists" path). schedules_by_pipeline holds the
+    prefetched schedules of existing pipelines. pipeline_id_db is the pre-generated DB id used
+    if the pipeline is created. pipeline_index is the run's shared index for the "already
+    exists" path.
+    """
+    logger.info(f"Ensuring pipeline: {pipeline_name}")
+
+    if pipeline_ids_by_name is not None and pipeline_name not in pipeline_ids_by_name:
+        existing = None
+    else:
+        existing = get_pipeline_by_name(
+            dltshr_workspace_url=workspace_url,
+            pipeline_name=pipeline_name,
+        )
+
+    if existing is None:
+        pipeline_id, db_entry = _create_pipeline_and_schedule(
+            workspace_url=workspace_url,
+            share_name=share_name,
+            share_config=share_config,
+            pipeline_config=pipeline_config,
+            pipeline_name=pipeline_name,
+            created_resources=outcome,
+            pipeline_id_db=pipeline_id_db,
+            pipeline_index=pipeline_index,
+        )
+        if pipeline_id:
+            outcome["rollback"].append(("created", workspace_url, pipeline_id, pipeline_name))
+        if db_entry:
+            outcome["db_entries"].append(db_entry)
+        return
+
+    pipeline_id = existing.pipeline_id
+    # Capture previous state for rollback if a later step fails
+    spec = existing.spec
+    prev_config = copy.deepcopy(dict(spec.configuration)) if spec and spec.configuration else {}
+    prev_catalog = spec.catalog if spec else None
+    prev_target = spec.target if spec else None
+    prev_libraries = copy.deepcopy(spec.libraries) if spec and spec.libraries else None
+    prev_notifications = copy.deepcopy(spec.notifications) if spec and getattr(spec, "notifications", None) else None
+    prev_tags = None
+    if spec and getattr(spec, "clusters", None) and len(spec.clusters) > 0:
+        ct = getattr(spec.clusters[0], "custom_tags", None)
+        prev_tags = dict(ct) if ct else None
+    prev_serverless = getattr(spec, "serverless", None) if spec else None
+    if schedules_by_pipeline is not None and pipeline_id in schedules_by_pipeline:
+        schedules = schedules_by_pipeline[pipeline_id]
+    else:
+        schedules, _ = list_schedules(
+            dltshr_workspace_url=workspace_url,
+            pipeline_id=pipeline_id,
+        )
+    prev_job_id = schedules[0]["job_id"] if schedules else None
+    prev_cron = ""
+    prev_timezone = "UTC"
+    if schedules and schedules[0].get("cron_schedule"):
+        cs = schedules[0]["cron_schedule"]
+        prev_cron = cs.get("cron_expression") or ""
+        prev_timezone = cs.get("timezone") or "UTC"
+    outcome["rollback"].append(
+        (
+            "updated",
+            workspace_url,
+            pipeline_id,
+            pipeline_name,
+            prev_config,
+            prev_catalog,
+            prev_target,
+            prev_libraries,
+            prev_notifications,
+            prev_tags,
+            prev_serverless,
+            prev_job_id,
+            prev_cron,
+            prev_timezone,
+        )
+    )
+    db_entry = _update_pipeline_and_schedule(
+        workspace_url=workspace_url,
+        pipeline_name=pipeline_name,
+        pipeline_id=pipeline_id,
+        pipeline_config=pipeline_config,
+        share_config=share_config,
+        share_name=share_name,
+        created_resources=outcome,
+        schedules=schedules,
+    )
+    outcome["db_entries"].append(db_entry)
+
+
 async def ensure_pipelines(
     workspace_url: str,
     shares_config: List[Dict[str, Any]],
@@ -498,101 +742,68 @@ async def ensure_pipelines(
     Databricks operations only — no DB writes. Populates mutable rollback_list and db_entries.
     On failure, raises without rollback — the orchestrator handles all rollback.
 
+    Pipelines are independent, so they are processed concurrently (bounded by
+    PIPELINE_PROVISION_CONCURRENCY, higher than for other entities since a create mostly
+    waits on Databricks). Each pipeline records into its own outcome, and outcomes are
+    merged in config order afterwards — also on failure, so in-flight pipelines that
+    finished still get their rollback entries recorded. Each worker creates a pipeline's
+    schedule right after the pipeline itself, so schedule calls overlap with other
+    pipelines' creates instead of waiting for a separate scheduling pass.
+
     Raises:
         Exception: On first pipeline create/update failure (orchestrator handles rollback).
     """
     if created_resources is None:
         created_resources = {"pipelines": [], "schedules": []}
 
+    jobs: List[Tuple[str, Dict[str, Any], Dict[str, Any], str]] = []
     for share_config in shares_config:
         share_name = share_config.get("name", "")
-        pipelines = share_config.get("pipelines", [])
-        if not pipelines:
-            continue
-
-        for pipeline_config in pipelines:
+        for pipeline_config in share_config.get("pipelines", []) or []:
             if not isinstance(pipeline_config, dict):
                 continue
             pipeline_name = pipeline_config.get("name_prefix") or pipeline_config.get("name")
             if not pipeline_name:
                 continue
-            pipeline_name = str(pipeline_name).strip()
+            jobs.append((share_name, share_config, pipeline_config, str(pipeline_name).strip()))
 
-            logger.info(f"Ensuring pipeline: {pipeline_name}")
-
-            existing = get_pipeline_by_name(
-                dltshr_workspace_url=workspace_url,
-                pipeline_name=pipeline_name,
-            )
+    if not jobs:
+        return
 
-            if existing is None:
-                pipeline_id, db_entry = _create_pipeline_and_schedule(
-                    workspace_url=workspace_url,
-                    share_name=share_name,
-                    share_config=share_config,
-                    pipeline_config=pipeline_config,
-                    pipeline_name=pipeline_name,
-                    created_resources=created_resources,
-                )
-                if pipeline_id:
-                    rollback_list.append(("created", workspace_url, pipeline_id, pipeline_name))
-                if db_entry:
-                    db_entries.append(db_entry)
-            else:
-                pipeline_id = existing.pipeline_id
-                # Capture previous state for rollback if a later step fails
-                spec = existing.spec
-                prev_config = copy.deepcopy(dict(spec.configuration)) if spec and spec.configuration else {}
-                prev_catalog = spec.catalog if spec else None
-                prev_target = spec.target if spec else None
-                prev_libraries = copy.deepcopy(spec.libraries) if spec and spec.libraries else None
-                prev_notifications = (
-                    copy.deepcopy(spec.notifications) if spec and getattr(spec, "notifications", None) else None
-                )
-                prev_tags = None
-                if spec and getattr(spec, "clusters", None) and len(spec.clusters) > 0:
-                    ct = getattr(spec.clusters[0], "custom_tags", None)
-                    prev_tags = dict(ct) if ct else None
-                prev_serverless = getattr(spec, "serverless", None) if spec else None
-                schedules, _ = list_schedules(
-                    dltshr_workspace_url=workspace_url,
-                    pipeline_id=pipeline_id,
-                )
-                prev_job_id = schedules[0]["job_id"] if schedules else None
-                prev_cron = ""
-                prev_timezone = "UTC"
-                if schedules and schedules[0].get("cron_schedule"):
-                    cs = schedules[0]["cron_schedule"]
-                    prev_cron = cs.get("cron_expression") or ""
-                    prev_timezone = cs.get("timezone") or "UTC"
-                rollback_list.append(
-                    (
-                        "updated",
-                        workspace_url,
-                        pipeline_id,
-                        pipeline_name,
-                        prev_config,
-                        prev_catalog,
-                        prev_target,
-                        prev_libraries,
-                        prev_notifications,
-                        prev_tags,
-                        prev_serverless,
-                        prev_job_id,
-                        prev_cron,
-                        prev_timezone,
-                    )
-                )
-                db_entry = _update_pipeline_and_schedule(
-                    workspace_url=workspace_url,
-                    pipeline_name=pipeline_name,
-                    pipeline_id=pipeline_id,
-                    pipeline_config=pipeline_config,
-                    share_config=share_config,
-                    share_name=share_name,
-                    created_resources=created_resources,
-                )
-                db_entries.append(db_entry)
+    # One workspace listing instead of a name lookup per pipeline to find which ones are new
+    pipeline_ids_by_name = await run_sync(_index_pipelines_by_name, workspace_url)
+    # ...and one jobs listing for the schedules of the pipelines that already exist
+    existing_ids = [pipeline_ids_by_name[job[3]] for job in jobs if job[3] in (pipeline_ids_by_name or {})]
+    schedules_by_pipeline = await run_sync(_schedules_by_pipeline, workspace_url, existing_ids)
+    # DB ids for pipelines that turn out to be new, generated in one batch
+    known = pipeline_ids_by_name or {}
+    new_ids = iter(uuid7_batch(sum(1 for job in jobs if job[3] not in known)))
+    pipeline_ids_db = [None if job[3] in known else next(new_ids) for job in jobs]
+    # Shared by the workers so "already exists" pipelines resolve their ids from one re-listing
+    pipeline_index = _PipelineIdIndex(workspace_url, pipeline_ids_by_name)
+
+    def merge(outcome: Dict[str, List]) -> None:
+        rollback_list.extend(outcome["rollback"])
+        db_entries.extend(outcome["db_entries"])
+        created_resources.setdefault("pipelines", []).extend(outcome["pipelines"])
+        if outcome["schedules"]:
+            created_resources.setdefault("schedules", []).extend(outcome["schedules"])
+
+    await provision_entities(
+        lambda item, outcome: _ensure_pipeline(
+            workspace_url,
+            *item[0],
+            outcome,
+            pipeline_ids_by_name=pipeline_ids_by_name,
+            schedules_by_pipeline=schedules_by_pipeline,
+            pipeline_id_db=item[1],
+            pipeline_index=pipeline_index,
+        ),
+        zip(jobs, pipeline_ids_db),
+        ("rollback", "db_entries", "pipelines", "schedules"),
+        merge,
+        limit=PIPELINE_FANOUT_CONCURRENCY,
+    )
 
 
 async def delete_pipelines_for_removed_assets(
@@ -646,7 +857,9 @@ async def delete_pipelines_for_removed_assets(
             asset_lower = asset.strip().lower()
             matches = [p for p in db_pipelines if (p.get("source_table") or "").strip().lower() == asset_lower]
             if not matches:
-                logger.debug(f"No DB record for removed asset '{asset}' in share '{share_name}' — will try Databricks")
+                logger.debug(
+                    "No DB record for removed asset '{}' in share '{}' — will try Databricks", asset, share_name
+                )
                 assets_not_in_db.append(asset)
                 continue
 
@@ -660,7 +873,7 @@ async def delete_pipelines_for_removed_assets(
                     continue
 
                 logger.info(f"Found pipeline '{pipeline_name}' via DB for removed asset '{asset}'")
-                _delete_single_pipeline(workspace_url, dbrx_pipeline_id, pipeline_name, asset, deleted)
+                await run_sync(_delete_single_pipeline, workspace_url, dbrx_pipeline_id, pipeline_name, asset, deleted)
 
     # ── Phase 2: Databricks API fallback (for assets not found in DB) ───────────
     if assets_not_in_db:
@@ -675,7 +888,8 @@ async def delete_pipelines_for_removed_assets(
                 f"Databricks fallback: searching for pipelines for {len(assets_not_in_db)} asset(s) "
                 f"not found in DB: {assets_not_in_db}"
             )
-            matched = find_pipelines_by_source_and_target(
+            matched = await run_sync(
+                find_pipelines_by_source_and_target,
                 dltshr_workspace_url=workspace_url,
                 source_tables=assets_not_in_db,
                 ext_catalog_name=ext_catalog_name,
@@ -689,7 +903,9 @@ async def delete_pipelines_for_removed_assets(
                     if pipeline.spec
                     else "unknown"
                 )
-                _delete_single_pipeline(workspace_url, dbrx_pipeline_id, pipeline_name, source_table, deleted)
+                await run_sync(
+                    _delete_single_pipeline, workspace_url, dbrx_pipeline_id, pipeline_name, source_table, deleted
+                )
 
     return deleted
 
@@ -770,8 +986,9 @@ async def check_and_sync_pipelines_for_added_assets(
             asset_lower = asset.strip().lower()
             if (share_name, asset_lower) in covered:
                 logger.debug(
-                    f"Asset '{asset}' added to share '{share_name}': "
-                    "covered by YAML pipeline config — skipping pipeline check."
+                    "Asset '{}' added to share '{}': covered by YAML pipeline config — skipping pipeline check.",
+                    asset,
+                    share_name,
                 )
             else:
                 assets_to_check.append(asset)
@@ -821,7 +1038,8 @@ async def check_and_sync_pipelines_for_added_assets(
                 f"asset(s) not found in DB or YAML: {assets_not_in_db}"
             )
             try:
-                matched = find_pipelines_by_source_and_target(
+                matched = await run_sync(
+                    find_pipelines_by_source_and_target,
                     dltshr_workspace_url=workspace_url,
                     source_tables=assets_not_in_db,
                     ext_catalog_name=ext_catalog_name,
@@ -865,9 +1083,10 @@ async def check_and_sync_pipelines_for_added_assets(
                 )
         else:
             logger.debug(
-                f"Share '{share_name}': skipping Databricks pipeline search for "
-                f"{len(assets_not_in_db)} unresolved asset(s) — ext_catalog_name and "
-                "ext_schema_name are required in the delta_share config to safely scope the search."
+                "Share '{}': skipping Databricks pipeline search for {} unresolved asset(s) — ext_catalog_name "
+                "and ext_schema_name are required in the delta_share config to safely scope the search.",
+                share_name,
+                len(assets_not_in_db),
             )
 
         # ── Phase 4: collect assets not found anywhere ────────────────────────────
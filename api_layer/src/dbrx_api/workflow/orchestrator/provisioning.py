@@ -6,21 +6,46 @@ Tracks all resources in database with rollback support.
 """
 
 import asyncio
+import functools
+import re
+import socket
+import time
+from collections import OrderedDict
+from datetime import datetime
+from datetime import timezone
 from typing import Any
 from typing import Dict
+from typing import Tuple
 from urllib.parse import urlparse
 
 import requests
 from loguru import logger
 
+try:
+    import orjson as json
+except ImportError:
+    import json
+
+try:
+    from databricks.sdk import WorkspaceClient
+except ImportError:
+    WorkspaceClient = None  # type: ignore[misc, assignment]
+
+from dbrx_api.dbrx_auth.shared_client import shared_workspace_clients
+from dbrx_api.dbrx_auth.token_gen import get_auth_token
+from dbrx_api.dltshr.async_client import aget_recipient
 from dbrx_api.workflow.db.repository_pipeline import PipelineRepository
 from dbrx_api.workflow.db.repository_recipient import RecipientRepository
 from dbrx_api.workflow.db.repository_share import ShareRepository
+from dbrx_api.workflow.orchestrator.concurrency import rollback_by_resource
+from dbrx_api.workflow.orchestrator.concurrency import run_sync
+from dbrx_api.workflow.orchestrator.config_index import index_config
 from dbrx_api.workflow.orchestrator.db_persist import persist_pipelines_to_db
-from dbrx_api.workflow.orchestrator.db_persist import persist_recipients_to_db
-from dbrx_api.workflow.orchestrator.db_persist import persist_shares_to_db
+from dbrx_api.workflow.orchestrator.db_persist import persist_recipients_and_shares_to_db
 from dbrx_api.workflow.orchestrator.db_persist import propagate_share_ids_to_pipelines
+from dbrx_api.workflow.orchestrator.pipeline_flow import _V1_SCHEDULE_FIELDS
 from dbrx_api.workflow.orchestrator.pipeline_flow import _rollback_pipelines
+from dbrx_api.workflow.orchestrator.pipeline_flow import _single_schedule_asset
 from dbrx_api.workflow.orchestrator.pipeline_flow import check_and_sync_pipelines_for_added_assets
 from dbrx_api.workflow.orchestrator.pipeline_flow import delete_pipelines_for_removed_assets
 from dbrx_api.workflow.orchestrator.pipeline_flow import ensure_pipelines
@@ -30,6 +55,100 @@ from dbrx_api.workflow.orchestrator.share_flow import _rollback_shares
 from dbrx_api.workflow.orchestrator.share_flow import ensure_shares
 from dbrx_api.workflow.orchestrator.status_tracker import StatusTracker
 
+# Max concurrent Databricks lookups when verifying recipients referenced by shares
+RECIPIENT_LOOKUP_CONCURRENCY = 8
+
+# Metadata fields holding one or more comma-separated email addresses
+EMAIL_FIELDS = ("requestor", "contact_email", "configurator", "approver", "executive_team")
+
+_EMAIL_RE = re.compile(r"^[^@\s,]+@[^@\s,]+\.[^@\s,]+$")
+
+_BANNER = "=" * 80
+
+
+def _log_enabled(level: str) -> bool:
+    """Return True if at least one sink accepts records at the given level."""
+    return logger._core.min_level <= logger.level(level).no
+
+
+# Hostname suffixes accepted as Databricks workspaces
+_VALID_WORKSPACE_SUFFIXES = (".azuredatabricks.net", ".cloud.databricks.com", ".gcp.databricks.com")
+
+
+@functools.lru_cache(maxsize=256)
+def _classify_workspace_url(url: str) -> str:
+    """
+    Parse a workspace URL and return its hostname if it is a Databricks workspace.
+
+    Cached per URL since most share packs target a handful of workspaces.
+
+    Raises:
+        ValueError: If the hostname does not match a Databricks workspace suffix
+    """
+    hostname = urlparse(url).hostname or ""
+    if not hostname.endswith(_VALID_WORKSPACE_SUFFIXES):
+        raise ValueError(f"workspace_url does not match valid Databricks patterns: {url}")
+    return hostname
+
+
+# Successful DNS lookups: hostname -> resolved_at monotonic seconds
+_DNS_TTL_SECONDS = 60
+_dns_cache: Dict[str, float] = {}
+
+
+def _resolve_hostname(hostname: str) -> None:
+    """
+    Fail fast if the workspace hostname does not resolve.
+
+    DNS failures surface in well under a second, whereas a HEAD request to an
+    unresolvable host can sit on the full request timeout. Successful lookups
+    are cached briefly so repeated validations skip the resolver.
+
+    Raises:
+        ValueError: If the hostname cannot be resolved
+    """
+    now = time.monotonic()
+    resolved_at = _dns_cache.get(hostname)
+    if resolved_at is not None and now - resolved_at < _DNS_TTL_SECONDS:
+        return
+    try:
+        socket.getaddrinfo(hostname, 443, type=socket.SOCK_STREAM)
+    except socket.gaierror as e:
+        _dns_cache.pop(hostname, None)
+        raise ValueError(f"workspace_url hostname does not resolve: {hostname} ({e})")
+    _dns_cache[hostname] = now
+
+
+# Workspace reachability probe cache: hostname -> (HTTP status, probed_at monotonic seconds)
+_REACH_TTL_SECONDS = 300
+_REACH_CACHE_MAX = 256
+_reach_cache: "OrderedDict[str, Tuple[int, float]]" = OrderedDict()
+_SESSION = requests.Session()
+
+
+def _probe_workspace(workspace_url: str, hostname: str) -> int:
+    """
+    Return the HTTP status of a HEAD request to the workspace, cached per hostname.
+
+    Only 2xx/3xx/4xx responses are cached; server errors, timeouts and connection
+    errors are re-probed on the next call.
+    """
+    now = time.monotonic()
+    cached = _reach_cache.get(hostname)
+    if cached and now - cached[1] < _REACH_TTL_SECONDS:
+        _reach_cache.move_to_end(hostname)
+        logger.debug("Using cached reachability for {} (HTTP {})", hostname, cached[0])
+        return cached[0]
+
+    status = _SESSION.head(workspace_url, timeout=10, allow_redirects=True).status_code
+    if status >= 500:
+        return status
+    _reach_cache[hostname] = (status, now)
+    _reach_cache.move_to_end(hostname)
+    while len(_reach_cache) > _REACH_CACHE_MAX:
+        _reach_cache.popitem(last=False)
+    return status
+
 
 def validate_sharepack_config(config: Dict[str, Any]) -> None:
     """
@@ -52,9 +171,9 @@ def validate_sharepack_config(config: Dict[str, Any]) -> None:
     Raises:
         ValueError: If validation fails
     """
-    logger.info("=" * 80)
+    logger.info(_BANNER)
     logger.info("SHAREPACK CONFIGURATION VALIDATION")
-    logger.info("=" * 80)
+    logger.info(_BANNER)
 
     if not isinstance(config.get("metadata"), dict):
         raise ValueError("Share pack config must contain 'metadata' section")
@@ -102,8 +221,8 @@ def validate_sharepack_config(config: Dict[str, Any]) -> None:
 
         contact = recip.get("recipient")
         if contact is not None and str(contact).strip():
-            c = str(contact).strip()
-            if "@" not in c or "." not in c.split("@")[-1]:
+            # split() always yields at least one entry, and an empty entry fails the regex
+            if not all(_EMAIL_RE.fullmatch(c.strip()) for c in str(contact).split(",")):
                 raise ValueError(f"Recipient '{name}': invalid contact email in 'recipient': {contact!r}")
 
         token_expiry = recip.get("token_expiry")
@@ -192,9 +311,9 @@ def validate_sharepack_config(config: Dict[str, Any]) -> None:
                     if schedule.get("cron") and str(schedule.get("cron", "")).strip():
                         has_cron = True
                     else:
-                        schedule_keys = [k for k in schedule.keys() if k not in ("cron", "timezone")]
-                        if len(schedule_keys) == 1:
-                            nested = schedule.get(schedule_keys[0])
+                        asset_key = _single_schedule_asset(schedule, _V1_SCHEDULE_FIELDS)
+                        if asset_key is not None:
+                            nested = schedule.get(asset_key)
                             if isinstance(nested, str) and str(nested).strip().lower() == "continuous":
                                 is_continuous = True
                             elif isinstance(nested, dict) and nested.get("cron"):
@@ -207,24 +326,24 @@ def validate_sharepack_config(config: Dict[str, Any]) -> None:
                     )
 
         if not share_assets:
-            logger.debug(f"Share '{share_name}' has no share_assets, skipping pipeline validation")
+            logger.debug("Share '{}' has no share_assets, skipping pipeline validation", share_name)
             continue
 
-        pipeline_source_assets = set()
-        for pipeline in pipelines:
-            if isinstance(pipeline, dict):
-                source_asset = pipeline.get("source_asset")
-                if source_asset and str(source_asset).strip():
-                    pipeline_source_assets.add(str(source_asset).strip())
-
-        missing_pipelines = []
-        for asset in share_assets:
-            a = str(asset).strip()
-            if a not in pipeline_source_assets:
-                missing_pipelines.append(a)
-                logger.error(f"✗ Share asset '{a}' in share '{share_name}' has no corresponding pipeline")
-            else:
-                logger.info(f"✓ Share asset '{a}' has pipeline")
+        # Build both sides once and diff them as sets instead of probing per asset
+        pipeline_source_assets = {
+            str(p["source_asset"]).strip()
+            for p in pipelines
+            if isinstance(p, dict) and p.get("source_asset") and str(p["source_asset"]).strip()
+        }
+        asset_set = {str(asset).strip() for asset in share_assets}
+        missing_pipelines = sorted(asset_set - pipeline_source_assets)
+        matched = sorted(asset_set & pipeline_source_assets)
+
+        if _log_enabled("INFO"):
+            for a in matched:
+                logger.info("✓ Share asset '{}' has pipeline", a)
+        for a in missing_pipelines:
+            logger.error(f"✗ Share asset '{a}' in share '{share_name}' has no corresponding pipeline")
 
         if missing_pipelines:
             error_msg = (
@@ -239,9 +358,9 @@ def validate_sharepack_config(config: Dict[str, Any]) -> None:
             )
             raise ValueError(error_msg)
 
-    logger.info("=" * 80)
+    logger.info(_BANNER)
     logger.info("✓ ALL SHAREPACK VALIDATIONS PASSED")
-    logger.info("=" * 80)
+    logger.info(_BANNER)
 
 
 def validate_metadata(metadata: Dict[str, Any]) -> None:
@@ -261,22 +380,20 @@ def validate_metadata(metadata: Dict[str, Any]) -> None:
     Raises:
         ValueError: If any validation fails
     """
-    logger.info("=" * 80)
+    logger.info(_BANNER)
     logger.info("METADATA VALIDATION")
-    logger.info("=" * 80)
+    logger.info(_BANNER)
 
     # 1. Validate emails (already validated by Pydantic, but double-check for runtime safety)
-    email_fields = ["requestor", "contact_email", "configurator", "approver", "executive_team"]
-    for field in email_fields:
+    for field in EMAIL_FIELDS:
         if field in metadata:
             value = metadata[field]
-            emails = [email.strip() for email in value.split(",")]
-            for email in emails:
+            for email in (e.strip() for e in value.split(",")):
                 if not email:
-                    continue
-                if "@" not in email or "." not in email.split("@")[-1]:
+                    raise ValueError(f"{field} contains empty value in comma-separated list: {value!r}")
+                if not _EMAIL_RE.fullmatch(email):
                     raise ValueError(f"Invalid email in {field}: {email}")
-            logger.info(f"✓ {field}: {value}")
+            logger.info("✓ {}: {}", field, value)
 
     # 2. Validate delta_share_region (AM or EMEA)
     region = metadata.get("delta_share_region", "").upper()
@@ -310,26 +427,16 @@ def validate_metadata(metadata: Dict[str, Any]) -> None:
 
     # Parse URL and validate domain
     try:
-        parsed = urlparse(workspace_url)
-        hostname = parsed.hostname
-
-        # Check for valid Databricks patterns
-        valid_patterns = [
-            ".azuredatabricks.net",
-            ".cloud.databricks.com",
-            ".gcp.databricks.com",
-        ]
-
-        if not any(hostname.endswith(pattern) for pattern in valid_patterns):
-            raise ValueError(f"workspace_url does not match valid Databricks patterns: {workspace_url}")
+        hostname = _classify_workspace_url(workspace_url)
+        _resolve_hostname(hostname)
 
         # Check reachability (HEAD request with timeout)
         logger.info(f"Checking workspace URL reachability: {workspace_url}")
         try:
-            response = requests.head(workspace_url, timeout=10, allow_redirects=True)
-            if response.status_code >= 500:
-                raise ValueError(f"Workspace URL returned server error (HTTP {response.status_code}): {workspace_url}")
-            logger.info(f"✓ workspace_url is reachable: {workspace_url} (HTTP {response.status_code})")
+            status_code = _probe_workspace(workspace_url, hostname)
+            if status_code >= 500:
+                raise ValueError(f"Workspace URL returned server error (HTTP {status_code}): {workspace_url}")
+            logger.info(f"✓ workspace_url is reachable: {workspace_url} (HTTP {status_code})")
         except requests.exceptions.Timeout:
             raise ValueError(f"Workspace URL timed out (not reachable): {workspace_url}")
         except requests.exceptions.ConnectionError:
@@ -347,13 +454,6 @@ def validate_metadata(metadata: Dict[str, Any]) -> None:
     # 6. Validate authentication token works for this workspace
     logger.info("Validating authentication token for workspace...")
     try:
-        from datetime import datetime
-        from datetime import timezone
-
-        from databricks.sdk import WorkspaceClient
-
-        from dbrx_api.dbrx_auth.token_gen import get_auth_token
-
         # Generate token
         session_token = get_auth_token(datetime.now(timezone.utc))[0]
 
@@ -392,11 +492,12 @@ def validate_metadata(metadata: Dict[str, Any]) -> None:
         logger.warning(f"Could not test authentication (proceeding anyway): {test_error}")
         # Don't fail on import errors or other unexpected issues - just warn
 
-    logger.info("=" * 80)
+    logger.info(_BANNER)
     logger.info("✓ ALL METADATA VALIDATIONS PASSED")
-    logger.info("=" * 80)
+    logger.info(_BANNER)
 
 
+@shared_workspace_clients
 async def provision_sharepack_new(pool, share_pack: Dict[str, Any]):
     """
     Provision a share pack using NEW strategy (create all entities from scratch).
@@ -436,8 +537,6 @@ async def provision_sharepack_new(pool, share_pack: Dict[str, Any]):
     added_assets_per_share: list = []
 
     try:
-        import json
-
         # Parse config if it's a JSON string
         config = share_pack["config"]
         if isinstance(config, str):
@@ -450,69 +549,74 @@ async def provision_sharepack_new(pool, share_pack: Dict[str, Any]):
 
         # Validate metadata before proceeding
         current_step = "Step 0/9: Validating metadata and configuration"
-        await tracker.update(current_step)
+        tracker.update_async(current_step)
         validate_metadata(config["metadata"])
         validate_sharepack_config(config)
+        idx = index_config(config)
 
         # Step 1: Initialize and detect scope
         current_step = "Step 1/9: Initializing provisioning"
-        await tracker.update(current_step)
+        tracker.update_async(current_step)
 
-        has_recipients = bool(config.get("recipient"))
-        has_shares = bool(config.get("share"))
+        has_recipients = bool(idx.recipient_configs)
+        has_shares = bool(idx.share_configs)
         logger.info(f"Provisioning scope: recipients={has_recipients}, shares={has_shares}")
 
         # Step 2: Ensure recipients (Databricks only — no DB writes)
         if has_recipients:
             current_step = "Step 2/9: Creating/updating recipients"
-            await tracker.update(current_step)
+            tracker.update_async(current_step)
             await ensure_recipients(
                 workspace_url=workspace_url,
-                recipients_config=config["recipient"],
+                recipients_config=idx.recipient_configs,
                 rollback_list=recipient_rollback_list,
                 db_entries=recipient_db_entries,
                 created_resources=created_resources,
             )
         else:
             logger.info("No recipients in config - skipping recipient provisioning")
-            await tracker.update("Step 2/9: Skipping recipients (not in config)")
+            tracker.update_async("Step 2/9: Skipping recipients (not in config)")
 
         # Step 3: Validate recipient references in shares
         if has_shares:
             current_step = "Step 3/9: Validating recipient references"
-            await tracker.update(current_step)
+            tracker.update_async(current_step)
             logger.info("Validating that all recipients referenced in shares exist...")
 
-            # Get all recipients declared in YAML
-            yaml_recipients = {r["name"] for r in config["recipient"]}
-
-            # Get all recipients referenced in shares
-            referenced_recipients = set()
-            for share_config in config["share"]:
-                referenced_recipients.update(share_config.get("recipients", []))
-
-            # Find recipients not in YAML
-            unknown_recipients = referenced_recipients - yaml_recipients
+            # Find recipients referenced in shares but not declared in YAML
+            unknown_recipients = idx.referenced_recipients - idx.recipient_names
 
             if unknown_recipients:
                 logger.info(f"Found {len(unknown_recipients)} recipient(s) not in YAML, checking Databricks...")
-                from dbrx_api.dltshr.recipient import get_recipients
 
-                # Check if each unknown recipient exists in Databricks
+                # Check all unknown recipients in Databricks concurrently (bounded) over the
+                # shared async HTTP client, so lookups reuse pooled connections
+                session_token = (await run_sync(get_auth_token, datetime.now(timezone.utc)))[0]
+                sem = asyncio.Semaphore(RECIPIENT_LOOKUP_CONCURRENCY)
+
+                async def _check(name: str):
+                    async with sem:
+                        logger.debug("Checking if recipient '{}' exists in Databricks...", name)
+                        try:
+                            return name, await aget_recipient(name, workspace_url, session_token)
+                        except Exception as check_error:
+                            return name, check_error
+
+                results = await asyncio.gather(*[_check(n) for n in sorted(unknown_recipients)])
+
                 missing_recipients = []
-                for recipient_name in unknown_recipients:
-                    try:
-                        logger.debug(f"Checking if recipient '{recipient_name}' exists in Databricks...")
-                        existing = get_recipients(recipient_name, workspace_url)
-                        if existing:
-                            logger.info(f"✓ Recipient '{recipient_name}' found in Databricks (not in YAML)")
-                        else:
-                            logger.error(f"✗ Recipient '{recipient_name}' not found in YAML or Databricks")
-                            missing_recipients.append(recipient_name)
-                    except Exception as check_error:
-                        logger.warning(f"Could not verify recipient '{recipient_name}' in Databricks: {check_error}")
-                        logger.warning(f"Assuming recipient '{recipient_name}' exists (verification failed)")
-                        # Don't add to missing_recipients - assume it exists if verification fails
+                # aget_recipient returns None only for a 404; any other error (auth, throttling,
+                # transport) leaves existence unknown, so it fails validation instead of passing
+                unverified_recipients = []
+                for recipient_name, existing in results:
+                    if isinstance(existing, Exception):
+                        logger.error(f"✗ Could not verify recipient '{recipient_name}' in Databricks: {existing}")
+                        unverified_recipients.append(f"{recipient_name} ({existing})")
+                    elif existing:
+                        logger.info("✓ Recipient '{}' found in Databricks (not in YAML)", recipient_name)
+                    else:
+                        logger.error(f"✗ Recipient '{recipient_name}' not found in YAML or Databricks")
+                        missing_recipients.append(recipient_name)
 
                 if missing_recipients:
                     error_msg = (
@@ -528,17 +632,24 @@ async def provision_sharepack_new(pool, share_pack: Dict[str, Any]):
                     )
                     raise ValueError(error_msg)
 
+                if unverified_recipients:
+                    raise ValueError(
+                        f"Could not verify that recipients referenced in shares exist in Databricks:\n"
+                        f"  {', '.join(unverified_recipients)}\n\n"
+                        f"Please retry the share pack once the workspace is reachable."
+                    )
+
             logger.success("All recipient references validated successfully")
         else:
-            await tracker.update("Step 3/9: Skipping recipient validation (no shares)")
+            tracker.update_async("Step 3/9: Skipping recipient validation (no shares)")
 
         # Step 4: Create/update shares (Databricks only — no DB writes)
         if has_shares:
             current_step = "Step 4/9: Creating/updating shares"
-            await tracker.update(current_step)
+            tracker.update_async(current_step)
             await ensure_shares(
                 workspace_url=workspace_url,
-                shares_config=config["share"],
+                shares_config=idx.share_configs,
                 rollback_list=share_rollback_list,
                 db_entries=share_db_entries,
                 created_resources=created_resources,
@@ -564,15 +675,15 @@ async def provision_sharepack_new(pool, share_pack: Dict[str, Any]):
                     )
         else:
             logger.info("No shares in config - skipping share provisioning")
-            await tracker.update("Step 4/9: Skipping shares (not in config)")
+            tracker.update_async("Step 4/9: Skipping shares (not in config)")
 
         # Step 5/6: Ensure pipelines and schedules (Databricks only — no DB writes)
         if has_shares:
             current_step = "Step 5/9: Creating/updating DLT pipelines and schedules"
-            await tracker.update(current_step)
+            tracker.update_async(current_step)
             await ensure_pipelines(
                 workspace_url=workspace_url,
-                shares_config=config["share"],
+                shares_config=idx.share_configs,
                 rollback_list=pipeline_rollback_list,
                 db_entries=pipeline_db_entries,
                 created_resources=created_resources,
@@ -585,7 +696,7 @@ async def provision_sharepack_new(pool, share_pack: Dict[str, Any]):
             # of all Databricks changes (pipelines, shares, recipients) made this run.
             if added_assets_per_share:
                 current_step = "Step 5.5/9: Verifying pipelines for newly added share assets"
-                await tracker.update(current_step)
+                tracker.update_async(current_step)
                 await check_and_sync_pipelines_for_added_assets(
                     workspace_url=workspace_url,
                     added_assets_per_share=added_assets_per_share,
@@ -593,18 +704,16 @@ async def provision_sharepack_new(pool, share_pack: Dict[str, Any]):
                     pipeline_repo=pipeline_repo,
                 )
         else:
-            await tracker.update("Step 5/9: Skipping pipelines (no shares in config)")
+            tracker.update_async("Step 5/9: Skipping pipelines (no shares in config)")
 
         # Step 6: ALL Databricks ops succeeded → persist to DB
         current_step = "Step 6/9: Persisting to database"
-        await tracker.update(current_step)
-
-        configurator = config["metadata"]["configurator"]
-        if recipient_db_entries:
-            await persist_recipients_to_db(recipient_db_entries, share_pack_id, configurator, recipient_repo)
-        share_name_to_id = {}
-        if share_db_entries:
-            share_name_to_id = await persist_shares_to_db(share_db_entries, share_pack_id, share_repo)
+        tracker.update_async(current_step)
+
+        configurator = idx.metadata["configurator"]
+        share_name_to_id = await persist_recipients_and_shares_to_db(
+            recipient_db_entries, share_db_entries, share_pack_id, configurator, recipient_repo, share_repo
+        )
         if pipeline_db_entries:
             await persist_pipelines_to_db(
                 pipeline_db_entries, share_pack_id, share_name_to_id, share_repo, pipeline_repo
@@ -618,7 +727,7 @@ async def provision_sharepack_new(pool, share_pack: Dict[str, Any]):
         # NOTE: Cleanup only makes sense for UPDATE strategy where assets might be removed.
         # For NEW strategy, everything is brand new - there can't be orphaned pipelines.
         logger.info("Skipping pipeline cleanup for NEW strategy (no assets removed)")
-        await tracker.update("Step 7/9: Skipping pipeline cleanup (NEW strategy - not applicable)")
+        tracker.update_async("Step 7/9: Skipping pipeline cleanup (NEW strategy - not applicable)")
 
         # Step 8: Determine if any changes were made
         # Check if all db_entries have action='unchanged' (no changes)
@@ -669,8 +778,9 @@ async def provision_sharepack_new(pool, share_pack: Dict[str, Any]):
         await tracker.complete(completion_message)
 
     except Exception as e:
-        await tracker.fail(str(e), current_step or "Provisioning failed")
-        logger.error(f"Provisioning failed for {share_pack_id}: {e}", exc_info=True)
+        error_msg = str(e)
+        await tracker.fail(error_msg, current_step or "Provisioning failed")
+        logger.opt(exception=True).error("Provisioning failed for {}: {}", share_pack_id, error_msg)
         logger.warning(f"Resources created before failure: {created_resources}")
 
         # Rollback Databricks only — no DB cleanup needed (DB was never written).
@@ -690,7 +800,9 @@ async def provision_sharepack_new(pool, share_pack: Dict[str, Any]):
             logger.info("Rolling back pipeline changes in Databricks...")
             try:
                 await asyncio.wait_for(
-                    asyncio.to_thread(_rollback_pipelines, pipeline_rollback_list, workspace_url),
+                    rollback_by_resource(
+                        _rollback_pipelines, pipeline_rollback_list, workspace_url, key=lambda item: item[3]
+                    ),
                     timeout=120,
                 )
                 logger.info("Pipeline rollback complete.")
@@ -705,7 +817,9 @@ async def provision_sharepack_new(pool, share_pack: Dict[str, Any]):
             logger.info("Rolling back share changes in Databricks...")
             try:
                 await asyncio.wait_for(
-                    asyncio.to_thread(_rollback_shares, share_rollback_list, workspace_url),
+                    rollback_by_resource(
+                        _rollback_shares, share_rollback_list, workspace_url, key=lambda item: item[1]
+                    ),
                     timeout=120,
                 )
                 logger.info("Share rollback complete.")
@@ -718,7 +832,9 @@ async def provision_sharepack_new(pool, share_pack: Dict[str, Any]):
             logger.info("Rolling back recipient changes in Databricks...")
             try:
                 await asyncio.wait_for(
-                    asyncio.to_thread(_rollback_recipients, recipient_rollback_list, workspace_url),
+                    rollback_by_resource(
+                        _rollback_recipients, recipient_rollback_list, workspace_url, key=lambda item: item[1]
+                    ),
                     timeout=120,
                 )
                 logger.info("Recipient rollback complete.")
@@ -11,34 +11,195 @@ Optionally per-share explicit pipeline names to unschedule/delete.
   To avoid confusion, either list ALL pipeline names or omit the 'pipelines' section
   entirely so that every active pipeline for the share is deleted automatically.
 
-Order: pipelines -> shares -> recipients.
+Order: pipelines -> shares -> recipients. Shares are processed concurrently with
+each other, then recipients concurrently with each other (both bounded).
+
+Completed Databricks deletes are recorded in the idempotency log, so a redelivered
+share pack skips the deletes its earlier attempts already made. The log is cleared
+when a new config is uploaded under the same share_pack_id.
 """
 
-import json
+import asyncio
+import functools
+import re
 from typing import Any
+from typing import Awaitable
+from typing import Callable
 from typing import Dict
+from typing import FrozenSet
 from typing import List
 from typing import Optional
+from typing import Set
 from typing import Tuple
+from typing import Union
 from uuid import UUID
 
 from loguru import logger
 
+try:
+    import orjson as json
+except ImportError:
+    import json
+
+from dbrx_api.dbrx_auth.shared_client import shared_workspace_clients
 from dbrx_api.dltshr.recipient import delete_recipient
-from dbrx_api.dltshr.recipient import get_recipients
+from dbrx_api.dltshr.recipient import list_recipients
 from dbrx_api.dltshr.share import delete_share
-from dbrx_api.dltshr.share import get_shares
+from dbrx_api.dltshr.share import list_shares_all
+from dbrx_api.errors import DatabricksError
 from dbrx_api.jobs.dbrx_pipelines import delete_pipeline
 from dbrx_api.jobs.dbrx_pipelines import list_pipelines_with_search_criteria
 from dbrx_api.jobs.dbrx_schedule import delete_schedule_for_pipeline
+from dbrx_api.workflow.db.repository_idempotency import IdempotencyRepository
 from dbrx_api.workflow.db.repository_pipeline import PipelineRepository
 from dbrx_api.workflow.db.repository_recipient import RecipientRepository
 from dbrx_api.workflow.db.repository_share import ShareRepository
+from dbrx_api.workflow.orchestrator.concurrency import gather_bounded
+from dbrx_api.workflow.orchestrator.concurrency import run_sync
+from dbrx_api.workflow.orchestrator.resources import ApiResult
+from dbrx_api.workflow.orchestrator.resources import ApiStatus
 from dbrx_api.workflow.orchestrator.status_tracker import StatusTracker
 
 # Type alias for deferred soft-delete entries: (repo, entity_id, reason)
 _SoftDelete = Tuple[Any, UUID, str]
 
+# Prefetched existence result for an entity an earlier attempt of this share pack already deleted
+_DELETED_EARLIER = object()
+
+# Soft-deletes written per batch before yielding to other tasks on the event loop
+SOFT_DELETE_BATCH_SIZE = 1000
+
+
+class _PendingSoftDeletes:
+    """
+    Deferred soft-deletes, each entity queued at most once.
+
+    Keeps the ids already queued next to the entries, so every add is a set lookup
+    instead of a scan of the queue.
+    """
+
+    def __init__(self) -> None:
+        self.entries: List[_SoftDelete] = []
+        self.ids: Set[UUID] = set()
+
+    def add(self, repo: Any, entity_id: UUID, reason: str) -> None:
+        """Queue a soft-delete unless the entity is already queued."""
+        if entity_id not in self.ids:
+            self.ids.add(entity_id)
+            self.entries.append((repo, entity_id, reason))
+
+    def extend(self, other: "_PendingSoftDeletes") -> None:
+        """Queue every entry of other, in order."""
+        for entry in other.entries:
+            self.add(*entry)
+
+    def take(self) -> List[_SoftDelete]:
+        """Return the queued entries and empty the queue; taken entities stay deduplicated."""
+        entries, self.entries = self.entries, []
+        return entries
+
+
+class _PipelineReport:
+    """Per-share pipeline outcomes, logged as one summary line instead of a line per pipeline."""
+
+    def __init__(self) -> None:
+        self.deleted: List[str] = []
+        self.not_found: List[str] = []
+        self.failed: List[str] = []
+
+    def add(self, name: str, result: Any) -> None:
+        """Record the result of one _delete_explicit_pipeline call (True, False or an exception)."""
+        if isinstance(result, BaseException):
+            self.failed.append(name)
+        elif result:
+            self.deleted.append(name)
+        else:
+            self.not_found.append(name)
+
+    def __bool__(self) -> bool:
+        return bool(self.deleted or self.not_found or self.failed)
+
+
+class _ActionLog:
+    """
+    Write-ahead journal of the Databricks share/recipient deletes for one share pack.
+
+    Each delete goes through once(): its key is journaled STARTED right before the call
+    and queued as OK (or FAILED) after it. A redelivered DELETE share pack skips the
+    actions its earlier attempts completed (OK). A STARTED key left by a crashed attempt
+    is not trusted: the entity is looked up in Databricks again and only treated as gone
+    if it is really absent. OK and FAILED keys are written in the same transaction as the
+    soft-deletes they belong to.
+    """
+
+    def __init__(self, repo: IdempotencyRepository, share_pack_id: UUID, statuses: Dict[str, str]):
+        self.repo = repo
+        self.share_pack_id = share_pack_id
+        self.completed: Set[str] = {key for key, status in statuses.items() if status == "OK"}
+        for key, status in statuses.items():
+            if status == "STARTED":
+                logger.warning("Action {} was started by an earlier attempt, re-checking it in Databricks", key)
+        self.pending: List[str] = []
+        self.failed: List[str] = []
+
+    def done(self, key: str) -> bool:
+        """True if an earlier attempt completed this action."""
+        return key in self.completed
+
+    async def once(self, key: str, action: Callable[[], Awaitable[Any]]) -> bool:
+        """
+        Run action unless key is done, journaling it STARTED first.
+
+        Returns True if the action ran (and succeeded) in this call. The key is queued
+        as OK on success, or as FAILED if the action raised, for the next flush.
+        """
+        if self.done(key):
+            return False
+        await self.repo.record_status(self.share_pack_id, [key], "STARTED")
+        try:
+            await action()
+        except Exception:
+            self.failed.append(key)
+            raise
+        self.pending.append(key)
+        return True
+
+    async def flush(self, conn: Any) -> None:
+        """
+        Write queued keys on conn (inside the caller's transaction).
+
+        The queues are taken before writing, so keys recorded by tasks still running while
+        the write is in progress wait for the next flush; on failure the taken keys are put back.
+        """
+        pending, failed = self.pending, self.failed
+        self.pending, self.failed = [], []
+        try:
+            if pending:
+                await self.repo.record_completed(self.share_pack_id, pending, conn=conn)
+            if failed:
+                await self.repo.record_status(self.share_pack_id, failed, "FAILED", conn=conn)
+        except BaseException:
+            self.pending[:0] = pending
+            self.failed[:0] = failed
+            raise
+        self.completed.update(pending)
+
+
+# delete_schedule_for_pipeline result text when there is nothing to delete
+_SCHEDULE_MISSING_RE = re.compile(r"no schedules found|not found", re.IGNORECASE)
+
+
+def _config_name(item: Any, *keys: str) -> str:
+    """Stripped name of a config entry (a string, or a dict with the first present key); "" if none."""
+    if isinstance(item, str):
+        return item.strip()
+    if isinstance(item, dict):
+        for key in keys:
+            value = item.get(key)
+            if value:
+                return str(value).strip()
+    return ""
+
 
 def _recipient_names_from_config(config: Dict[str, Any]) -> List[str]:
     """
@@ -46,14 +207,8 @@ def _recipient_names_from_config(config: Dict[str, Any]) -> List[str]:
 
     Accepts list of strings or list of {name}.
     """
-    raw = config.get("recipient") or []
-    names = []
-    for item in raw:
-        if isinstance(item, str) and item.strip():
-            names.append(item.strip())
-        elif isinstance(item, dict) and item.get("name"):
-            names.append(str(item["name"]).strip())
-    return names
+    names = (_config_name(item, "name") for item in config.get("recipient") or ())
+    return [name for name in names if name]
 
 
 def _share_specs_from_config(config: Dict[str, Any]) -> List[Tuple[str, List[str]]]:
@@ -64,29 +219,19 @@ def _share_specs_from_config(config: Dict[str, Any]) -> List[Tuple[str, List[str
     {name, pipelines?: [...]}. pipelines can be list of strings
     (name_prefix) or list of {name_prefix}.
     """
-    raw = config.get("share") or []
     specs: List[Tuple[str, List[str]]] = []
-    for item in raw:
-        if isinstance(item, str) and item.strip():
-            specs.append((item.strip(), []))
-        elif isinstance(item, dict):
-            name = item.get("name")
-            if not name:
-                continue
-            pipeline_names = _extract_pipeline_names(item.get("pipelines") or [])
-            specs.append((str(name).strip(), pipeline_names))
+    for item in config.get("share") or ():
+        name = _config_name(item, "name")
+        if name:
+            pipelines = item.get("pipelines") if isinstance(item, dict) else None
+            specs.append((name, _extract_pipeline_names(pipelines or ())))
     return specs
 
 
 def _extract_pipeline_names(pipelines_raw: List[Any]) -> List[str]:
     """Extract pipeline name prefixes from a raw pipeline list."""
-    names = []
-    for p in pipelines_raw:
-        if isinstance(p, str) and p.strip():
-            names.append(p.strip())
-        elif isinstance(p, dict) and (p.get("name_prefix") or p.get("name")):
-            names.append(str(p.get("name_prefix") or p.get("name")).strip())
-    return names
+    names = (_config_name(p, "name_prefix", "name") for p in pipelines_raw)
+    return [name for name in names if name]
 
 
 def _handle_schedule_result(sch_result: Any, pipeline_name: str, action: str = "delete schedule for") -> None:
@@ -95,61 +240,95 @@ def _handle_schedule_result(sch_result: Any, pipeline_name: str, action: str = "
 
     Raises RuntimeError on error; logs info if schedule not found.
     """
-    if not isinstance(sch_result, str):
-        return
-    lower = sch_result.lower()
-    if "no schedules found" in lower or ("not found" in lower and "error" not in lower):
-        logger.info("Schedule for pipeline '{}' does not exist in Databricks, skipping", pipeline_name)
-    elif "error" in lower:
+    outcome = ApiResult.of_message(sch_result, missing=_SCHEDULE_MISSING_RE)
+    if outcome.status is ApiStatus.NOT_FOUND:
+        logger.debug("Schedule for pipeline '{}' does not exist in Databricks, skipping", pipeline_name)
+    elif outcome.status is ApiStatus.ERROR:
         raise RuntimeError(f"Failed to {action} pipeline {pipeline_name}: {sch_result}")
 
 
+def _list_workspace_pipeline_ids(workspace_url: str) -> Dict[str, str]:
+    """Map every pipeline name in the workspace to its pipeline_id, keeping the first per name (one paged listing)."""
+    ids: Dict[str, str] = {}
+    for p in list_pipelines_with_search_criteria(dltshr_workspace_url=workspace_url, filter_expr=""):
+        if p.name:
+            ids.setdefault(str(p.name), p.pipeline_id)
+    return ids
+
+
+def _index_by_pipeline_name(pipelines_list: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Index pre-loaded pipeline records by pipeline_name, keeping the first record per name."""
+    index: Dict[str, Dict[str, Any]] = {}
+    for rec in pipelines_list:
+        name = rec.get("pipeline_name")
+        if name:
+            index.setdefault(name, rec)
+    return index
+
+
 def _queue_pipeline_soft_delete(
     pipeline_name: str,
-    pipelines_list: List[Dict[str, Any]],
+    pipeline_index: Dict[str, Dict[str, Any]],
     pipeline_repo: PipelineRepository,
     share_pack_id: str,
-    pending_soft_deletes: List[_SoftDelete],
+    pending_soft_deletes: _PendingSoftDeletes,
     suffix: str = "",
 ) -> None:
-    """Append a pipeline soft-delete entry if the pipeline exists in the pre-loaded list."""
-    for rec in pipelines_list:
-        if rec.get("pipeline_name") == pipeline_name:
-            pending_soft_deletes.append(
-                (pipeline_repo, rec["pipeline_id"], f"DELETE strategy: share pack {share_pack_id}{suffix}")
-            )
-            break
+    """Queue a pipeline soft-delete if the pipeline exists in the pre-loaded records."""
+    rec = pipeline_index.get(pipeline_name)
+    if rec is not None:
+        pending_soft_deletes.add(
+            pipeline_repo, rec["pipeline_id"], f"DELETE strategy: share pack {share_pack_id}{suffix}"
+        )
+
+
+async def _load_pipeline_records(
+    pipeline_names: List[str],
+    pipeline_repo: PipelineRepository,
+    records_by_name: Dict[str, List[Dict[str, Any]]],
+) -> None:
+    """
+    Fill records_by_name (the run's pipeline record cache) for names not looked up yet.
+
+    Records include soft-deleted ones (include_deleted=True); missing names are fetched
+    with one query and cached, also when nothing is found, so no name is queried twice.
+    """
+    missing = [name for name in dict.fromkeys(pipeline_names) if name not in records_by_name]
+    if missing:
+        records_by_name.update(await pipeline_repo.list_by_pipeline_names(missing, include_deleted=True))
 
 
 async def _sync_pipeline_db_soft_delete(
     pipeline_name: str,
     pipeline_repo: PipelineRepository,
     share_pack_id: str,
-    pending_soft_deletes: List[_SoftDelete],
+    pending_soft_deletes: _PendingSoftDeletes,
     suffix: str = "",
+    records_by_name: Optional[Dict[str, List[Dict[str, Any]]]] = None,
 ) -> None:
     """
     Look up the pipeline by name in DB and queue a soft-delete for any record not already queued.
 
-    Handles pipelines not in the pre-loaded pipelines_list — e.g. API-created pipelines
+    Handles pipelines not in the pre-loaded pipeline records — e.g. API-created pipelines
     with share_id=NULL, or records belonging to a different share_pack.
     include_deleted=True is intentional here: this function is specifically for queuing
     soft-deletes, so we want to find all records (active or already soft-deleted) to
     ensure stale entries are also cleaned up. Calling soft_delete on an already-deleted
     record is a no-op.
+
+    records_by_name is the run's pipeline record cache (see _load_pipeline_records);
+    active records are preferred, falling back to soft-deleted ones.
     """
+    if records_by_name is None:
+        records_by_name = {}
     try:
-        already_queued_ids: set = {eid for (_, eid, _) in pending_soft_deletes}
-        records = await pipeline_repo.list_by_pipeline_name(pipeline_name, include_deleted=False)
-        if not records:
-            records = await pipeline_repo.list_by_pipeline_name(pipeline_name, include_deleted=True)
+        await _load_pipeline_records([pipeline_name], pipeline_repo, records_by_name)
+        all_records = records_by_name[pipeline_name]
+        records = [rec for rec in all_records if not rec.get("is_deleted")] or all_records
         for rec in records:
-            pid = rec["pipeline_id"]
-            if pid not in already_queued_ids:
-                pending_soft_deletes.append(
-                    (pipeline_repo, pid, f"DELETE strategy: share pack {share_pack_id}{suffix}")
-                )
-                already_queued_ids.add(pid)
+            pending_soft_deletes.add(
+                pipeline_repo, rec["pipeline_id"], f"DELETE strategy: share pack {share_pack_id}{suffix}"
+            )
     except Exception as e:  # pylint: disable=broad-except
         logger.debug("Could not look up pipeline '{}' for DB soft-delete: {}", pipeline_name, e)
 
@@ -157,34 +336,32 @@ async def _sync_pipeline_db_soft_delete(
 async def _delete_explicit_pipeline(
     name_prefix: str,
     workspace_url: str,
+    ws_pipeline_ids: Dict[str, str],
     share_id: Optional[UUID],
-    pipelines_list: List[Dict[str, Any]],
+    pipeline_index: Dict[str, Dict[str, Any]],
     pipeline_repo: PipelineRepository,
     share_pack_id: str,
-    pending_soft_deletes: List[_SoftDelete],
-) -> None:
+    pending_soft_deletes: _PendingSoftDeletes,
+    records_by_name: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+) -> bool:
     """
     Delete a single pipeline from Databricks and queue its DB soft-delete.
 
+    Returns True if the pipeline was deleted, False if it did not exist in Databricks.
+
     Queues a DB soft-delete even when the pipeline is not found in Databricks.
     Always syncs the DB record regardless of how the pipeline was originally discovered
-    (covers API-created pipelines with share_id=NULL that are not in pipelines_list).
-    """
-    dbrx_pipelines = list_pipelines_with_search_criteria(
-        dltshr_workspace_url=workspace_url,
-        filter_expr=name_prefix,
-    )
-    databricks_pipeline_id: Optional[str] = None
-    for p in dbrx_pipelines:
-        if p.name == name_prefix:
-            databricks_pipeline_id = p.pipeline_id
-            break
+    (covers API-created pipelines with share_id=NULL that are not in pipeline_index).
 
+    ws_pipeline_ids is the run's name -> pipeline_id listing of the workspace; deleted
+    pipelines are removed from it so later lookups see them as gone.
+    """
+    databricks_pipeline_id = ws_pipeline_ids.get(name_prefix)
     if databricks_pipeline_id is None:
-        logger.info("Pipeline '{}' does not exist in Databricks, skipping deletion", name_prefix)
+        logger.debug("Pipeline '{}' does not exist in Databricks, skipping deletion", name_prefix)
         _queue_pipeline_soft_delete(
             name_prefix,
-            pipelines_list,
+            pipeline_index,
             pipeline_repo,
             share_pack_id,
             pending_soft_deletes,
@@ -197,42 +374,68 @@ async def _delete_explicit_pipeline(
             share_pack_id,
             pending_soft_deletes,
             suffix=" (not found in Databricks)",
+            records_by_name=records_by_name,
         )
-        return
+        return False
 
-    sch_result = delete_schedule_for_pipeline(dltshr_workspace_url=workspace_url, pipeline_id=databricks_pipeline_id)
+    sch_result = await run_sync(
+        delete_schedule_for_pipeline, dltshr_workspace_url=workspace_url, pipeline_id=databricks_pipeline_id
+    )
     _handle_schedule_result(sch_result, name_prefix)
 
-    result = delete_pipeline(dltshr_workspace_url=workspace_url, pipeline_id=databricks_pipeline_id)
+    result = await run_sync(delete_pipeline, dltshr_workspace_url=workspace_url, pipeline_id=databricks_pipeline_id)
     if result is not None:
         raise RuntimeError(f"Failed to delete pipeline {name_prefix}: {result}")
-    logger.info("Deleted pipeline: {}", name_prefix)
-    _queue_pipeline_soft_delete(name_prefix, pipelines_list, pipeline_repo, share_pack_id, pending_soft_deletes)
+    logger.debug("Deleted pipeline: {}", name_prefix)
+    ws_pipeline_ids.pop(name_prefix, None)
+    _queue_pipeline_soft_delete(name_prefix, pipeline_index, pipeline_repo, share_pack_id, pending_soft_deletes)
     # Also look up fresh — catches records not in the pre-loaded list (e.g. share_id=NULL)
-    await _sync_pipeline_db_soft_delete(name_prefix, pipeline_repo, share_pack_id, pending_soft_deletes)
+    await _sync_pipeline_db_soft_delete(
+        name_prefix, pipeline_repo, share_pack_id, pending_soft_deletes, records_by_name=records_by_name
+    )
+    return True
 
 
 async def _delete_explicit_pipelines_for_share(
     explicit_pipeline_names: List[str],
     workspace_url: str,
+    ws_pipeline_ids: Dict[str, str],
     share_id: Optional[UUID],
-    pipelines_list: List[Dict[str, Any]],
+    pipeline_index: Dict[str, Dict[str, Any]],
     pipeline_repo: PipelineRepository,
     share_pack_id: str,
-    pending_soft_deletes: List[_SoftDelete],
+    pending_soft_deletes: _PendingSoftDeletes,
+    report: _PipelineReport,
+    records_by_name: Optional[Dict[str, List[Dict[str, Any]]]] = None,
 ) -> None:
-    """Delete all explicitly-listed pipelines for a share."""
-    for name_prefix in explicit_pipeline_names:
-        await _delete_explicit_pipeline(
+    """
+    Delete all explicitly-listed pipelines for a share, recording each outcome in report.
+
+    Pipelines are deleted concurrently (bounded); every listed pipeline is attempted, then
+    the first failure is raised.
+    """
+    names = list(dict.fromkeys(explicit_pipeline_names))
+
+    async def delete_one(name_prefix: str) -> bool:
+        return await _delete_explicit_pipeline(
             name_prefix,
             workspace_url,
+            ws_pipeline_ids,
             share_id,
-            pipelines_list,
+            pipeline_index,
             pipeline_repo,
             share_pack_id,
             pending_soft_deletes,
+            records_by_name,
         )
 
+    results = await gather_bounded(delete_one, names)
+    for name, result in zip(names, results):
+        report.add(name, result)
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+
 
 def _candidates_from_db(db_pipelines: List[Dict[str, Any]]) -> List[tuple]:
     """Build (pipeline_name, source_asset) candidates from pre-loaded DB records."""
@@ -248,14 +451,15 @@ def _candidates_from_databricks(
     share_name: str,
     share_id: Optional[UUID],
     share_rec: Optional[Dict[str, Any]],
-    workspace_url: str,
+    ws_pipeline_ids: Dict[str, str],
 ) -> List[tuple]:
     """
-    Build (pipeline_name, source_asset) candidates by searching Databricks.
+    Build (pipeline_name, source_asset) candidates by searching the workspace pipeline listing.
 
     Used as fallback when the DB has no active records for the share.
 
-    Searches by share name as a substring of pipeline names.
+    Searches by share name as a case-insensitive substring of pipeline names, matching
+    the Databricks name filter the listing used to be fetched with.
     Full asset paths (e.g., 'catalog.schema.table') are NOT suitable search terms because
     Databricks filters on pipeline names — names virtually never contain full table paths.
     Pipeline names typically include the share name as a prefix or part of the name.
@@ -269,23 +473,8 @@ def _candidates_from_databricks(
         share_id,
     )
 
-    candidates: List[tuple] = []
-    seen_names: set = set()
-    try:
-        dbrx_hits = list_pipelines_with_search_criteria(
-            dltshr_workspace_url=workspace_url,
-            filter_expr=share_name,
-        )
-        for p in dbrx_hits:
-            if p.name and str(p.name) not in seen_names:
-                seen_names.add(str(p.name))
-                candidates.append((str(p.name), ""))
-    except Exception as search_err:  # pylint: disable=broad-except
-        logger.warning(
-            "Databricks search for share '{}' failed: {}",
-            share_name,
-            search_err,
-        )
+    needle = share_name.lower()
+    candidates: List[tuple] = [(name, "") for name in ws_pipeline_ids if needle in name.lower()]
 
     if not candidates:
         logger.info(
@@ -301,6 +490,7 @@ async def _filter_candidates_to_share(
     candidates: List[tuple],
     share_id: UUID,
     pipeline_repo: PipelineRepository,
+    records_by_name: Dict[str, List[Dict[str, Any]]],
 ) -> List[tuple]:
     """
     Filter Databricks-discovered pipeline candidates to only those linked to share_id in the DB.
@@ -315,10 +505,14 @@ async def _filter_candidates_to_share(
     - Active DB record with share_id == current share → keep.
     - Active DB record with share_id == different share → skip (cross-share hit).
     - No active DB record at all → keep (un-tracked pipeline; downstream guards will decide).
+
+    Records are read through the run's pipeline record cache (records_by_name), which also
+    serves the soft-delete lookups for the same names afterwards.
     """
     filtered: List[tuple] = []
+    await _load_pipeline_records([name for name, _ in candidates], pipeline_repo, records_by_name)
     for pipeline_name, source_asset in candidates:
-        records = await pipeline_repo.list_by_pipeline_name(pipeline_name, include_deleted=False)
+        records = [rec for rec in records_by_name[pipeline_name] if not rec.get("is_deleted")]
 
         if not records:
             # Not in DB as active — cannot determine ownership; include for best-effort deletion
@@ -340,13 +534,17 @@ async def _delete_implicit_pipelines(
     share_id: Optional[UUID],
     share_id_to_pipelines: Dict[UUID, List[Dict[str, Any]]],
     workspace_url: str,
+    ws_pipeline_ids: Dict[str, str],
     pipeline_repo: PipelineRepository,
     share_pack_id: str,
-    pending_soft_deletes: List[_SoftDelete],
+    pending_soft_deletes: _PendingSoftDeletes,
+    report: _PipelineReport,
     share_rec: Optional[Dict[str, Any]] = None,
+    records_by_name: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+    exclude: FrozenSet[str] = frozenset(),
 ) -> None:
     """
-    Delete schedule + pipeline for all pipelines associated with a share when none are explicitly listed.
+    Delete schedule + pipeline for all pipelines associated with a share not handled explicitly.
 
     Discovery order:
     1. Active DB records linked to this share (is_deleted=false, is_current=true).
@@ -357,83 +555,126 @@ async def _delete_implicit_pipelines(
 
     After finding a pipeline name, reuses _delete_explicit_pipeline which searches Databricks
     by exact name (authoritative source of truth), deletes schedule + pipeline, and queues
-    a DB soft-delete.
+    a DB soft-delete. Names in exclude (the share's explicit pass) are not processed again.
+    Outcomes are recorded in report.
     """
+    if records_by_name is None:
+        records_by_name = {}
     db_pipelines: List[Dict[str, Any]] = share_id_to_pipelines.get(share_id, []) if share_id else []
+    pipeline_index = _index_by_pipeline_name(db_pipelines)
 
     if db_pipelines:
         candidates = _candidates_from_db(db_pipelines)
     else:
-        candidates = _candidates_from_databricks(share_name, share_id, share_rec, workspace_url)
+        candidates = _candidates_from_databricks(share_name, share_id, share_rec, ws_pipeline_ids)
         # Filter cross-share hits: Databricks search by share name can return pipelines
         # from OTHER shares. Only keep candidates that are actually linked to this share.
         if candidates and share_id:
-            candidates = await _filter_candidates_to_share(candidates, share_id, pipeline_repo)
+            candidates = await _filter_candidates_to_share(candidates, share_id, pipeline_repo, records_by_name)
 
     if not candidates:
-        logger.info("No pipelines found for share '{}', nothing to delete", share_name)
+        logger.debug("No pipelines found for share '{}', nothing to delete", share_name)
         return
+    if exclude:
+        candidates = [(name, source) for name, source in candidates if name not in exclude]
+        if not candidates:
+            logger.debug("All pipelines for share '{}' were covered by the explicit list", share_name)
+            return
 
-    logger.info(
+    logger.debug(
         "Implicit DELETE: processing {} pipeline(s) for share '{}'",
         len(candidates),
         share_name,
     )
-    for pipeline_name, _ in candidates:
-        try:
-            await _delete_explicit_pipeline(
-                name_prefix=pipeline_name,
-                workspace_url=workspace_url,
-                share_id=share_id,
-                pipelines_list=list(db_pipelines),
-                pipeline_repo=pipeline_repo,
-                share_pack_id=share_pack_id,
-                pending_soft_deletes=pending_soft_deletes,
-            )
-        except Exception as e:  # pylint: disable=broad-except
-            logger.warning("Failed to delete implicit pipeline '{}': {}", pipeline_name, e)
+
+    async def delete_one(pipeline_name: str) -> bool:
+        return await _delete_explicit_pipeline(
+            name_prefix=pipeline_name,
+            workspace_url=workspace_url,
+            ws_pipeline_ids=ws_pipeline_ids,
+            share_id=share_id,
+            pipeline_index=pipeline_index,
+            pipeline_repo=pipeline_repo,
+            share_pack_id=share_pack_id,
+            pending_soft_deletes=pending_soft_deletes,
+            records_by_name=records_by_name,
+        )
+
+    # Pipelines are independent of each other: delete them concurrently (bounded)
+    names = list(dict.fromkeys(pipeline_name for pipeline_name, _ in candidates))
+    for pipeline_name, result in zip(names, await gather_bounded(delete_one, names)):
+        if isinstance(result, BaseException) and not isinstance(result, (RuntimeError, DatabricksError)):
+            raise result
+        if isinstance(result, BaseException):
+            logger.warning("Failed to delete implicit pipeline '{}': {}", pipeline_name, result)
+        report.add(pipeline_name, result)
 
 
 async def _delete_share_record(
     share_name: str,
     workspace_url: str,
+    existing_share: Any,
     share_rec: Optional[Dict[str, Any]],
+    share_records: List[Dict[str, Any]],
     share_repo: ShareRepository,
     share_pack_id: str,
-    pending_soft_deletes: List[_SoftDelete],
-) -> None:
-    """Delete share from Databricks and queue DB soft-delete entry."""
-    existing_share = get_shares(share_name=share_name, dltshr_workspace_url=workspace_url)
+    pending_soft_deletes: _PendingSoftDeletes,
+    action_log: _ActionLog,
+) -> bool:
+    """
+    Delete share from Databricks and queue DB soft-delete entry.
+
+    existing_share is the prefetched listing entry (None if absent), the exception it raised, or
+    _DELETED_EARLIER; share_records are the prefetched DB rows for the name. The delete
+    runs through action_log.once. Returns True if the share was deleted from Databricks
+    by this call.
+    """
+    if isinstance(existing_share, BaseException):
+        raise existing_share
+    if existing_share is _DELETED_EARLIER:
+        logger.info("Share '{}' was deleted by an earlier attempt of this share pack, skipping", share_name)
+        for rec in share_records:
+            pending_soft_deletes.add(share_repo, rec["share_id"], f"DELETE strategy: share pack {share_pack_id}")
+        return False
     if existing_share is None:
         logger.info("Share '{}' does not exist in Databricks, skipping deletion", share_name)
-        for rec in await share_repo.list_by_share_name(share_name):
-            pending_soft_deletes.append(
-                (share_repo, rec["share_id"], f"DELETE strategy: share pack {share_pack_id} (not found in Databricks)")
+        for rec in share_records:
+            pending_soft_deletes.add(
+                share_repo, rec["share_id"], f"DELETE strategy: share pack {share_pack_id} (not found in Databricks)"
             )
-        return
+        return False
 
-    result = delete_share(share_name=share_name, dltshr_workspace_url=workspace_url)
-    if result is not None:
-        raise RuntimeError(f"Failed to delete share {share_name}: {result}")
+    async def delete() -> None:
+        result = await run_sync(delete_share, share_name=share_name, dltshr_workspace_url=workspace_url)
+        if result is not None:
+            raise RuntimeError(f"Failed to delete share {share_name}: {result}")
+
+    if not await action_log.once(f"del_share:{share_name}", delete):
+        return False
     logger.info("Deleted share: {}", share_name)
-    share_records = [share_rec] if share_rec else await share_repo.list_by_share_name(share_name)
-    for rec in share_records:
-        pending_soft_deletes.append((share_repo, rec["share_id"], f"DELETE strategy: share pack {share_pack_id}"))
+    for rec in [share_rec] if share_rec else share_records:
+        pending_soft_deletes.add(share_repo, rec["share_id"], f"DELETE strategy: share pack {share_pack_id}")
+    return True
 
 
 async def _process_share(
     share_name: str,
     explicit_pipeline_names: List[str],
     workspace_url: str,
+    ws_pipeline_ids: Dict[str, str],
     share_id: Optional[UUID],
     share_rec: Optional[Dict[str, Any]],
     share_id_to_pipelines: Dict[UUID, List[Dict[str, Any]]],
-    pipelines_list: List[Dict[str, Any]],
+    pipeline_index: Dict[str, Dict[str, Any]],
     pipeline_repo: PipelineRepository,
     share_repo: ShareRepository,
     share_pack_id: str,
-    pending_soft_deletes: List[_SoftDelete],
-) -> None:
+    pending_soft_deletes: _PendingSoftDeletes,
+    action_log: _ActionLog,
+    share_records: Optional[List[Dict[str, Any]]] = None,
+    pipeline_records_by_name: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+    existing_share: Any = None,
+) -> bool:
     """
     Handle pipeline cleanup and share deletion for one share entry.
 
@@ -441,22 +682,84 @@ async def _process_share(
 
     If explicit_pipeline_names is provided, those pipelines are deleted first.
     _delete_implicit_pipelines then runs unconditionally to catch any remaining
-    pipelines not covered by the explicit list. Pipelines already deleted in the
-    explicit pass are safely skipped (not found in Databricks → no-op).
+    pipelines not covered by the explicit list; names handled by the explicit pass
+    are excluded from it, so no pipeline is processed twice.
 
     NOTE: listing only SOME pipeline names does NOT preserve the rest. If you do
     not want all pipelines deleted, do not use the DELETE strategy. To avoid
     confusion, either list ALL pipeline names explicitly or omit the 'pipelines'
     section so all are deleted automatically without ambiguity.
+
+    Per-pipeline outcomes are logged at DEBUG; one INFO line summarises the share's pipelines,
+    also when a pipeline deletion fails.
+    Returns True if the share itself was deleted from Databricks.
     """
-    if explicit_pipeline_names:
+    report = _PipelineReport()
+    try:
+        await _delete_share_pipelines(
+            share_name,
+            explicit_pipeline_names,
+            workspace_url,
+            ws_pipeline_ids,
+            share_id,
+            share_rec,
+            share_id_to_pipelines,
+            pipeline_index,
+            pipeline_repo,
+            share_pack_id,
+            pending_soft_deletes,
+            report,
+            pipeline_records_by_name,
+        )
+    finally:
+        if report:
+            logger.info(
+                "Share '{}': pipelines deleted={} not_found={} failed={}{}",
+                share_name,
+                len(report.deleted),
+                len(report.not_found),
+                len(report.failed),
+                f" ({', '.join(report.deleted)})" if report.deleted else "",
+            )
+
+    return await _delete_share_record(
+        share_name,
+        workspace_url,
+        existing_share,
+        share_rec,
+        share_records or [],
+        share_repo,
+        share_pack_id,
+        pending_soft_deletes,
+        action_log,
+    )
+
+
+async def _delete_share_pipelines(
+    share_name: str,
+    explicit_pipeline_names: List[str],
+    workspace_url: str,
+    ws_pipeline_ids: Dict[str, str],
+    share_id: Optional[UUID],
+    share_rec: Optional[Dict[str, Any]],
+    share_id_to_pipelines: Dict[UUID, List[Dict[str, Any]]],
+    pipeline_index: Dict[str, Dict[str, Any]],
+    pipeline_repo: PipelineRepository,
+    share_pack_id: str,
+    pending_soft_deletes: _PendingSoftDeletes,
+    report: _PipelineReport,
+    pipeline_records_by_name: Optional[Dict[str, List[Dict[str, Any]]]],
+) -> None:
+    """Run the explicit pass, then the implicit pass, for one share's pipelines."""
+    explicit_set = frozenset(explicit_pipeline_names)
+    if explicit_set:
         # Warn when the explicit list does not cover all DB-tracked pipelines.
         # All pipelines belonging to a share are always fully deleted — unlisted ones
         # are NOT preserved. The user should either supply ALL pipeline names or omit
         # the 'pipelines' section entirely and let the implicit pass handle everything.
         db_pipelines_for_share = share_id_to_pipelines.get(share_id, []) if share_id else []
         db_pipeline_names = {str(p["pipeline_name"]) for p in db_pipelines_for_share if p.get("pipeline_name")}
-        unlisted = db_pipeline_names - set(explicit_pipeline_names)
+        unlisted = db_pipeline_names - explicit_set
         if unlisted:
             logger.warning(
                 "Share '{}': {} pipeline(s) tracked in DB are NOT in your explicit list: {}. "
@@ -471,34 +774,31 @@ async def _process_share(
         await _delete_explicit_pipelines_for_share(
             explicit_pipeline_names,
             workspace_url,
+            ws_pipeline_ids,
             share_id,
-            pipelines_list,
+            pipeline_index,
             pipeline_repo,
             share_pack_id,
             pending_soft_deletes,
+            report,
+            pipeline_records_by_name,
         )
 
     # Always run implicit deletion to ensure every remaining pipeline for this share
-    # is deleted in Databricks and DB. When called after an explicit pass, pipelines
-    # already deleted above are skipped gracefully (not found in Databricks → no-op).
+    # is deleted in Databricks and DB. Pipelines handled by the explicit pass are excluded.
     await _delete_implicit_pipelines(
         share_name=share_name,
         share_id=share_id,
         share_id_to_pipelines=share_id_to_pipelines,
         workspace_url=workspace_url,
+        ws_pipeline_ids=ws_pipeline_ids,
         pipeline_repo=pipeline_repo,
         share_pack_id=share_pack_id,
         pending_soft_deletes=pending_soft_deletes,
+        report=report,
         share_rec=share_rec,
-    )
-
-    await _delete_share_record(
-        share_name,
-        workspace_url,
-        share_rec,
-        share_repo,
-        share_pack_id,
-        pending_soft_deletes,
+        records_by_name=pipeline_records_by_name,
+        exclude=explicit_set,
     )
 
 
@@ -507,30 +807,49 @@ async def _process_recipient(
     workspace_url: str,
     recipient_repo: RecipientRepository,
     share_pack_id: str,
-    pending_soft_deletes: List[_SoftDelete],
-) -> None:
-    """Delete a single recipient from Databricks and queue its DB soft-delete."""
-    existing = get_recipients(recipient_name, workspace_url)
+    pending_soft_deletes: _PendingSoftDeletes,
+    recipient_records: List[Dict[str, Any]],
+    action_log: _ActionLog,
+    existing: Any = None,
+) -> bool:
+    """
+    Delete a single recipient from Databricks and queue its DB soft-delete.
+
+    existing is the prefetched listing entry (None if absent), the exception it raised, or
+    _DELETED_EARLIER; recipient_records are the prefetched DB rows for the name. The
+    delete runs through action_log.once. Returns True if the recipient was deleted from
+    Databricks by this call.
+    """
+    if isinstance(existing, BaseException):
+        raise existing
+    if existing is _DELETED_EARLIER:
+        logger.info("Recipient '{}' was deleted by an earlier attempt of this share pack, skipping", recipient_name)
+        for rec in recipient_records:
+            pending_soft_deletes.add(
+                recipient_repo, rec["recipient_id"], f"DELETE strategy: share pack {share_pack_id}"
+            )
+        return False
     if existing is None:
         logger.info("Recipient '{}' does not exist in Databricks, skipping deletion", recipient_name)
-        for rec in await recipient_repo.list_by_recipient_name(recipient_name):
-            pending_soft_deletes.append(
-                (
-                    recipient_repo,
-                    rec["recipient_id"],
-                    f"DELETE strategy: share pack {share_pack_id} (not found in Databricks)",
-                )
+        for rec in recipient_records:
+            pending_soft_deletes.add(
+                recipient_repo,
+                rec["recipient_id"],
+                f"DELETE strategy: share pack {share_pack_id} (not found in Databricks)",
             )
-        return
+        return False
+
+    async def delete() -> None:
+        result = await run_sync(delete_recipient, recipient_name=recipient_name, dltshr_workspace_url=workspace_url)
+        if isinstance(result, str):
+            raise RuntimeError(f"Failed to delete recipient {recipient_name}: {result}")
 
-    result = delete_recipient(recipient_name=recipient_name, dltshr_workspace_url=workspace_url)
-    if isinstance(result, str):
-        raise RuntimeError(f"Failed to delete recipient {recipient_name}: {result}")
+    if not await action_log.once(f"del_recipient:{recipient_name}", delete):
+        return False
     logger.info("Deleted recipient: {}", recipient_name)
-    for rec in await recipient_repo.list_by_recipient_name(recipient_name):
-        pending_soft_deletes.append(
-            (recipient_repo, rec["recipient_id"], f"DELETE strategy: share pack {share_pack_id}")
-        )
+    for rec in recipient_records:
+        pending_soft_deletes.add(recipient_repo, rec["recipient_id"], f"DELETE strategy: share pack {share_pack_id}")
+    return True
 
 
 def _load_delete_config(share_pack: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
@@ -540,7 +859,7 @@ def _load_delete_config(share_pack: Dict[str, Any]) -> Tuple[str, Dict[str, Any]
     Returns (workspace_url, config). Raises ValueError on invalid input.
     """
     config = share_pack["config"]
-    if isinstance(config, str):
+    if isinstance(config, (str, bytes)):
         config = json.loads(config)
     if not isinstance(config, dict):
         raise ValueError("Share pack config must be a dictionary")
@@ -553,11 +872,40 @@ def _load_delete_config(share_pack: Dict[str, Any]) -> Tuple[str, Dict[str, Any]
     return str(workspace_url).strip(), config
 
 
+@functools.lru_cache(maxsize=64)
+def _parse_delete_config_text(
+    raw: Union[str, bytes]
+) -> Tuple[str, Tuple[str, ...], Tuple[Tuple[str, Tuple[str, ...]], ...]]:
+    """
+    Parse a JSON config into (workspace_url, recipient_names, share_specs).
+
+    Cached per config text so a redelivered share pack skips the JSON parse and
+    validation; results are tuples so cached entries cannot be mutated by a run.
+    """
+    workspace_url, config = _load_delete_config({"config": raw})
+    share_specs = tuple((name, tuple(pipelines)) for name, pipelines in _share_specs_from_config(config))
+    return workspace_url, tuple(_recipient_names_from_config(config)), share_specs
+
+
+def _parse_delete_request(share_pack: Dict[str, Any]) -> Tuple[str, List[str], List[Tuple[str, List[str]]]]:
+    """Return (workspace_url, recipient_names, share_specs) for a share pack. Raises ValueError on invalid input."""
+    if isinstance(share_pack["config"], (str, bytes)):
+        workspace_url, recipient_names, share_specs = _parse_delete_config_text(share_pack["config"])
+        return workspace_url, list(recipient_names), [(name, list(pipelines)) for name, pipelines in share_specs]
+    workspace_url, config = _load_delete_config(share_pack)
+    return workspace_url, _recipient_names_from_config(config), _share_specs_from_config(config)
+
+
 async def _load_db_records(
     share_specs: List[Tuple[str, List[str]]],
     share_repo: ShareRepository,
     pipeline_repo: PipelineRepository,
-) -> Tuple[Dict[str, Dict[str, Any]], List[Dict[str, Any]], Dict[UUID, List[Dict[str, Any]]]]:
+) -> Tuple[
+    Dict[str, Dict[str, Any]],
+    Dict[str, List[Dict[str, Any]]],
+    List[Dict[str, Any]],
+    Dict[UUID, List[Dict[str, Any]]],
+]:
     """
     Load share and pipeline records from DB for all shares in the DELETE config.
 
@@ -570,55 +918,142 @@ async def _load_db_records(
     provisioned under a different share pack. We load by name/share_id across ALL
     share packs rather than filtering by this share_pack_id.
 
-    Returns (name_to_share, pipelines_list, share_id_to_pipelines).
-    """
-    name_to_share: Dict[str, Dict[str, Any]] = {}
-    for spec_share_name, _ in share_specs:
-        records = await share_repo.list_by_share_name(spec_share_name)
-        if records:
-            name_to_share[spec_share_name] = records[0]
+    Share records for all names are fetched with one query, and so are their pipelines.
 
+    Returns (name_to_share, share_records_by_name, pipelines_list, share_id_to_pipelines).
+    """
+    share_records_by_name = await share_repo.list_by_share_names([name for name, _ in share_specs])
+    name_to_share: Dict[str, Dict[str, Any]] = {
+        name: records[0] for name, records in share_records_by_name.items() if records
+    }
+
+    # Match pipelines by share name (all historical share_ids for the name) rather than by
+    # share_id, so that pipelines whose share_id FK is stale (e.g. from a provisioning run
+    # before share UUID reuse was enforced) are still found.
+    # Only active records (is_deleted=false) — soft-deleted pipeline = pipeline is gone.
+    pipelines_by_share_name = await pipeline_repo.list_by_share_names(list(name_to_share))
     pipelines_list: List[Dict[str, Any]] = []
     share_id_to_pipelines: Dict[UUID, List[Dict[str, Any]]] = {}
     for share_name_key, share_rec_entry in name_to_share.items():
-        sid: UUID = share_rec_entry["share_id"]
-        # Use list_by_share_name (subquery over all historical share_ids for this name)
-        # rather than list_by_share_id, so that pipelines whose share_id FK is stale
-        # (e.g. from a provisioning run before share UUID reuse was enforced) are still found.
-        # Only active records (is_deleted=false) — soft-deleted pipeline = pipeline is gone.
-        pips = await pipeline_repo.list_by_share_name(share_name_key)
+        pips = pipelines_by_share_name.get(share_name_key, [])
         pipelines_list.extend(pips)
-        share_id_to_pipelines[sid] = pips
+        share_id_to_pipelines[share_rec_entry["share_id"]] = pips
+
+    return name_to_share, share_records_by_name, pipelines_list, share_id_to_pipelines
+
+
+async def _prefetch_pipeline_records(
+    share_specs: List[Tuple[str, List[str]]],
+    pipelines_list: List[Dict[str, Any]],
+    pipeline_repo: PipelineRepository,
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Fetch DB records (including soft-deleted ones) for every pipeline name the DELETE is known to touch.
 
-    return name_to_share, pipelines_list, share_id_to_pipelines
+    Covers the explicit names in the config and the DB-tracked pipelines of the shares, in
+    one query instead of one or two per pipeline. Names found only through the Databricks
+    search fallback are still looked up individually.
+    """
+    names = {name for _, explicit in share_specs for name in explicit}
+    names.update(str(rec["pipeline_name"]) for rec in pipelines_list if rec.get("pipeline_name"))
+    return await pipeline_repo.list_by_pipeline_names(sorted(names), include_deleted=True)
 
 
-async def _persist_soft_deletes(pending: List[_SoftDelete], share_pack_id: str) -> Tuple[int, int]:
+async def _lookup_existing(
+    share_names: List[str],
+    recipient_names: List[str],
+    workspace_url: str,
+    action_log: _ActionLog,
+) -> Tuple[List[Any], List[Any]]:
+    """
+    Check which shares and recipients exist in Databricks, with one listing of each.
+
+    Deleting pipelines does not change whether a share or recipient exists, so the
+    workspace's shares and recipients are listed up front (both listings concurrently)
+    instead of one get per name inside each entity's delete. Names are matched
+    case-insensitively, as Unity Catalog does. Returns the listed ShareInfo /
+    RecipientInfo (None if absent) in name order; if a listing raised, each of its names
+    yields the exception in place of the result. Names an earlier attempt already deleted
+    yield _DELETED_EARLIER, and a listing whose names are all done is skipped.
+    """
+    list_fns = {"share": list_shares_all, "recipient": list_recipients}
+    names_by_kind = {"share": share_names, "recipient": recipient_names}
+    kinds = [
+        kind for kind, names in names_by_kind.items() if any(not action_log.done(f"del_{kind}:{n}") for n in names)
+    ]
+
+    async def listing(kind: str) -> Dict[str, Any]:
+        items = await run_sync(list_fns[kind], workspace_url)
+        return {str(item.name).lower(): item for item in items if item.name}
+
+    listed = dict(zip(kinds, await gather_bounded(listing, kinds)))
+
+    def resolve(kind: str, name: str) -> Any:
+        if action_log.done(f"del_{kind}:{name}"):
+            return _DELETED_EARLIER
+        found = listed[kind]
+        if isinstance(found, BaseException):
+            return found
+        return found.get(name.lower())
+
+    return [resolve("share", n) for n in share_names], [resolve("recipient", n) for n in recipient_names]
+
+
+async def _persist_soft_deletes(
+    pool: Any,
+    pending: List[_SoftDelete],
+    share_pack_id: str,
+    action_log: Optional[_ActionLog] = None,
+) -> Tuple[int, int]:
     """
     Flush all deferred soft-deletes to the database.
 
     Processes every entry even if individual soft-deletes fail so that a single
-    failure does not prevent other records from being updated.
+    failure does not prevent other records from being updated. Entries are grouped
+    by repository and each group is written with soft_delete_many, all on one pooled
+    connection and in one transaction (each record in its own savepoint), together with
+    the idempotency keys of the Databricks deletes completed since the last flush.
+    Large groups are written SOFT_DELETE_BATCH_SIZE at a time, yielding to other tasks
+    on the event loop between batches.
 
     Returns (success_count, failure_count) so callers can include results in the
     share pack completion message.
     """
     success = 0
     failures = 0
+    by_repo: Dict[Any, List[Tuple[UUID, str]]] = {}
     for repo, entity_id, reason in pending:
+        by_repo.setdefault(repo, []).append((entity_id, reason))
+    results_by_repo: Dict[Any, List[Any]] = {}
+    if by_repo or (action_log and (action_log.pending or action_log.failed)):
         try:
-            result = await repo.soft_delete(
-                entity_id,
-                deleted_by="orchestrator",
-                deletion_reason=reason,
-                request_source="share_pack",
-            )
+            async with pool.acquire() as conn:
+                async with conn.transaction():
+                    for repo, items in by_repo.items():
+                        results_by_repo[repo] = []
+                        for start in range(0, len(items), SOFT_DELETE_BATCH_SIZE):
+                            if start:
+                                await asyncio.sleep(0)
+                            results_by_repo[repo] += await repo.soft_delete_many(
+                                items[start : start + SOFT_DELETE_BATCH_SIZE],
+                                deleted_by="orchestrator",
+                                request_source="share_pack",
+                                conn=conn,
+                            )
+                    if action_log:
+                        await action_log.flush(conn)
+        except Exception as e:  # pylint: disable=broad-except
+            # Connection or commit failure: nothing was written
+            results_by_repo = {repo: [e] * len(items) for repo, items in by_repo.items()}
+    for repo, items in by_repo.items():
+        for (entity_id, _), result in zip(items, results_by_repo[repo]):
+            if isinstance(result, Exception):
+                failures += 1
+                logger.error("Failed to soft-delete entity {}: {}", entity_id, result)
+                continue
             if result is None:
                 logger.debug("Soft-delete no-op for entity {} (not found or already deleted)", entity_id)
             success += 1
-        except Exception as e:  # pylint: disable=broad-except
-            failures += 1
-            logger.error("Failed to soft-delete entity {}: {}", entity_id, e)
     if pending:
         logger.info(
             "DB soft-delete complete for share pack {}: {} succeeded, {} failed",
@@ -629,6 +1064,33 @@ async def _persist_soft_deletes(pending: List[_SoftDelete], share_pack_id: str)
     return success, failures
 
 
+async def _merge_or_raise(
+    pool: Any,
+    outcomes: List[_PendingSoftDeletes],
+    results: List[Any],
+    pending_soft_deletes: _PendingSoftDeletes,
+    share_pack_id: str,
+    action_log: Optional[_ActionLog] = None,
+) -> None:
+    """
+    Merge per-entity soft-delete lists (in config order) after a concurrent step.
+
+    If any entity failed, the soft-deletes queued so far are persisted before the failures
+    are raised: sibling entities kept running, so their Databricks deletes already happened
+    and the DB must not keep reporting them as active. A single failure is re-raised as-is;
+    several are raised together as one ExceptionGroup whose message lists every error.
+    """
+    for outcome in outcomes:
+        pending_soft_deletes.extend(outcome)
+    errors = [r for r in results if isinstance(r, BaseException)]
+    if not errors:
+        return
+    await _persist_soft_deletes(pool, pending_soft_deletes.take(), share_pack_id, action_log)
+    if len(errors) == 1 or not all(isinstance(err, Exception) for err in errors):
+        raise errors[0]
+    raise ExceptionGroup(f"DELETE failed for {len(errors)} entities: " + "; ".join(str(err) for err in errors), errors)
+
+
 def _build_delete_summary(
     share_specs: List[Tuple[str, List[str]]],
     recipient_names: List[str],
@@ -651,6 +1113,7 @@ def _build_delete_summary(
     return summary
 
 
+@shared_workspace_clients
 async def provision_sharepack_delete(pool: Any, share_pack: Dict[str, Any]) -> None:
     """
     Provision a share pack using DELETE strategy (name-only config).
@@ -674,9 +1137,7 @@ async def provision_sharepack_delete(pool: Any, share_pack: Dict[str, Any]) -> N
     current_step = ""
 
     try:
-        workspace_url, config = _load_delete_config(share_pack)
-        recipient_names = _recipient_names_from_config(config)
-        share_specs = _share_specs_from_config(config)
+        workspace_url, recipient_names, share_specs = _parse_delete_request(share_pack)
         if not recipient_names and not share_specs:
             raise ValueError(
                 "DELETE strategy requires at least one recipient or one share to delete. "
@@ -686,49 +1147,100 @@ async def provision_sharepack_delete(pool: Any, share_pack: Dict[str, Any]) -> N
         recipient_repo = RecipientRepository(pool)
         share_repo = ShareRepository(pool)
         pipeline_repo = PipelineRepository(pool)
-        pending_soft_deletes: List[_SoftDelete] = []
+        idempotency_repo = IdempotencyRepository(pool)
+        pending_soft_deletes = _PendingSoftDeletes()
 
         current_step = "Step 1/4: Loading DB records for DELETE"
-        await tracker.update(current_step)
-        name_to_share, pipelines_list, share_id_to_pipelines = await _load_db_records(
-            share_specs, share_repo, pipeline_repo
+        tracker.update_async(current_step)
+        if share_specs:
+            name_to_share, share_records_by_name, pipelines_list, share_id_to_pipelines = await _load_db_records(
+                share_specs, share_repo, pipeline_repo
+            )
+            pipeline_records_by_name = await _prefetch_pipeline_records(share_specs, pipelines_list, pipeline_repo)
+            # Building the indexes is CPU-only; yield around it so other runs on the loop are not starved
+            await asyncio.sleep(0)
+            pipeline_index = _index_by_pipeline_name(pipelines_list)
+            await asyncio.sleep(0)
+        else:
+            # Recipient-only DELETE: no share or pipeline records to load or index
+            name_to_share, share_records_by_name, share_id_to_pipelines = {}, {}, {}
+            pipeline_records_by_name, pipeline_index = {}, {}
+        recipient_records_by_name = (
+            await recipient_repo.list_by_recipient_names(recipient_names) if recipient_names else {}
         )
+        action_log = _ActionLog(idempotency_repo, share_pack_id, await idempotency_repo.list_statuses(share_pack_id))
 
         current_step = "Step 2/4: Deleting pipelines and shares"
-        await tracker.update(current_step)
-        for share_name, explicit_pipeline_names in share_specs:
+        tracker.update_async(current_step)
+        # One listing of the workspace's pipelines serves every share's name lookups
+        ws_pipeline_ids = await run_sync(_list_workspace_pipeline_ids, workspace_url) if share_specs else {}
+        share_names = [name for name, _ in share_specs]
+        existing_shares, existing_recipients = await _lookup_existing(
+            share_names, recipient_names, workspace_url, action_log
+        )
+        # Shares are independent: each records its soft-deletes into its own list
+        share_outcomes = [_PendingSoftDeletes() for _ in share_specs]
+
+        async def delete_share_spec(i: int) -> None:
+            share_name, explicit_pipeline_names = share_specs[i]
             share_rec = name_to_share.get(share_name)
             share_id = share_rec["share_id"] if share_rec else None
             await _process_share(
                 share_name,
                 explicit_pipeline_names,
                 workspace_url,
+                ws_pipeline_ids,
                 share_id,
                 share_rec,
                 share_id_to_pipelines,
-                pipelines_list,
+                pipeline_index,
                 pipeline_repo,
                 share_repo,
                 str(share_pack_id),
-                pending_soft_deletes,
+                share_outcomes[i],
+                action_log,
+                share_records_by_name.get(share_name, []),
+                pipeline_records_by_name,
+                existing_shares[i],
             )
 
-        current_step = "Step 3/4: Deleting recipients"
-        await tracker.update(current_step)
-        for recipient_name in recipient_names:
-            await _process_recipient(
-                recipient_name,
-                workspace_url,
-                recipient_repo,
-                str(share_pack_id),
-                pending_soft_deletes,
+        results = await gather_bounded(delete_share_spec, range(len(share_specs)))
+        await _merge_or_raise(pool, share_outcomes, results, pending_soft_deletes, str(share_pack_id), action_log)
+
+        # Persist the pipeline/share soft-deletes while the recipients are being deleted
+        share_soft_deletes = asyncio.create_task(
+            _persist_soft_deletes(pool, pending_soft_deletes.take(), str(share_pack_id), action_log)
+        )
+        try:
+            current_step = "Step 3/4: Deleting recipients"
+            tracker.update_async(current_step)
+            recipient_outcomes = [_PendingSoftDeletes() for _ in recipient_names]
+
+            async def delete_recipient_name(i: int) -> None:
+                await _process_recipient(
+                    recipient_names[i],
+                    workspace_url,
+                    recipient_repo,
+                    str(share_pack_id),
+                    recipient_outcomes[i],
+                    recipient_records_by_name.get(recipient_names[i], []),
+                    action_log,
+                    existing_recipients[i],
+                )
+
+            results = await gather_bounded(delete_recipient_name, range(len(recipient_names)))
+            await _merge_or_raise(
+                pool, recipient_outcomes, results, pending_soft_deletes, str(share_pack_id), action_log
             )
+        finally:
+            # Always awaited, so its rows are written before a Step 3 failure is reported
+            shares_ok, shares_fail = await share_soft_deletes
 
         current_step = "Step 4/4: Persisting DB soft-deletes"
-        await tracker.update(current_step)
-        db_ok, db_fail = await _persist_soft_deletes(pending_soft_deletes, str(share_pack_id))
+        tracker.update_async(current_step)
+        db_ok, db_fail = await _persist_soft_deletes(pool, pending_soft_deletes.take(), str(share_pack_id), action_log)
 
-        summary = _build_delete_summary(share_specs, recipient_names, db_ok, db_fail)
+        summary = _build_delete_summary(share_specs, recipient_names, shares_ok + db_ok, shares_fail + db_fail)
         await tracker.complete(summary)
         logger.success("Share pack {} DELETE strategy completed: {}", share_pack_id, summary)
 
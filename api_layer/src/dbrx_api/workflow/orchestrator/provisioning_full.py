@@ -8,6 +8,7 @@ from datetime import datetime
 from datetime import timezone
 from typing import Any
 from typing import Dict
+from typing import List
 
 from loguru import logger
 
@@ -18,6 +19,8 @@ from dbrx_api.dltshr.share import add_data_object_to_share
 from dbrx_api.dltshr.share import add_recipients_to_share
 from dbrx_api.dltshr.share import create_share
 from dbrx_api.jobs.dbrx_pipelines import create_pipeline
+from dbrx_api.workflow.orchestrator.resources import CreatedResource
+from dbrx_api.workflow.orchestrator.resources import count_by_kind
 from dbrx_api.workflow.orchestrator.status_tracker import StatusTracker
 
 
@@ -37,12 +40,8 @@ async def provision_sharepack_new(pool, share_pack: Dict[str, Any]):
     share_pack_id = share_pack["share_pack_id"]
     tracker = StatusTracker(pool, share_pack_id)
 
-    # Track created resources for rollback
-    created_resources = {
-        "recipients": [],
-        "shares": [],
-        "pipelines": [],
-    }
+    # Track created resources for rollback (one list, walked in reverse to undo)
+    created: List[CreatedResource] = []
 
     try:
         config = share_pack["config"]  # Already parsed as dict from JSONB
@@ -89,7 +88,7 @@ async def provision_sharepack_new(pool, share_pack: Dict[str, Any]):
                 raise Exception(f"Failed to create recipient {recipient_name}: {result}")
 
             recipient_results[recipient_name] = result
-            created_resources["recipients"].append(recipient_name)
+            created.append(CreatedResource("recipient", recipient_name))
             logger.success(f"Created recipient: {recipient_name}")
 
         # Step 3: Create Shares
@@ -112,7 +111,7 @@ async def provision_sharepack_new(pool, share_pack: Dict[str, Any]):
                 raise Exception(f"Failed to create share {share_name}: {result}")
 
             share_results[share_name] = result
-            created_resources["shares"].append(share_name)
+            created.append(CreatedResource("share", share_name))
             logger.success(f"Created share: {share_name}")
 
         # Step 4: Add Data Objects to Shares
@@ -120,20 +119,18 @@ async def provision_sharepack_new(pool, share_pack: Dict[str, Any]):
 
         for share_config in config["share"]:
             share_name = share_config["name"]
-            assets = share_config["share_assets"]
+            # Drop duplicate entries (order-preserving) so each asset is added once
+            assets = list(dict.fromkeys(share_config.get("share_assets") or []))
+            if not assets:
+                logger.info(f"No assets for share {share_name}, skipping")
+                continue
 
             logger.info(f"Adding {len(assets)} assets to share {share_name}")
 
             # Add all assets to the share
             for asset in assets:
-                # Determine object type based on parts count
-                parts = asset.split(".")
-                if len(parts) == 1:
-                    object_type = "SCHEMA"
-                elif len(parts) == 2:
-                    object_type = "SCHEMA"
-                else:  # 3 parts
-                    object_type = "TABLE"
+                # Determine object type from depth (catalog.schema.table has two dots)
+                object_type = "TABLE" if asset.count(".") >= 2 else "SCHEMA"
 
                 result = add_data_object_to_share(
                     workspace_url=workspace_url,
@@ -155,7 +152,10 @@ async def provision_sharepack_new(pool, share_pack: Dict[str, Any]):
 
         for share_config in config["share"]:
             share_name = share_config["name"]
-            recipients = share_config["recipients"]
+            recipients = list(dict.fromkeys(share_config.get("recipients") or []))
+            if not recipients:
+                logger.info(f"No recipients for share {share_name}, skipping")
+                continue
 
             logger.info(f"Attaching {len(recipients)} recipients to share {share_name}")
 
@@ -191,7 +191,7 @@ async def provision_sharepack_new(pool, share_pack: Dict[str, Any]):
 
                 # Extract schedule info (first asset in schedule dict)
                 schedule_dict = pipeline_config["schedule"]
-                asset_name = list(schedule_dict.keys())[0]
+                asset_name = next(iter(schedule_dict))
                 schedule_dict[asset_name]
 
                 # Build configuration dictionary for create_pipeline
@@ -217,17 +217,18 @@ async def provision_sharepack_new(pool, share_pack: Dict[str, Any]):
                 if isinstance(result, str):
                     raise Exception(f"Failed to create pipeline {pipeline_name}: {result}")
 
-                created_resources["pipelines"].append(pipeline_name)
+                created.append(CreatedResource("pipeline", pipeline_name))
                 logger.success(f"Created pipeline: {pipeline_name}")
 
         # Step 7: Mark as completed
         await tracker.complete("Provisioning completed successfully")
 
         logger.success(f"Share pack {share_pack_id} provisioned successfully")
+        counts = count_by_kind(created)
         logger.info(
-            f"Created {len(created_resources['recipients'])} recipients, "
-            f"{len(created_resources['shares'])} shares, "
-            f"{len(created_resources['pipelines'])} pipelines"
+            f"Created {counts.get('recipient', 0)} recipients, "
+            f"{counts.get('share', 0)} shares, "
+            f"{counts.get('pipeline', 0)} pipelines"
         )
 
     except Exception as e:
@@ -235,6 +236,7 @@ async def provision_sharepack_new(pool, share_pack: Dict[str, Any]):
         logger.error(f"Provisioning failed for {share_pack_id}: {e}", exc_info=True)
 
         # Log what was created before failure (for manual cleanup if needed)
-        logger.warning(f"Resources created before failure: {created_resources}")
+        # Listed newest first, i.e. in the order they would need to be undone
+        logger.warning(f"Resources created before failure: {[(r.kind, r.name) for r in reversed(created)]}")
 
         raise
@@ -33,23 +33,23 @@ async def provision_sharepack_new(pool, share_pack: Dict[str, Any]):
     try:
         config = share_pack["config"]  # Already parsed as dict from JSONB
 
-        logger.info(f"Starting NEW strategy provisioning for {share_pack_id}")
+        logger.info("Starting NEW strategy provisioning for {}", share_pack_id)
 
         # Step 1: Resolve/Create Tenant
         await tracker.update("Step 1/8: Resolving tenant")
         tenant_name = config["metadata"]["business_line"]
-        logger.debug(f"Would resolve/create tenant: {tenant_name}")
+        logger.debug("Would resolve/create tenant: {}", tenant_name)
 
         # Step 2: Resolve/Create Project
         await tracker.update("Step 2/8: Resolving project")
-        logger.debug(f"Would resolve/create project for tenant {tenant_name}")
+        logger.debug("Would resolve/create project for tenant {}", tenant_name)
 
         # Step 3: Create Recipients
         await tracker.update("Step 3/8: Creating recipients")
         for recip_config in config["recipient"]:
             recipient_name = recip_config["name"]
             recipient_type = recip_config["type"]
-            logger.debug(f"Would create {recipient_type} recipient: {recipient_name}")
+            logger.debug("Would create {} recipient: {}", recipient_type, recipient_name)
 
             # For production:
             # if recipient_type == "D2D":
@@ -64,45 +64,35 @@ async def provision_sharepack_new(pool, share_pack: Dict[str, Any]):
         await tracker.update("Step 4/8: Creating shares")
         for share_config in config["share"]:
             share_name = share_config["name"]
-            logger.debug(f"Would create share: {share_name}")
+            logger.debug("Would create share: {}", share_name)
 
             # For production:
             # result = create_share(workspace_url, share_name, ...)
             # if isinstance(result, str):
             #     raise Exception(f"Failed to create share: {result}")
 
-        # Step 5: Add Data Objects
-        await tracker.update("Step 5/8: Adding data objects to shares")
-        for share_config in config["share"]:
+        # Steps 5-7: Add data objects, attach recipients and create pipelines in one pass per share
+        shares = config["share"]
+        if shares:
+            await tracker.update("Step 5-7/8: Adding data objects, attaching recipients and creating pipelines")
+        else:
+            await tracker.update("Step 5-7/8: Skipping share contents (no shares in config)")
+        for share_config in shares:
             share_name = share_config["name"]
             assets = share_config["share_assets"]
-            logger.debug(f"Would add {len(assets)} assets to share {share_name}")
+            recipients = share_config["recipients"]
+            pipelines = share_config.get("pipelines", [])
+            logger.debug("Would add {} assets to share {}", len(assets), share_name)
+            logger.debug("Would attach {} recipients to share {}", len(recipients), share_name)
+            logger.debug("Would create {} pipelines for share {}", len(pipelines), share_name)
 
             # For production:
             # result = add_data_object_to_share(workspace_url, share_name, assets, ...)
             # if isinstance(result, str):
             #     raise Exception(f"Failed to add objects: {result}")
-
-        # Step 6: Attach Recipients
-        await tracker.update("Step 6/8: Attaching recipients to shares")
-        for share_config in config["share"]:
-            share_name = share_config["name"]
-            recipients = share_config["recipients"]
-            logger.debug(f"Would attach {len(recipients)} recipients to share {share_name}")
-
-            # For production:
             # result = add_recipients_to_share(workspace_url, share_name, recipients, ...)
             # if isinstance(result, str):
             #     raise Exception(f"Failed to attach recipients: {result}")
-
-        # Step 7: Create Pipelines
-        await tracker.update("Step 7/8: Creating pipelines")
-        for share_config in config["share"]:
-            share_name = share_config["name"]
-            pipelines = share_config.get("pipelines", [])
-            logger.debug(f"Would create {len(pipelines)} pipelines for share {share_name}")
-
-            # For production:
             # for pipeline_config in pipelines:
             #     result = create_pipeline(workspace_url, pipeline_config, ...)
             #     if isinstance(result, str):
@@ -115,7 +105,7 @@ async def provision_sharepack_new(pool, share_pack: Dict[str, Any]):
         # Mark as completed
         await tracker.complete()
 
-        logger.success(f"Provisioning completed for {share_pack_id} (MVP stub)")
+        logger.success("Provisioning completed for {} (MVP stub)", share_pack_id)
 
     except Exception as e:
         logger.error(f"Provisioning failed for {share_pack_id}: {e}", exc_info=True)
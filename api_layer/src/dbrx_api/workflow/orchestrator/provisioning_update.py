@@ -10,30 +10,54 @@ Implements selective update functionality:
 """
 
 import asyncio
+import re
+from datetime import datetime
+from datetime import timezone
 from typing import Any
 from typing import Dict
 from typing import List
 from uuid import UUID
-from uuid import uuid4
 
 from loguru import logger
 
+try:
+    import orjson as json
+except ImportError:
+    import json
+
+try:
+    from databricks.sdk import WorkspaceClient
+    from databricks.sdk.service.pipelines import Notifications
+except ImportError:
+    WorkspaceClient = None  # type: ignore[misc, assignment]
+    Notifications = None  # type: ignore[misc, assignment]
+
+from dbrx_api.dbrx_auth.shared_client import get_shared_workspace_client
+from dbrx_api.dbrx_auth.shared_client import shared_workspace_clients
+from dbrx_api.dbrx_auth.token_gen import get_auth_token
 from dbrx_api.jobs.dbrx_pipelines import create_pipeline
-from dbrx_api.jobs.dbrx_pipelines import list_pipelines_with_search_criteria
+from dbrx_api.jobs.dbrx_pipelines import get_pipeline_by_name
+from dbrx_api.jobs.dbrx_pipelines import list_pipelines
 from dbrx_api.jobs.dbrx_pipelines import update_pipeline_target_configuration
+from dbrx_api.jobs.dbrx_pipelines import validate_pipeline_keys
 from dbrx_api.jobs.dbrx_schedule import create_schedule_for_pipeline
+from dbrx_api.jobs.dbrx_schedule import delete_schedule_for_pipeline
 from dbrx_api.jobs.dbrx_schedule import list_schedules
 from dbrx_api.jobs.dbrx_schedule import update_schedule_for_pipeline
 from dbrx_api.jobs.dbrx_schedule import update_timezone_for_schedule
+from dbrx_api.workflow.db.ids import uuid7
 from dbrx_api.workflow.db.repository_pipeline import PipelineRepository
 from dbrx_api.workflow.db.repository_recipient import RecipientRepository
 from dbrx_api.workflow.db.repository_share import ShareRepository
+from dbrx_api.workflow.orchestrator.concurrency import rollback_by_resource
 from dbrx_api.workflow.orchestrator.db_persist import persist_pipelines_to_db
-from dbrx_api.workflow.orchestrator.db_persist import persist_recipients_to_db
-from dbrx_api.workflow.orchestrator.db_persist import persist_shares_to_db
+from dbrx_api.workflow.orchestrator.db_persist import persist_recipients_and_shares_to_db
 from dbrx_api.workflow.orchestrator.db_persist import propagate_share_ids_to_pipelines
 from dbrx_api.workflow.orchestrator.pipeline_cleanup import cleanup_orphaned_pipelines
+from dbrx_api.workflow.orchestrator.pipeline_flow import _SCHEDULE_EXISTS_RE
+from dbrx_api.workflow.orchestrator.pipeline_flow import _V1_SCHEDULE_FIELDS
 from dbrx_api.workflow.orchestrator.pipeline_flow import _rollback_pipelines
+from dbrx_api.workflow.orchestrator.pipeline_flow import _single_schedule_asset
 from dbrx_api.workflow.orchestrator.pipeline_flow import check_and_sync_pipelines_for_added_assets
 from dbrx_api.workflow.orchestrator.pipeline_flow import delete_pipelines_for_removed_assets
 from dbrx_api.workflow.orchestrator.pipeline_flow import ensure_pipelines
@@ -41,11 +65,18 @@ from dbrx_api.workflow.orchestrator.provisioning import validate_metadata
 from dbrx_api.workflow.orchestrator.provisioning import validate_sharepack_config
 from dbrx_api.workflow.orchestrator.recipient_flow import _rollback_recipients
 from dbrx_api.workflow.orchestrator.recipient_flow import ensure_recipients
+from dbrx_api.workflow.orchestrator.resources import ApiResult
+from dbrx_api.workflow.orchestrator.resources import ApiStatus
+from dbrx_api.workflow.orchestrator.resources import CreatedResource
 from dbrx_api.workflow.orchestrator.share_flow import _rollback_shares
 from dbrx_api.workflow.orchestrator.share_flow import ensure_shares
 from dbrx_api.workflow.orchestrator.status_tracker import StatusTracker
 
+# delete_schedule_for_pipeline result text when there are no schedules to remove
+_SCHEDULE_MISSING_RE = re.compile(r"no schedules found|not found", re.IGNORECASE)
 
+
+@shared_workspace_clients
 async def provision_sharepack_update(pool, share_pack: Dict[str, Any]):
     """
     Provision a share pack using UPDATE strategy (selective updates).
@@ -95,8 +126,6 @@ async def provision_sharepack_update(pool, share_pack: Dict[str, Any]):
     added_assets_per_share: list = []
 
     try:
-        import json
-
         # Parse config if it's a JSON string
         config = share_pack["config"]
         if isinstance(config, str):
@@ -211,11 +240,9 @@ async def provision_sharepack_update(pool, share_pack: Dict[str, Any]):
         await tracker.update(current_step)
 
         configurator = config["metadata"]["configurator"]
-        if recipient_db_entries:
-            await persist_recipients_to_db(recipient_db_entries, share_pack_id, configurator, recipient_repo)
-        share_name_to_id = {}
-        if share_db_entries:
-            share_name_to_id = await persist_shares_to_db(share_db_entries, share_pack_id, share_repo)
+        share_name_to_id = await persist_recipients_and_shares_to_db(
+            recipient_db_entries, share_db_entries, share_pack_id, configurator, recipient_repo, share_repo
+        )
         if pipeline_db_entries:
             await persist_pipelines_to_db(
                 pipeline_db_entries, share_pack_id, share_name_to_id, share_repo, pipeline_repo
@@ -293,8 +320,9 @@ async def provision_sharepack_update(pool, share_pack: Dict[str, Any]):
         await tracker.complete(completion_message)
 
     except Exception as e:
-        await tracker.fail(str(e), current_step or "Provisioning failed")
-        logger.error(f"Update failed for {share_pack_id}: {e}", exc_info=True)
+        error_msg = str(e)
+        await tracker.fail(error_msg, current_step or "Provisioning failed")
+        logger.opt(exception=True).error("Update failed for {}: {}", share_pack_id, error_msg)
         logger.warning(f"Resources updated before failure: {updated_resources}")
 
         # Rollback Databricks only — no DB cleanup needed (DB was never written).
@@ -314,7 +342,9 @@ async def provision_sharepack_update(pool, share_pack: Dict[str, Any]):
             logger.info("Rolling back pipeline changes in Databricks...")
             try:
                 await asyncio.wait_for(
-                    asyncio.to_thread(_rollback_pipelines, pipeline_rollback_list, workspace_url),
+                    rollback_by_resource(
+                        _rollback_pipelines, pipeline_rollback_list, workspace_url, key=lambda item: item[3]
+                    ),
                     timeout=120,
                 )
                 logger.info("Pipeline rollback complete.")
@@ -329,7 +359,9 @@ async def provision_sharepack_update(pool, share_pack: Dict[str, Any]):
             logger.info("Rolling back share changes in Databricks...")
             try:
                 await asyncio.wait_for(
-                    asyncio.to_thread(_rollback_shares, share_rollback_list, workspace_url),
+                    rollback_by_resource(
+                        _rollback_shares, share_rollback_list, workspace_url, key=lambda item: item[1]
+                    ),
                     timeout=120,
                 )
                 logger.info("Share rollback complete.")
@@ -342,7 +374,9 @@ async def provision_sharepack_update(pool, share_pack: Dict[str, Any]):
             logger.info("Rolling back recipient changes in Databricks...")
             try:
                 await asyncio.wait_for(
-                    asyncio.to_thread(_rollback_recipients, recipient_rollback_list, workspace_url),
+                    rollback_by_resource(
+                        _rollback_recipients, recipient_rollback_list, workspace_url, key=lambda item: item[1]
+                    ),
                     timeout=120,
                 )
                 logger.info("Recipient rollback complete.")
@@ -366,14 +400,17 @@ async def _update_pipelines_and_schedules(
     pipeline_repo: PipelineRepository,
     share_repo: ShareRepository,
     share_pack_id: UUID,
-    created_db_records: Dict,
+    created: List[CreatedResource],
 ):
     """Update pipeline configurations and schedules with database tracking."""
+    # Listed once and indexed by name; refreshed only when a configured pipeline is missing
+    pipeline_ids_by_name: Dict[str, str] | None = None
+
     for share_config in shares:
         share_name = share_config["name"]
 
         if "pipelines" not in share_config:
-            logger.debug(f"No pipelines specified for {share_name}, skipping")
+            logger.debug("No pipelines specified for {}, skipping", share_name)
             continue
 
         pipelines = share_config.get("pipelines", [])
@@ -384,16 +421,12 @@ async def _update_pipelines_and_schedules(
 
             try:
                 # Check if pipeline exists
-                pipelines_list = list_pipelines_with_search_criteria(
-                    dltshr_workspace_url=workspace_url,
-                    filter_expr=pipeline_name,
-                )
-
-                pipeline_id = None
-                for pipeline in pipelines_list:
-                    if pipeline.name == pipeline_name:
-                        pipeline_id = pipeline.pipeline_id
-                        break
+                pipeline_id = (pipeline_ids_by_name or {}).get(pipeline_name)
+                if not pipeline_id:
+                    pipeline_ids_by_name = {
+                        p.name: p.pipeline_id for p in list_pipelines(dltshr_workspace_url=workspace_url) if p.name
+                    }
+                    pipeline_id = pipeline_ids_by_name.get(pipeline_name)
 
                 if not pipeline_id:
                     # UPDATE strategy should NOT create new pipelines - only update existing ones
@@ -442,11 +475,16 @@ async def _create_pipeline(
     share_config: Dict,
     updated_resources: Dict,
     pipeline_repo: PipelineRepository,
-    share_repo: ShareRepository,
+    share_id_by_name: Dict[str, UUID],
     share_pack_id: UUID,
-    created_db_records: Dict,
+    created: List[CreatedResource],
 ) -> str | None:
-    """Create a new pipeline and track in database."""
+    """
+    Create a new pipeline and track in database.
+
+    share_id_by_name maps share_name -> share_id for this share pack; callers build it once
+    from share_repo.list_by_share_pack instead of re-querying for every pipeline.
+    """
     try:
         # Extract source and target assets
         source_asset = pipeline_config.get("source_asset")
@@ -502,23 +540,20 @@ async def _create_pipeline(
             raise RuntimeError(error_msg)
 
         logger.success(f"Created pipeline: {pipeline_name}")
+        # Single record per pipeline; db_id is filled in once the DB row is written
+        record = CreatedResource("pipeline", pipeline_name)
+        created.append(record)
         updated_resources["pipelines"].append(f"{pipeline_name} (created)")
 
         # Track in database
         try:
-            # Get share_id from database using share_name
             share_name = share_config["name"]
-            share_records = await share_repo.list_by_share_pack(share_pack_id)
-            share_id = None
-            for share_record in share_records:
-                if share_record["share_name"] == share_name:
-                    share_id = share_record["share_id"]
-                    break
+            share_id = share_id_by_name.get(share_name)
 
             if not share_id:
                 logger.warning(f"Could not find share_id for {share_name}, skipping pipeline database tracking")
             else:
-                pipeline_id_db = uuid4()
+                pipeline_id_db = uuid7()
 
                 # Extract schedule info
                 schedule = pipeline_config.get("schedule", {})
@@ -552,12 +587,12 @@ async def _create_pipeline(
                         notification_emails=pipeline_config.get("notification", []),
                         created_by="orchestrator",
                     )
-                    logger.debug(f"Tracked pipeline {pipeline_name} in database (id: {pipeline_id_db})")
+                    logger.debug("Tracked pipeline {} in database (id: {})", pipeline_name, pipeline_id_db)
                 except Exception as db_error:
                     logger.warning(
                         f"Failed to track pipeline {pipeline_name} in database (UPDATE strategy - object should exist): {db_error}"
                     )
-                created_db_records["pipelines"].append(pipeline_id_db)
+                record.db_id = pipeline_id_db
         except Exception as db_error:
             logger.warning(
                 f"Failed to track pipeline {pipeline_name} in database (UPDATE strategy - object should exist): {db_error}"
@@ -595,9 +630,6 @@ async def _update_pipeline_configuration(
     """
     try:
         # Get existing pipeline details
-        from dbrx_api.jobs.dbrx_pipelines import get_pipeline_by_name
-        from dbrx_api.jobs.dbrx_pipelines import validate_pipeline_keys
-
         existing_pipeline = get_pipeline_by_name(workspace_url, pipeline_name)
 
         if isinstance(existing_pipeline, str):
@@ -660,16 +692,11 @@ async def _update_pipeline_configuration(
                 logger.error(error_msg)
                 raise ValueError(error_msg)
 
-            # Get workspace client for validation
-            from datetime import datetime
-            from datetime import timezone
-
-            from databricks.sdk import WorkspaceClient
-
-            from dbrx_api.dbrx_auth.token_gen import get_auth_token
-
-            session_token = get_auth_token(datetime.now(timezone.utc))[0]
-            w_client = WorkspaceClient(host=workspace_url, token=session_token)
+            # Get workspace client for validation (the run's shared client when there is one)
+            w_client = get_shared_workspace_client(workspace_url)
+            if w_client is None:
+                session_token = get_auth_token(datetime.now(timezone.utc))[0]
+                w_client = WorkspaceClient(host=workspace_url, token=session_token)
 
             # Validate keys against source table schema
             keys_validation = validate_pipeline_keys(
@@ -715,7 +742,7 @@ async def _update_pipeline_configuration(
         )
 
         logger.info(f"Updating pipeline configuration for {pipeline_name}")
-        logger.debug(f"Updated configuration: {configuration}")
+        logger.debug("Updated configuration: {}", configuration)
 
         # Extract libraries from existing pipeline (required by Databricks)
         libraries = existing_pipeline.spec.libraries if existing_pipeline.spec else None
@@ -726,8 +753,6 @@ async def _update_pipeline_configuration(
         notifications_list = pipeline_config.get("notification", [])
         notifications = None
         if notifications_list:
-            from databricks.sdk.service.pipelines import Notifications
-
             notifications = [
                 Notifications(
                     email_recipients=notifications_list,
@@ -795,7 +820,7 @@ async def _update_pipeline_schedule(
     schedule = pipeline_config.get("schedule")
 
     if not schedule:
-        logger.debug(f"No schedule config for {pipeline_name}, skipping schedule management")
+        logger.debug("No schedule config for {}, skipping schedule management", pipeline_name)
         return
 
     try:
@@ -813,30 +838,19 @@ async def _update_pipeline_schedule(
 
             # Remove all schedules for this pipeline
             logger.info(f"Removing all schedules for {pipeline_name} ({len(schedules)} schedule(s))")
-            from dbrx_api.jobs.dbrx_schedule import delete_schedule_for_pipeline
-
             result = delete_schedule_for_pipeline(
                 dltshr_workspace_url=workspace_url,
                 pipeline_id=pipeline_id,
             )
 
-            # Check for success messages (deleted, successfully) or "no schedules found" (benign)
-            if (
-                "deleted" in result.lower()
-                or "successfully" in result.lower()
-                or "no schedules found" in result.lower()
-            ):
-                logger.success(f"Removed schedules for {pipeline_name}: {result}")
-                updated_resources["schedules"].append(f"{pipeline_name} (removed)")
-            elif "error" in result.lower():
-                # Only raise if it's an actual error, not "no schedules found"
+            # "No schedules found" is benign: there is nothing left to remove
+            outcome = ApiResult.of_message(result, missing=_SCHEDULE_MISSING_RE)
+            if outcome.status is ApiStatus.ERROR:
                 error_msg = f"Failed to remove schedules for {pipeline_name}: {result}"
                 logger.error(error_msg)
                 raise RuntimeError(error_msg)
-            else:
-                # Unknown result - log and continue (don't fail)
-                logger.warning(f"Schedule removal result for {pipeline_name}: {result}")
-                updated_resources["schedules"].append(f"{pipeline_name} (removal attempted)")
+            logger.success(f"Removed schedules for {pipeline_name}: {result}")
+            updated_resources["schedules"].append(f"{pipeline_name} (removed)")
             return
 
         # Extract cron and timezone from schedule config
@@ -847,9 +861,8 @@ async def _update_pipeline_schedule(
 
             # v1.0 format: schedule has source_asset as key with nested cron/timezone
             if not new_cron:
-                schedule_keys = [k for k in schedule.keys() if k not in ["cron", "timezone", "action"]]
-                if len(schedule_keys) == 1:
-                    source_asset_key = schedule_keys[0]
+                source_asset_key = _single_schedule_asset(schedule)
+                if source_asset_key is not None:
                     nested_schedule = schedule[source_asset_key]
                     if isinstance(nested_schedule, dict):
                         new_cron = nested_schedule.get("cron")
@@ -890,16 +903,12 @@ async def _update_pipeline_schedule(
                     job_id=job_id,
                     cron_expression=new_cron,
                 )
-                if isinstance(result, str) and "success" in result.lower():
-                    logger.success(f"Updated cron for {pipeline_name}: {new_cron}")
-                    updated_resources["schedules"].append(f"{pipeline_name} (cron updated)")
-                elif isinstance(result, str):
+                if ApiResult.of_message(result).status is ApiStatus.ERROR:
                     error_msg = f"Failed to update cron for {pipeline_name}: {result}"
                     logger.error(error_msg)
                     raise RuntimeError(error_msg)
-                else:
-                    logger.success(f"Updated cron for {pipeline_name}: {new_cron}")
-                    updated_resources["schedules"].append(f"{pipeline_name} (cron updated)")
+                logger.success(f"Updated cron for {pipeline_name}: {new_cron}")
+                updated_resources["schedules"].append(f"{pipeline_name} (cron updated)")
 
             if timezone_changed:
                 logger.info(
@@ -910,16 +919,12 @@ async def _update_pipeline_schedule(
                     job_id=job_id,
                     time_zone=new_timezone,
                 )
-                if isinstance(result, str) and "success" in result.lower():
-                    logger.success(f"Updated timezone for {pipeline_name}: {new_timezone}")
-                    updated_resources["schedules"].append(f"{pipeline_name} (timezone updated)")
-                elif isinstance(result, str):
+                if ApiResult.of_message(result).status is ApiStatus.ERROR:
                     error_msg = f"Failed to update timezone for {pipeline_name}: {result}"
                     logger.error(error_msg)
                     raise RuntimeError(error_msg)
-                else:
-                    logger.success(f"Updated timezone for {pipeline_name}: {new_timezone}")
-                    updated_resources["schedules"].append(f"{pipeline_name} (timezone updated)")
+                logger.success(f"Updated timezone for {pipeline_name}: {new_timezone}")
+                updated_resources["schedules"].append(f"{pipeline_name} (timezone updated)")
 
             if not cron_changed and not timezone_changed:
                 logger.info(f"Schedule for {pipeline_name} unchanged (cron: {new_cron}, timezone: {new_timezone})")
@@ -941,7 +946,10 @@ async def _create_schedule(
 ):
     """Create a new schedule for a pipeline."""
     logger.info(
-        f"Attempting to create schedule for {pipeline_name}, schedule type: {type(schedule)}, value: {schedule}"
+        "Attempting to create schedule for {}, schedule type: {}, value: {}",
+        pipeline_name,
+        type(schedule).__name__,
+        schedule,
     )
 
     if isinstance(schedule, str) and schedule.lower() == "continuous":
@@ -956,9 +964,8 @@ async def _create_schedule(
         # v1.0 format: schedule has source_asset as key with nested cron/timezone
         if not cron_expression:
             # Check if this is v1.0 format with source_asset as key
-            schedule_keys = [k for k in schedule.keys() if k not in ["cron", "timezone"]]
-            if len(schedule_keys) == 1:
-                source_asset_key = schedule_keys[0]
+            source_asset_key = _single_schedule_asset(schedule, _V1_SCHEDULE_FIELDS)
+            if source_asset_key is not None:
                 nested_schedule = schedule[source_asset_key]
                 if isinstance(nested_schedule, dict):
                     cron_expression = nested_schedule.get("cron")
@@ -970,42 +977,41 @@ async def _create_schedule(
                         logger.warning(f"[v1.0 FORMAT] Continuous schedule not yet supported for {pipeline_name}")
                         cron_expression = None
 
-        logger.debug(f"Extracted schedule for {pipeline_name} - cron: {cron_expression}, timezone: {timezone}")
+        logger.debug("Extracted schedule for {} - cron: {}, timezone: {}", pipeline_name, cron_expression, timezone)
 
         if cron_expression:
             job_name = f"{pipeline_name}_schedule"
-            result = create_schedule_for_pipeline(
-                dltshr_workspace_url=workspace_url,
-                job_name=job_name,
-                pipeline_id=pipeline_id,
-                cron_expression=cron_expression,
-                time_zone=timezone,
-                paused=False,
-                email_notifications=pipeline_config.get("notification", []),
-                tags=pipeline_config.get("tags", {}),
-                description=pipeline_config.get("description"),
+            result = ApiResult.of_message(
+                create_schedule_for_pipeline(
+                    dltshr_workspace_url=workspace_url,
+                    job_name=job_name,
+                    pipeline_id=pipeline_id,
+                    cron_expression=cron_expression,
+                    time_zone=timezone,
+                    paused=False,
+                    email_notifications=pipeline_config.get("notification", []),
+                    tags=pipeline_config.get("tags", {}),
+                    description=pipeline_config.get("description"),
+                ),
+                _SCHEDULE_EXISTS_RE,
             )
 
-            if isinstance(result, str):
-                if "already exists" in result.lower():
-                    logger.info(f"Job {job_name} already exists - verifying schedule is active")
-                    # Verify the existing schedule
-                    try:
-                        schedules_verify, _ = list_schedules(workspace_url, pipeline_id)
-                        if schedules_verify:
-                            logger.success(f"Schedule for {pipeline_name} exists and is active (job: {job_name})")
-                        else:
-                            logger.warning(
-                                f"Job {job_name} exists but no active schedule found for pipeline - may need manual cleanup in Databricks Workflows"
-                            )
-                    except Exception as verify_error:
-                        logger.warning(f"Could not verify schedule for {pipeline_name}: {verify_error}")
-                elif "success" in result.lower() or "created" in result.lower():
-                    logger.success(f"Created schedule for {pipeline_name} (job: {job_name}, cron: {cron_expression})")
-                else:
-                    error_msg = f"Failed to create schedule for {pipeline_name}: {result}"
-                    logger.error(error_msg)
-                    raise RuntimeError(error_msg)
+            if result.already_exists:
+                logger.info(f"Job {job_name} already exists - verifying schedule is active")
+                # Verify the existing schedule
+                try:
+                    schedules_verify, _ = list_schedules(workspace_url, pipeline_id)
+                    if schedules_verify:
+                        logger.success(f"Schedule for {pipeline_name} exists and is active (job: {job_name})")
+                    else:
+                        logger.warning(
+                            f"Job {job_name} exists but no active schedule found for pipeline - may need manual cleanup in Databricks Workflows"
+                        )
+                except Exception as verify_error:
+                    logger.warning(f"Could not verify schedule for {pipeline_name}: {verify_error}")
+            elif not result.success:
+                error_msg = f"Failed to create schedule for {pipeline_name}: {result.error}"
+                logger.error(error_msg)
+                raise RuntimeError(error_msg)
             else:
-                # Dict response - success
-                logger.success(f"Created schedule for {pipeline_name} (job: {job_name})")
+                logger.success(f"Created schedule for {pipeline_name} (job: {job_name}, cron: {cron_expression})")
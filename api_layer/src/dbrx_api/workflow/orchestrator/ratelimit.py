@@ -0,0 +1,61 @@
+"""
+Databricks Dispatch Rate Limiting
+
+Token bucket shared by every provisioning run in the process, so concurrent
+fan-outs stay under the workspace's REST rate limit instead of tripping 429s.
+
+The bucket meters work items, not REST requests: one permit is taken per
+run_sync call and per fan-out item (one recipient, share or pipeline), and a
+fan-out item issues several SDK requests (lookup, create, grants, ...). The
+default rate is set with that in mind; throttled requests that still get
+through are retried by call_with_retry.
+"""
+
+import asyncio
+import os
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Token bucket refilled at `rate` permits per second, holding at most `burst`.
+
+    Permits are reserved under a lock, so the bucket is safe to share across
+    threads and event loops. A caller that finds the bucket empty is handed a
+    wait time instead of polling; its permit is already reserved, so waiters are
+    served in arrival order.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take one permit and return how long to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    async def acquire(self) -> None:
+        """Wait on the event loop until a permit is available."""
+        if self.rate <= 0:
+            return
+        delay = self._reserve()
+        if delay:
+            await asyncio.sleep(delay)
+
+
+# Databricks work items (run_sync calls / fan-out items) dispatched per second, 0 disables.
+# At ~3-4 SDK requests per provisioning item, 8 items/s keeps a run near the workspace's
+# ~30 requests/s limit.
+DATABRICKS_ITEMS_PER_SECOND = float(os.getenv("DATABRICKS_ITEMS_PER_SECOND", "8"))
+DATABRICKS_ITEMS_BURST = int(os.getenv("DATABRICKS_ITEMS_BURST", "5"))
+
+databricks_item_limiter = TokenBucket(DATABRICKS_ITEMS_PER_SECOND, DATABRICKS_ITEMS_BURST)
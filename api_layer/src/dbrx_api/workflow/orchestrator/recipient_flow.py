@@ -11,7 +11,6 @@ from typing import Dict
 from typing import List
 from typing import Optional
 from typing import Tuple
-from uuid import uuid4
 
 from loguru import logger
 
@@ -24,6 +23,9 @@ from dbrx_api.dltshr.recipient import revoke_recipient_ip
 from dbrx_api.dltshr.recipient import rotate_recipient_token
 from dbrx_api.dltshr.recipient import update_recipient_description
 from dbrx_api.dltshr.recipient import update_recipient_expiration_time
+from dbrx_api.workflow.orchestrator.concurrency import call_with_retry
+from dbrx_api.workflow.orchestrator.concurrency import provision_entities
+from dbrx_api.workflow.orchestrator.resources import ApiResult
 
 
 def _ips_add_and_remove_from_config(
@@ -146,15 +148,20 @@ def _apply_recipient_updates(
     recip_config: Dict[str, Any],
     existing: Any,
     workspace_url: str,
+    new_description: str,
+    current_comment: str,
 ) -> None:
-    """Apply updates to an existing recipient (D2D: description; D2O: description, IPs, token expiry, rotate)."""
+    """
+    Apply updates to an existing recipient (D2D: description; D2O: description, IPs, token expiry, rotate).
+
+    new_description and current_comment are the stripped YAML and Databricks descriptions,
+    already computed by the caller for its match check.
+    """
     # Description (both types) — only update if explicitly provided in YAML (non-empty).
     # Treat absent/empty description as "no change": preserve the existing Databricks value.
-    new_description = (recip_config.get("description") or "").strip()
     if new_description:
-        current_comment = (existing.comment or "").strip() if hasattr(existing, "comment") and existing.comment else ""
         if new_description != current_comment:
-            result = update_recipient_description(recipient_name, new_description, workspace_url)
+            result = call_with_retry(update_recipient_description, recipient_name, new_description, workspace_url)
             if isinstance(result, str) and "error" in result.lower():
                 raise RuntimeError(f"Failed to update description for {recipient_name}: {result}")
 
@@ -166,7 +173,8 @@ def _apply_recipient_updates(
     token_rotation = recip_config.get("token_rotation", False)
 
     if token_expiry_days == 0 and token_rotation:
-        result = rotate_recipient_token(
+        result = call_with_retry(
+            rotate_recipient_token,
             recipient_name=recipient_name,
             dltshr_workspace_url=workspace_url,
             expire_in_seconds=0,
@@ -175,7 +183,8 @@ def _apply_recipient_updates(
             raise RuntimeError(f"Failed to rotate token for {recipient_name}: {result}")
     elif token_expiry_days > 0 and token_rotation:
         expire_seconds = token_expiry_days * 24 * 60 * 60
-        result = rotate_recipient_token(
+        result = call_with_retry(
+            rotate_recipient_token,
             recipient_name=recipient_name,
             dltshr_workspace_url=workspace_url,
             expire_in_seconds=expire_seconds,
@@ -183,7 +192,8 @@ def _apply_recipient_updates(
         if isinstance(result, str):
             raise RuntimeError(f"Failed to rotate token for {recipient_name}: {result}")
     elif token_expiry_days > 0:
-        result = update_recipient_expiration_time(
+        result = call_with_retry(
+            update_recipient_expiration_time,
             recipient_name=recipient_name,
             expiration_time=token_expiry_days,
             dltshr_workspace_url=workspace_url,
@@ -198,13 +208,17 @@ def _apply_recipient_updates(
     ips_to_add, ips_to_remove = _ips_add_and_remove_from_config(recip_config, current_ips)
 
     if ips_to_add:
-        result = add_recipient_ip(
-            recipient_name=recipient_name, ip_access_list=list(ips_to_add), dltshr_workspace_url=workspace_url
+        result = call_with_retry(
+            add_recipient_ip,
+            recipient_name=recipient_name,
+            ip_access_list=list(ips_to_add),
+            dltshr_workspace_url=workspace_url,
         )
         if isinstance(result, str):
             raise RuntimeError(f"Failed to add IPs to {recipient_name}: {result}")
     if ips_to_remove:
-        result = revoke_recipient_ip(
+        result = call_with_retry(
+            revoke_recipient_ip,
             recipient_name=recipient_name,
             ip_access_list=list(ips_to_remove),
             dltshr_workspace_url=workspace_url,
@@ -213,236 +227,283 @@ def _apply_recipient_updates(
             raise RuntimeError(f"Failed to revoke IPs from {recipient_name}: {result}")
 
 
-async def ensure_recipients(
+def _ensure_recipient(
+    recip_config: Dict[str, Any],
     workspace_url: str,
-    recipients_config: List[Dict[str, Any]],
     rollback_list: List[tuple],
     db_entries: List[Dict[str, Any]],
-    created_resources: Optional[Dict[str, List]] = None,
+    created_resources: Dict[str, List],
 ) -> None:
     """
-    Ensure all recipients exist with desired state (strategy-agnostic).
-    Databricks operations only — no DB writes. Populates mutable rollback_list and db_entries.
-    On failure, raises without rollback — the orchestrator handles all rollback.
+    Ensure a single recipient exists with desired state (blocking; runs in a worker thread).
 
     Raises:
-        Exception: On first recipient create/update failure (orchestrator handles rollback).
+        Exception: On create/update failure (orchestrator handles rollback).
     """
-    if created_resources is None:
-        created_resources = {"recipients": []}
-
-    for recip_config in recipients_config:
-        recipient_name = recip_config["name"]
-        recipient_type = recip_config["type"]
-        logger.info(f"Ensuring recipient: {recipient_name} ({recipient_type})")
-
-        existing = get_recipients(recipient_name, workspace_url)
-
-        if existing:
-            # Recipient exists: validate immutable fields first
-            if recipient_type == "D2D":
-                # Validate that recipient_databricks_org hasn't changed (immutable field)
-                current_org = getattr(existing, "data_recipient_global_metastore_id", None)
-                new_org = recip_config.get("recipient_databricks_org") or recip_config.get(
-                    "data_recipient_global_metastore_id"
-                )
-                # Only raise error if both values exist AND they differ (case-insensitive comparison)
-                if new_org and current_org:
-                    current_normalized = current_org.strip().lower()
-                    new_normalized = new_org.strip().lower()
-                    if current_normalized != new_normalized:
-                        # recipient_databricks_org (data_recipient_global_metastore_id) is immutable —
-                        # it can only be set at creation time and cannot be changed via the Databricks API.
-                        # Log a warning and skip this field; proceed with other updates (e.g. description).
-                        logger.warning(
-                            f"Skipping 'recipient_databricks_org' change for D2D recipient '{recipient_name}': "
-                            f"this field is immutable and cannot be updated after creation "
-                            f"(current={current_org}, requested={new_org}). "
-                            f"Proceeding with other updates (e.g. description) only."
-                        )
-                    else:
-                        # Values match - log that we're ignoring it (no update needed)
-                        logger.debug(
-                            f"Ignoring recipient_databricks_org for '{recipient_name}': "
-                            f"value matches existing ({current_org})"
-                        )
-
-            # Recipient exists: compare and update if needed
-            current_comment = (
-                (existing.comment or "").strip() if hasattr(existing, "comment") and existing.comment else ""
-            )
-            new_description = (recip_config.get("description") or "").strip()
-            # Treat absent/empty description as "no change" — only count as mismatch when
-            # a non-empty description is explicitly provided in the YAML.
-            description_matches = not new_description or (new_description == current_comment)
-
-            if recipient_type == "D2O":
-                current_ips = set()
-                if existing.ip_access_list and getattr(existing.ip_access_list, "allowed_ip_addresses", None):
-                    current_ips = set(existing.ip_access_list.allowed_ip_addresses)
-                ips_to_add, ips_to_remove = _ips_add_and_remove_from_config(recip_config, current_ips)
-                ips_match = len(ips_to_add) == 0 and len(ips_to_remove) == 0
-                token_expiry = recip_config.get("token_expiry")
-                token_rotation = recip_config.get("token_rotation")
-                token_unchanged = not token_expiry and not token_rotation
-                all_match = description_matches and ips_match and token_unchanged
-            else:
-                all_match = description_matches
-
-            if all_match:
-                logger.info(f"Recipient parameters for '{recipient_name}' are already matching; no update needed")
-                current_ips_list = (
-                    list(existing.ip_access_list.allowed_ip_addresses)
-                    if existing.ip_access_list and getattr(existing.ip_access_list, "allowed_ip_addresses", None)
-                    else []
-                )
-                current_desc = (
-                    (existing.comment or "").strip() if hasattr(existing, "comment") and existing.comment else ""
-                )
-                # Use actual value from Databricks for recipient_databricks_org (immutable field)
-                current_org = (
-                    getattr(existing, "data_recipient_global_metastore_id", None) if recipient_type == "D2D" else None
-                )
-                db_entries.append(
-                    {
-                        "action": "matching",
-                        "recipient_name": recipient_name,
-                        "databricks_recipient_id": recipient_name,
-                        "recipient_type": recipient_type,
-                        "recipient_databricks_org": current_org,
-                        "ip_access_list": current_ips_list if recipient_type == "D2O" else [],
-                        "token_expiry_days": recip_config.get("token_expiry", 0),
-                        "token_rotation_enabled": recip_config.get("token_rotation", False),
-                        "description": current_desc,
-                    }
-                )
-                created_resources["recipients"].append(f"{recipient_name} (already matching)")
-                continue
+    recipient_name = recip_config["name"]
+    recipient_type = recip_config["type"]
+    logger.info(f"Ensuring recipient: {recipient_name} ({recipient_type})")
 
-            # Capture previous state for rollback, then apply updates
-            if recipient_type == "D2D":
-                previous_state = _previous_state_d2d(existing)
-            else:
-                previous_state = _previous_state_d2o(existing)
+    existing = get_recipients(recipient_name, workspace_url)
 
-            _apply_recipient_updates(
-                recipient_name=recipient_name,
-                recipient_type=recipient_type,
-                recip_config=recip_config,
-                existing=existing,
-                workspace_url=workspace_url,
+    if existing:
+        # Recipient exists: validate immutable fields first
+        if recipient_type == "D2D":
+            # Validate that recipient_databricks_org hasn't changed (immutable field)
+            current_org = getattr(existing, "data_recipient_global_metastore_id", None)
+            new_org = recip_config.get("recipient_databricks_org") or recip_config.get(
+                "data_recipient_global_metastore_id"
             )
-            rollback_list.append(("updated", recipient_name, recipient_type, previous_state))
-            created_resources["recipients"].append(f"{recipient_name} (updated)")
-            logger.success(f"Updated recipient: {recipient_name}")
+            # Only raise error if both values exist AND they differ (case-insensitive comparison)
+            if new_org and current_org:
+                current_normalized = current_org.strip().lower()
+                new_normalized = new_org.strip().lower()
+                if current_normalized != new_normalized:
+                    # recipient_databricks_org (data_recipient_global_metastore_id) is immutable —
+                    # it can only be set at creation time and cannot be changed via the Databricks API.
+                    # Log a warning and skip this field; proceed with other updates (e.g. description).
+                    logger.warning(
+                        f"Skipping 'recipient_databricks_org' change for D2D recipient '{recipient_name}': "
+                        f"this field is immutable and cannot be updated after creation "
+                        f"(current={current_org}, requested={new_org}). "
+                        f"Proceeding with other updates (e.g. description) only."
+                    )
+                else:
+                    # Values match - log that we're ignoring it (no update needed)
+                    logger.debug(
+                        "Ignoring recipient_databricks_org for '{}': value matches existing ({})",
+                        recipient_name,
+                        current_org,
+                    )
+
+        # Recipient exists: compare and update if needed
+        current_comment = (existing.comment or "").strip() if hasattr(existing, "comment") and existing.comment else ""
+        new_description = (recip_config.get("description") or "").strip()
+        # Treat absent/empty description as "no change" — only count as mismatch when
+        # a non-empty description is explicitly provided in the YAML.
+        description_matches = not new_description or (new_description == current_comment)
 
-            # Build db_entry with effective state after updates
+        if recipient_type == "D2O":
             current_ips = set()
             if existing.ip_access_list and getattr(existing.ip_access_list, "allowed_ip_addresses", None):
                 current_ips = set(existing.ip_access_list.allowed_ip_addresses)
-            effective_ips = _effective_ips_after_changes(recip_config, current_ips) if recipient_type == "D2O" else []
+            ips_to_add, ips_to_remove = _ips_add_and_remove_from_config(recip_config, current_ips)
+            ips_match = len(ips_to_add) == 0 and len(ips_to_remove) == 0
+            token_expiry = recip_config.get("token_expiry")
+            token_rotation = recip_config.get("token_rotation")
+            token_unchanged = not token_expiry and not token_rotation
+            all_match = description_matches and ips_match and token_unchanged
+        else:
+            all_match = description_matches
+
+        if all_match:
+            logger.info(f"Recipient parameters for '{recipient_name}' are already matching; no update needed")
+            current_ips_list = (
+                list(existing.ip_access_list.allowed_ip_addresses)
+                if existing.ip_access_list and getattr(existing.ip_access_list, "allowed_ip_addresses", None)
+                else []
+            )
             # Use actual value from Databricks for recipient_databricks_org (immutable field)
             current_org = (
                 getattr(existing, "data_recipient_global_metastore_id", None) if recipient_type == "D2D" else None
             )
             db_entries.append(
                 {
-                    "action": "updated",
+                    "action": "matching",
                     "recipient_name": recipient_name,
                     "databricks_recipient_id": recipient_name,
                     "recipient_type": recipient_type,
                     "recipient_databricks_org": current_org,
-                    "ip_access_list": list(effective_ips) if recipient_type == "D2O" else [],
+                    "ip_access_list": current_ips_list if recipient_type == "D2O" else [],
                     "token_expiry_days": recip_config.get("token_expiry", 0),
                     "token_rotation_enabled": recip_config.get("token_rotation", False),
-                    # Preserve current Databricks description when not provided in YAML
-                    "description": new_description if new_description else current_comment,
+                    "description": current_comment,
                 }
             )
-            continue
-
-        # Recipient does not exist: create
-        description_value = (recip_config.get("description") or "").strip()
-        token_expiry_days = recip_config.get("token_expiry", 0)
-        ip_list: List[str] = []
+            created_resources["recipients"].append(f"{recipient_name} (already matching)")
+            return
 
+        # Capture previous state for rollback, then apply updates
         if recipient_type == "D2D":
-            recipient_identifier = recip_config.get("recipient_databricks_org") or recip_config.get(
+            previous_state = _previous_state_d2d(existing)
+        else:
+            previous_state = _previous_state_d2o(existing)
+
+        _apply_recipient_updates(
+            recipient_name=recipient_name,
+            recipient_type=recipient_type,
+            recip_config=recip_config,
+            existing=existing,
+            workspace_url=workspace_url,
+            new_description=new_description,
+            current_comment=current_comment,
+        )
+        rollback_list.append(("updated", recipient_name, recipient_type, previous_state))
+        created_resources["recipients"].append(f"{recipient_name} (updated)")
+        logger.success(f"Updated recipient: {recipient_name}")
+
+        # Build db_entry with effective state after updates
+        current_ips = set()
+        if existing.ip_access_list and getattr(existing.ip_access_list, "allowed_ip_addresses", None):
+            current_ips = set(existing.ip_access_list.allowed_ip_addresses)
+        effective_ips = _effective_ips_after_changes(recip_config, current_ips) if recipient_type == "D2O" else []
+        # Use actual value from Databricks for recipient_databricks_org (immutable field)
+        current_org = (
+            getattr(existing, "data_recipient_global_metastore_id", None) if recipient_type == "D2D" else None
+        )
+        db_entries.append(
+            {
+                "action": "updated",
+                "recipient_name": recipient_name,
+                "databricks_recipient_id": recipient_name,
+                "recipient_type": recipient_type,
+                "recipient_databricks_org": current_org,
+                "ip_access_list": list(effective_ips) if recipient_type == "D2O" else [],
+                "token_expiry_days": recip_config.get("token_expiry", 0),
+                "token_rotation_enabled": recip_config.get("token_rotation", False),
+                # Preserve current Databricks description when not provided in YAML
+                "description": new_description if new_description else current_comment,
+            }
+        )
+        return
+
+    # Recipient does not exist: create
+    description_value = (recip_config.get("description") or "").strip()
+    token_expiry_days = recip_config.get("token_expiry", 0)
+    ip_list: List[str] = []
+    if recipient_type == "D2O":
+        ip_list = recip_config.get("recipient_ips_to_add") or recip_config.get("recipient_ips") or []
+
+    # One structured record per recipient instead of a line per attribute
+    ctx = {
+        "recipient": recipient_name,
+        "type": recipient_type,
+        "ips": len(ip_list),
+        "token_expiry_days": token_expiry_days,
+        "desc_len": len(description_value),
+    }
+    logger.info("Creating recipient", **ctx)
+
+    if recipient_type == "D2D":
+        recipient_identifier = recip_config.get("recipient_databricks_org") or recip_config.get(
+            "data_recipient_global_metastore_id"
+        )
+        if not recipient_identifier:
+            raise ValueError(
+                f"Recipient '{recipient_name}' (D2D) requires recipient_databricks_org or "
                 "data_recipient_global_metastore_id"
             )
-            if not recipient_identifier:
-                raise ValueError(
-                    f"Recipient '{recipient_name}' (D2D) requires recipient_databricks_org or "
-                    "data_recipient_global_metastore_id"
-                )
-            result = create_recipient_d2d(
+        result = ApiResult.of(
+            call_with_retry(
+                create_recipient_d2d,
                 recipient_name=recipient_name,
                 recipient_identifier=recipient_identifier,
                 description=description_value,
                 dltshr_workspace_url=workspace_url,
             )
-        else:
-            ip_list = recip_config.get("recipient_ips_to_add") or recip_config.get("recipient_ips") or []
-            result = create_recipient_d2o(
+        )
+    else:
+        result = ApiResult.of(
+            call_with_retry(
+                create_recipient_d2o,
                 recipient_name=recipient_name,
                 description=description_value,
                 dltshr_workspace_url=workspace_url,
                 ip_access_list=ip_list if ip_list else None,
             )
+        )
 
-        if isinstance(result, str):
-            raise RuntimeError(f"Failed to create recipient '{recipient_name}': {result}")
+    if not result.success:
+        raise RuntimeError(f"Failed to create recipient '{recipient_name}': {result.error}")
 
-        rollback_list.append(("created", recipient_name, recipient_type, {}))
+    rollback_list.append(("created", recipient_name, recipient_type, {}))
 
-        # D2O: token expiry after create
-        if recipient_type == "D2O" and token_expiry_days > 0:
-            expiry_result = update_recipient_expiration_time(
+    # D2O: token expiry after create
+    if recipient_type == "D2O" and token_expiry_days > 0:
+        expiry_result = call_with_retry(
+            update_recipient_expiration_time,
+            recipient_name=recipient_name,
+            expiration_time=token_expiry_days,
+            dltshr_workspace_url=workspace_url,
+        )
+        if isinstance(expiry_result, str) and "error" in expiry_result.lower():
+            raise RuntimeError(f"Failed to set token expiry for '{recipient_name}': {expiry_result}")
+
+    # D2O: ensure IPs applied (add any missing)
+    actual_ips: frozenset = frozenset()
+    if recipient_type == "D2O" and ip_list:
+        ial = getattr(result.obj, "ip_access_list", None)
+        if ial and ial.allowed_ip_addresses:
+            actual_ips = frozenset(ial.allowed_ip_addresses)
+        expected_ips = frozenset(ip_list)
+        # Common case: create applied every IP, so skip the difference entirely
+        missing_ips = expected_ips - actual_ips if expected_ips != actual_ips else frozenset()
+        logger.opt(lazy=True).debug(
+            "Recipient {} IPs after create: missing={}", lambda: recipient_name, lambda: sorted(missing_ips)
+        )
+        if missing_ips:
+            add_result = call_with_retry(
+                add_recipient_ip,
                 recipient_name=recipient_name,
-                expiration_time=token_expiry_days,
+                ip_access_list=list(missing_ips),
                 dltshr_workspace_url=workspace_url,
             )
-            if isinstance(expiry_result, str) and "error" in expiry_result.lower():
-                raise RuntimeError(f"Failed to set token expiry for '{recipient_name}': {expiry_result}")
-
-        # D2O: ensure IPs applied (add any missing)
-        if recipient_type == "D2O" and ip_list:
-            actual_ips = (
-                set(result.ip_access_list.allowed_ip_addresses)
-                if hasattr(result, "ip_access_list")
-                and result.ip_access_list
-                and result.ip_access_list.allowed_ip_addresses
-                else set()
-            )
-            expected_ips = set(ip_list)
-            missing_ips = expected_ips - actual_ips
-            if missing_ips:
-                add_result = add_recipient_ip(
-                    recipient_name=recipient_name,
-                    ip_access_list=list(missing_ips),
-                    dltshr_workspace_url=workspace_url,
-                )
-                if isinstance(add_result, str):
-                    raise RuntimeError(f"Failed to add IP addresses to recipient '{recipient_name}': {add_result}")
+            if isinstance(add_result, str):
+                raise RuntimeError(f"Failed to add IP addresses to recipient '{recipient_name}': {add_result}")
+
+    created_resources["recipients"].append(recipient_name)
+    logger.success("Created recipient", **ctx, applied_ips=len(actual_ips))
+
+    created_ips = ip_list if (recipient_type == "D2O" and ip_list) else []
+    db_entries.append(
+        {
+            "action": "created",
+            "recipient_name": recipient_name,
+            "databricks_recipient_id": result.obj.name,
+            "recipient_type": recipient_type,
+            "recipient_databricks_org": (
+                recip_config.get("recipient_databricks_org") if recipient_type == "D2D" else None
+            ),
+            "ip_access_list": created_ips,
+            "token_expiry_days": token_expiry_days,
+            "token_rotation_enabled": recip_config.get("token_rotation", False),
+            "description": description_value,
+        }
+    )
 
-        created_resources["recipients"].append(recipient_name)
-        logger.success(f"Created recipient: {recipient_name}")
 
-        recipient_id = uuid4()
-        created_ips = ip_list if (recipient_type == "D2O" and ip_list) else []
-        db_entries.append(
-            {
-                "action": "created",
-                "recipient_id": recipient_id,
-                "recipient_name": recipient_name,
-                "databricks_recipient_id": result.name,
-                "recipient_type": recipient_type,
-                "recipient_databricks_org": recip_config.get("recipient_databricks_org")
-                if recipient_type == "D2D"
-                else None,
-                "ip_access_list": created_ips,
-                "token_expiry_days": token_expiry_days,
-                "token_rotation_enabled": recip_config.get("token_rotation", False),
-                "description": description_value,
-            }
-        )
+async def ensure_recipients(
+    workspace_url: str,
+    recipients_config: List[Dict[str, Any]],
+    rollback_list: List[tuple],
+    db_entries: List[Dict[str, Any]],
+    created_resources: Optional[Dict[str, List]] = None,
+) -> None:
+    """
+    Ensure all recipients exist with desired state (strategy-agnostic).
+    Databricks operations only — no DB writes. Populates mutable rollback_list and db_entries.
+    On failure, raises without rollback — the orchestrator handles all rollback.
+
+    Recipients are independent, so they are processed concurrently (bounded). The first
+    failure cancels recipients that have not started; in-flight ones finish so their
+    rollback entries are recorded. Outcomes are merged in config order.
+
+    Raises:
+        Exception: On first recipient create/update failure (orchestrator handles rollback).
+    """
+    if created_resources is None:
+        created_resources = {"recipients": []}
+
+    def merge(outcome: Dict[str, List]) -> None:
+        rollback_list.extend(outcome["rollback"])
+        db_entries.extend(outcome["db_entries"])
+        created_resources.setdefault("recipients", []).extend(outcome["recipients"])
+
+    await provision_entities(
+        lambda recip_config, outcome: _ensure_recipient(
+            recip_config, workspace_url, outcome["rollback"], outcome["db_entries"], outcome
+        ),
+        recipients_config,
+        ("rollback", "db_entries", "recipients"),
+        merge,
+    )
@@ -0,0 +1,107 @@
+"""
+Provisioning Resource Records
+
+Single record type for resources touched during a provisioning run, replacing
+parallel per-kind lists for Databricks names and database ids, and a typed
+outcome for the Databricks helper calls that create them.
+"""
+
+import re
+from collections import Counter
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Pattern
+from uuid import UUID
+
+
+@dataclass(slots=True)
+class CreatedResource:
+    """One resource touched by a provisioning run."""
+
+    kind: str  # "recipient" | "share" | "pipeline" | "schedule"
+    name: str
+    db_id: Optional[UUID] = None
+    existing: bool = False
+
+
+# Helper status messages that report a failure
+_ERROR_RE = re.compile(r"error", re.IGNORECASE)
+
+
+def count_by_kind(created: List[CreatedResource]) -> Dict[str, int]:
+    """Count newly created resources (not pre-existing ones) per kind."""
+    return dict(Counter(r.kind for r in created if not r.existing))
+
+
+class ApiStatus(IntEnum):
+    """Classified outcome of a Databricks helper call."""
+
+    OK = 0
+    NOT_FOUND = 1
+    ALREADY_EXISTS = 2
+    ERROR = 3
+
+
+@dataclass(slots=True)
+class ApiResult:
+    """
+    Outcome of one Databricks helper call, classified once where the call is made.
+
+    The SDK helpers report failures as a returned error string (the API routes rely on
+    that), so the provisioning flows wrap each result here and branch on its status
+    instead of type-checking and scanning the text in every branch.
+    """
+
+    status: ApiStatus
+    obj: Any = None
+    error: Optional[str] = None
+
+    @property
+    def success(self) -> bool:
+        """True if the call succeeded."""
+        return self.status is ApiStatus.OK
+
+    @property
+    def already_exists(self) -> bool:
+        """True if the call failed because the resource already exists."""
+        return self.status is ApiStatus.ALREADY_EXISTS
+
+    @property
+    def not_found(self) -> bool:
+        """True if the resource the call targets does not exist."""
+        return self.status is ApiStatus.NOT_FOUND
+
+    @classmethod
+    def of(cls, result: Any, exists: Optional[Pattern[str]] = None) -> "ApiResult":
+        """Wrap a helper result where any returned string is an error message."""
+        if isinstance(result, str):
+            if exists and exists.search(result):
+                return cls(ApiStatus.ALREADY_EXISTS, error=result)
+            return cls(ApiStatus.ERROR, error=result)
+        return cls(ApiStatus.OK, obj=result)
+
+    @classmethod
+    def of_message(
+        cls,
+        result: Any,
+        exists: Optional[Pattern[str]] = None,
+        missing: Optional[Pattern[str]] = None,
+    ) -> "ApiResult":
+        """
+        Wrap a helper result that is a status message on success too (e.g. schedule helpers).
+
+        A message matching exists is ALREADY_EXISTS, one mentioning an error is ERROR, and
+        any other message matching missing is NOT_FOUND; everything else is OK.
+        """
+        if isinstance(result, str):
+            if exists and exists.search(result):
+                return cls(ApiStatus.ALREADY_EXISTS, error=result)
+            if _ERROR_RE.search(result):
+                return cls(ApiStatus.ERROR, error=result)
+            if missing and missing.search(result):
+                return cls(ApiStatus.NOT_FOUND, error=result)
+        return cls(ApiStatus.OK, obj=result)
@@ -4,10 +4,15 @@ Status Tracker
 Helper for updating share pack status during provisioning.
 """
 
+import asyncio
+from typing import Optional
 from uuid import UUID
 
 from loguru import logger
 
+# Progress updates queued within this window are coalesced into one write of the latest message
+UPDATE_COALESCE_SECONDS = 0.05
+
 
 class StatusTracker:
     """
@@ -26,6 +31,8 @@ class StatusTracker:
         """
         self.pool = pool
         self.share_pack_id = share_pack_id
+        self._pending: Optional[str] = None
+        self._writer: Optional[asyncio.Task] = None
 
     async def update(self, message: str):
         """
@@ -34,13 +41,50 @@ class StatusTracker:
         Args:
             message: Status message
         """
+        await self.flush()
+        await self._write_progress(message)
+        logger.info(f"[{self.share_pack_id}] {message}")
+
+    def update_async(self, message: str):
+        """
+        Queue a provisioning status update (IN_PROGRESS) without waiting for the DB write.
+
+        A background task writes queued updates; updates queued while one is pending are
+        coalesced, so only the latest message is written. complete() and fail() flush the
+        queue first, so a late progress write never overwrites the final status.
+
+        Args:
+            message: Status message
+        """
+        logger.info("[{}] {}", self.share_pack_id, message)
+        self._pending = message
+        if self._writer is None or self._writer.done():
+            self._writer = asyncio.create_task(self._drain())
+
+    async def flush(self):
+        """Wait until all queued progress updates have been written."""
+        if self._writer is not None:
+            await self._writer
+            self._writer = None
+
+    async def _drain(self):
+        """Write queued progress updates until none are pending; failures are logged, not raised."""
+        while self._pending is not None:
+            await asyncio.sleep(UPDATE_COALESCE_SECONDS)
+            message, self._pending = self._pending, None
+            try:
+                await self._write_progress(message)
+            except Exception as e:
+                logger.warning("[{}] Failed to write status update '{}': {}", self.share_pack_id, message, e)
+
+    async def _write_progress(self, message: str):
+        """Write an IN_PROGRESS status row."""
         from dbrx_api.workflow.db.repository_share_pack import SharePackRepository
 
         repo = SharePackRepository(self.pool)
         await repo.update_status(
             self.share_pack_id, "IN_PROGRESS", provisioning_status=message, updated_by="orchestrator"
         )
-        logger.info(f"[{self.share_pack_id}] {message}")
 
     async def complete(self, message: str = "All steps completed successfully"):
         """
@@ -51,6 +95,7 @@ class StatusTracker:
         """
         from dbrx_api.workflow.db.repository_share_pack import SharePackRepository
 
+        await self.flush()
         repo = SharePackRepository(self.pool)
         await repo.update_status(
             self.share_pack_id,
@@ -71,6 +116,7 @@ class StatusTracker:
         """
         from dbrx_api.workflow.db.repository_share_pack import SharePackRepository
 
+        await self.flush()
         repo = SharePackRepository(self.pool)
         await repo.update_status(
             self.share_pack_id,
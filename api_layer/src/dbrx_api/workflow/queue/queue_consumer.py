@@ -5,10 +5,16 @@ Background task that polls the queue and triggers provisioning.
 """
 
 import asyncio
-import json
 
 from loguru import logger
 
+try:
+    import orjson as json
+except ImportError:
+    import json
+
+from dbrx_api.workflow.enums import SharePackStatus
+
 
 def is_retryable_error(error: Exception) -> bool:
     """
@@ -118,6 +124,14 @@ async def start_queue_consumer(queue_client, db_pool):
                         queue_client.delete_message(msg)
                         continue
 
+                    # A re-upload resets the status to IN_PROGRESS, so a COMPLETED share pack here
+                    # means this message was delivered again after provisioning already succeeded
+                    # (e.g. its visibility timeout ran out before it was deleted). Skip the rerun.
+                    if share_pack.get("share_pack_status") == SharePackStatus.COMPLETED.value:
+                        logger.info(f"Share pack {share_pack_id} is already COMPLETED, skipping duplicate message")
+                        queue_client.delete_message(msg)
+                        continue
+
                     # Call orchestrator based on strategy with retry logic
                     from dbrx_api.workflow.orchestrator.provisioning import provision_sharepack_new
                     from dbrx_api.workflow.orchestrator.provisioning_delete import provision_sharepack_delete
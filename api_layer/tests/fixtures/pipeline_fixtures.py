@@ -235,9 +235,9 @@ def mock_workspace_client_pipelines(mock_pipelines_api):
     from datetime import timezone
 
     token_return = ("test-token", datetime(2026, 12, 31, 23, 59, 59, tzinfo=timezone.utc))
-    with patch("dbrx_api.jobs.dbrx_pipelines.get_auth_token") as mock_token:
+    with patch("dbrx_api.dbrx_auth.shared_client.get_auth_token") as mock_token:
         mock_token.return_value = token_return
-        with patch("dbrx_api.jobs.dbrx_pipelines.WorkspaceClient") as mock_client_class:
+        with patch("dbrx_api.dbrx_auth.shared_client.WorkspaceClient") as mock_client_class:
             mock_client = MagicMock()
             mock_client.pipelines = mock_pipelines_api
             mock_client_class.return_value = mock_client
@@ -124,6 +124,6 @@ def mock_auth_token():
     test_token = "test-databricks-token"
     test_expiry = datetime.now(timezone.utc) + timedelta(hours=1)
 
-    with patch("dbrx_api.jobs.dbrx_schedule.get_auth_token") as mock:
+    with patch("dbrx_api.dbrx_auth.shared_client.get_auth_token") as mock:
         mock.return_value = (test_token, test_expiry)
         yield mock
@@ -0,0 +1,200 @@
+"""Unit tests for workflow/orchestrator/concurrency.py.
+
+Tests the bounded fan-out helpers (fail-fast cancellation, per-item results,
+per-outcome merging, per-resource rollback) and the throttling retry wrapper.
+"""
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from dbrx_api.workflow.orchestrator import concurrency
+from dbrx_api.workflow.orchestrator.concurrency import call_with_retry
+from dbrx_api.workflow.orchestrator.concurrency import gather_bounded
+from dbrx_api.workflow.orchestrator.concurrency import provision_entities
+from dbrx_api.workflow.orchestrator.concurrency import rollback_by_resource
+from dbrx_api.workflow.orchestrator.concurrency import run_bounded
+from dbrx_api.workflow.orchestrator.concurrency import run_sync
+from dbrx_api.workflow.orchestrator.ratelimit import TokenBucket
+
+
+@pytest.fixture(autouse=True)
+def no_rate_limit():
+    """Disable the shared Databricks item limiter so tests do not wait on permits."""
+    with patch.object(concurrency, "databricks_item_limiter", TokenBucket(0)):
+        yield
+
+
+class TestRunBounded:
+    """Tests for run_bounded."""
+
+    @pytest.mark.asyncio
+    async def test_results_in_item_order_within_limit(self):
+        """Test that results keep item order and no more than limit calls run at once."""
+        lock = threading.Lock()
+        running = 0
+        peak = 0
+
+        def work(item):
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.02)
+            with lock:
+                running -= 1
+            return item * 2
+
+        result = await run_bounded(work, range(8), limit=3)
+
+        assert result == [0, 2, 4, 6, 8, 10, 12, 14]
+        assert peak <= 3
+
+    @pytest.mark.asyncio
+    async def test_fail_fast_lets_in_flight_calls_finish(self):
+        """Test that a failure cancels queued items while the in-flight call still completes."""
+        started = set()
+        finished = set()
+
+        def work(item):
+            started.add(item)
+            if item == 0:
+                time.sleep(0.05)
+                raise ValueError("boom")
+            time.sleep(0.3)
+            finished.add(item)
+            return item
+
+        with pytest.raises(ValueError, match="boom"):
+            await run_bounded(work, range(5), limit=2)
+
+        assert started == {0, 1}
+        assert finished == {1}
+
+
+class TestGatherBounded:
+    """Tests for gather_bounded."""
+
+    @pytest.mark.asyncio
+    async def test_failures_returned_in_place(self):
+        """Test that every item runs and each failure is returned at its item's position."""
+        seen = []
+
+        async def work(item):
+            seen.append(item)
+            if item % 2:
+                raise RuntimeError(f"failed {item}")
+            return item
+
+        result = await gather_bounded(work, range(4), limit=2)
+
+        assert sorted(seen) == [0, 1, 2, 3]
+        assert result[0] == 0 and result[2] == 2
+        assert isinstance(result[1], RuntimeError) and str(result[1]) == "failed 1"
+        assert isinstance(result[3], RuntimeError) and str(result[3]) == "failed 3"
+
+
+class TestProvisionEntities:
+    """Tests for provision_entities."""
+
+    @pytest.mark.asyncio
+    async def test_outcomes_merged_in_order_when_one_fails(self):
+        """Test that every outcome is merged, in item order, even when a worker raises."""
+        merged = []
+
+        def provision(item, outcome):
+            outcome["rollback"].append(item)
+            if item == "b":
+                raise RuntimeError("b failed")
+
+        with pytest.raises(RuntimeError, match="b failed"):
+            await provision_entities(provision, ["a", "b"], ["rollback", "db"], merged.append, limit=1)
+
+        assert merged == [{"rollback": ["a"], "db": []}, {"rollback": ["b"], "db": []}]
+
+
+class TestRollbackByResource:
+    """Tests for rollback_by_resource."""
+
+    @pytest.mark.asyncio
+    async def test_one_call_per_resource_in_recorded_order(self):
+        """Test that entries are grouped per resource, keeping the order they were recorded in."""
+        calls = []
+
+        def rollback(entries, workspace_url):
+            calls.append((workspace_url, list(entries)))
+
+        entries = [("s1", 1), ("s2", 1), ("s1", 2)]
+        await rollback_by_resource(rollback, entries, "https://ws", key=lambda entry: entry[0])
+
+        assert sorted(calls) == [
+            ("https://ws", [("s1", 1), ("s1", 2)]),
+            ("https://ws", [("s2", 1)]),
+        ]
+
+
+class TestRunSync:
+    """Tests for run_sync."""
+
+    @pytest.mark.asyncio
+    async def test_runs_on_sdk_pool(self):
+        """Test that the call runs on a dbrx-sdk worker thread and its result is returned."""
+        name = await run_sync(lambda: threading.current_thread().name)
+
+        assert name.startswith("dbrx-sdk")
+
+
+class TestCallWithRetry:
+    """Tests for call_with_retry."""
+
+    @patch("dbrx_api.workflow.orchestrator.concurrency.time.sleep")
+    def test_throttled_string_retried_after_retry_after(self, mock_sleep):
+        """Test that a returned 429 message is retried, waiting as long as its Retry-After asks."""
+        responses = iter(["429 Too Many Requests (Retry-After: 2)", "ok"])
+
+        result = call_with_retry(lambda: next(responses))
+
+        assert result == "ok"
+        mock_sleep.assert_called_once_with(2.0)
+
+    @patch("dbrx_api.workflow.orchestrator.concurrency.time.sleep")
+    def test_throttled_exception_retried(self, mock_sleep):
+        """Test that a raised throttling error is retried with backoff."""
+        calls = []
+
+        def fn():
+            calls.append(1)
+            if len(calls) == 1:
+                raise RuntimeError("TEMPORARILY_UNAVAILABLE")
+            return None
+
+        assert call_with_retry(fn) is None
+        assert len(calls) == 2
+        mock_sleep.assert_called_once()
+
+    @patch("dbrx_api.workflow.orchestrator.concurrency.time.sleep")
+    def test_other_errors_not_retried(self, mock_sleep):
+        """Test that non-throttling errors are returned or raised on the first attempt."""
+        assert call_with_retry(lambda: "Share not found") == "Share not found"
+
+        def fn():
+            raise ValueError("bad request")
+
+        with pytest.raises(ValueError):
+            call_with_retry(fn)
+        mock_sleep.assert_not_called()
+
+    @patch("dbrx_api.workflow.orchestrator.concurrency.time.sleep")
+    def test_gives_up_after_retry_attempts(self, mock_sleep):
+        """Test that the last throttled result is returned once every attempt is used."""
+        calls = []
+
+        def fn():
+            calls.append(1)
+            return "rate limit exceeded"
+
+        assert call_with_retry(fn) == "rate limit exceeded"
+        assert len(calls) == concurrency.RETRY_ATTEMPTS
+        assert mock_sleep.call_count == concurrency.RETRY_ATTEMPTS - 1
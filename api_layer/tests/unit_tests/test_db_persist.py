@@ -0,0 +1,66 @@
+"""Unit tests for workflow/orchestrator/db_persist.py.
+
+Tests that newly created entities written through create_many_from_config take their
+ids and created/updated/unchanged actions from what the repository actually wrote.
+"""
+
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from dbrx_api.workflow.db.repository_base import ConfigWrite
+from dbrx_api.workflow.orchestrator.db_persist import persist_recipients_to_db
+from dbrx_api.workflow.orchestrator.db_persist import persist_shares_to_db
+
+
+def _share_entry(name):
+    return {"action": "created", "share_name": name, "databricks_share_id": name}
+
+
+class TestPersistShares:
+    """Tests for persist_shares_to_db."""
+
+    @pytest.mark.asyncio
+    async def test_mapping_and_actions_from_written_rows(self):
+        """Test that a reused share_id is mapped for pipelines and a reused share is reported as updated."""
+        reused, new = uuid4(), uuid4()
+        share_repo = AsyncMock()
+        share_repo.create_many_from_config.return_value = [
+            ConfigWrite(reused, uuid4(), "updated"),
+            ConfigWrite(new, uuid4(), "created"),
+            None,
+        ]
+        entries = [_share_entry("existing"), _share_entry("brand_new"), _share_entry("broken")]
+
+        share_name_to_id = await persist_shares_to_db(entries, uuid4(), share_repo)
+
+        assert share_name_to_id == {"existing": reused, "brand_new": new}
+        assert [entry["action"] for entry in entries] == ["updated", "created", "created"]
+        # Every created share is written in one batch, each with a freshly generated id
+        rows = share_repo.create_many_from_config.call_args.args[0]
+        assert [row["share_name"] for row in rows] == ["existing", "brand_new", "broken"]
+        assert len({row["share_id"] for row in rows}) == 3
+        share_repo.get_current.assert_not_awaited()
+
+
+class TestPersistRecipients:
+    """Tests for persist_recipients_to_db."""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_recipient_not_counted_as_created(self):
+        """Test that a created entry whose record was already current is reported as unchanged."""
+        existing = uuid4()
+        recipient_repo = AsyncMock()
+        recipient_repo.create_many_from_config.return_value = [ConfigWrite(existing, uuid4(), "unchanged")]
+        entry = {
+            "action": "created",
+            "recipient_name": "r1",
+            "databricks_recipient_id": "r1",
+            "recipient_type": "D2O",
+        }
+
+        await persist_recipients_to_db([entry], uuid4(), "owner@example.com", recipient_repo)
+
+        assert entry["action"] == "unchanged"
+        assert entry["recipient_id"] == existing
@@ -22,8 +22,8 @@ from dbrx_api.dltshr.recipient import update_recipient_expiration_time
 class TestListRecipients:
     """Tests for list_recipients function."""
 
-    @patch("dbrx_api.dltshr.recipient.WorkspaceClient")
-    @patch("dbrx_api.dltshr.recipient.get_auth_token")
+    @patch("dbrx_api.dbrx_auth.shared_client.WorkspaceClient")
+    @patch("dbrx_api.dbrx_auth.shared_client.get_auth_token")
     def test_list_recipients_success(self, mock_auth, mock_client_class):
         """Test successful listing of all recipients."""
         mock_auth.return_value = ("test_token", 3600)
@@ -41,8 +41,8 @@ class TestListRecipients:
 
         assert len(result) == 2
 
-    @patch("dbrx_api.dltshr.recipient.WorkspaceClient")
-    @patch("dbrx_api.dltshr.recipient.get_auth_token")
+    @patch("dbrx_api.dbrx_auth.shared_client.WorkspaceClient")
+    @patch("dbrx_api.dbrx_auth.shared_client.get_auth_token")
     def test_list_recipients_with_prefix(self, mock_auth, mock_client_class):
         """Test listing recipients with prefix filter."""
         mock_auth.return_value = ("test_token", 3600)
@@ -64,8 +64,8 @@ class TestListRecipients:
 class TestGetRecipients:
     """Tests for get_recipients function."""
 
-    @patch("dbrx_api.dltshr.recipient.WorkspaceClient")
-    @patch("dbrx_api.dltshr.recipient.get_auth_token")
+    @patch("dbrx_api.dbrx_auth.shared_client.WorkspaceClient")
+    @patch("dbrx_api.dbrx_auth.shared_client.get_auth_token")
     def test_get_recipients_success(self, mock_auth, mock_client_class):
         """Test successful retrieval of a recipient."""
         mock_auth.return_value = ("test_token", 3600)
@@ -82,8 +82,8 @@ class TestGetRecipients:
         assert result is not None
         assert result.name == "test_recipient"
 
-    @patch("dbrx_api.dltshr.recipient.WorkspaceClient")
-    @patch("dbrx_api.dltshr.recipient.get_auth_token")
+    @patch("dbrx_api.dbrx_auth.shared_client.WorkspaceClient")
+    @patch("dbrx_api.dbrx_auth.shared_client.get_auth_token")
     def test_get_recipients_not_found(self, mock_auth, mock_client_class):
         """Test retrieval when recipient doesn't exist."""
         mock_auth.return_value = ("test_token", 3600)
@@ -100,8 +100,8 @@ class TestGetRecipients:
 class TestCreateRecipientD2D:
     """Tests for create_recipient_d2d function."""
 
-    @patch("dbrx_api.dltshr.recipient.WorkspaceClient")
-    @patch("dbrx_api.dltshr.recipient.get_auth_token")
+    @patch("dbrx_api.dbrx_auth.shared_client.WorkspaceClient")
+    @patch("dbrx_api.dbrx_auth.shared_client.get_auth_token")
     def test_create_d2d_success(self, mock_auth, mock_client_class):
         """Test successful D2D recipient creation."""
         mock_auth.return_value = ("test_token", 3600)
@@ -123,8 +123,8 @@ class TestCreateRecipientD2D:
 
         assert result.name == "new_recipient"
 
-    @patch("dbrx_api.dltshr.recipient.WorkspaceClient")
-    @patch("dbrx_api.dltshr.recipient.get_auth_token")
+    @patch("dbrx_api.dbrx_auth.shared_client.WorkspaceClient")
+    @patch("dbrx_api.dbrx_auth.shared_client.get_auth_token")
     def test_create_d2d_invalid_identifier(self, mock_auth, mock_client_class):
         """Test D2D creation with invalid identifier."""
         mock_auth.return_value = ("test_token", 3600)
@@ -142,8 +142,8 @@ class TestCreateRecipientD2D:
 
         assert "Invalid recipient_identifier" in result
 
-    @patch("dbrx_api.dltshr.recipient.WorkspaceClient")
-    @patch("dbrx_api.dltshr.recipient.get_auth_token")
+    @patch("dbrx_api.dbrx_auth.shared_client.WorkspaceClient")
+    @patch("dbrx_api.dbrx_auth.shared_client.get_auth_token")
     def test_create_d2d_already_exists(self, mock_auth, mock_client_class):
         """Test D2D creation when recipient already exists."""
         mock_auth.return_value = ("test_token", 3600)
@@ -165,8 +165,8 @@ class TestCreateRecipientD2D:
 class TestCreateRecipientD2O:
     """Tests for create_recipient_d2o function."""
 
-    @patch("dbrx_api.dltshr.recipient.WorkspaceClient")
-    @patch("dbrx_api.dltshr.recipient.get_auth_token")
+    @patch("dbrx_api.dbrx_auth.shared_client.WorkspaceClient")
+    @patch("dbrx_api.dbrx_auth.shared_client.get_auth_token")
     def test_create_d2o_success(self, mock_auth, mock_client_class):
         """Test successful D2O recipient creation."""
         mock_auth.return_value = ("test_token", 3600)
@@ -187,8 +187,8 @@ class TestCreateRecipientD2O:
 
         assert result.name == "new_recipient"
 
-    @patch("dbrx_api.dltshr.recipient.WorkspaceClient")
-    @patch("dbrx_api.dltshr.recipient.get_auth_token")
+    @patch("dbrx_api.dbrx_auth.shared_client.WorkspaceClient")
+    @patch("dbrx_api.dbrx_auth.shared_client.get_auth_token")
     def test_create_d2o_with_ip_list(self, mock_auth, mock_client_class):
         """Test D2O creation with IP access list."""
         mock_auth.return_value = ("test_token", 3600)
@@ -216,8 +216,8 @@ class TestCreateRecipientD2O:
 class TestRotateRecipientToken:
     """Tests for rotate_recipient_token function."""
 
-    @patch("dbrx_api.dltshr.recipient.WorkspaceClient")
-    @patch("dbrx_api.dltshr.recipient.get_auth_token")
+    @patch("dbrx_api.dbrx_auth.shared_client.WorkspaceClient")
+    @patch("dbrx_api.dbrx_auth.shared_client.get_auth_token")
     def test_rotate_token_success(self, mock_auth, mock_client_class):
         """Test successful token rotation."""
         mock_auth.return_value = ("test_token", 3600)
@@ -236,8 +236,8 @@ class TestRotateRecipientToken:
 
         assert result is not None
 
-    @patch("dbrx_api.dltshr.recipient.WorkspaceClient")
-    @patch("dbrx_api.dltshr.recipient.get_auth_token")
+    @patch("dbrx_api.dbrx_auth.shared_client.WorkspaceClient")
+    @patch("dbrx_api.dbrx_auth.shared_client.get_auth_token")
     def test_rotate_token_cannot_extend(self, mock_auth, mock_client_class):
         """Test token rotation with cannot extend error."""
         mock_auth.return_value = ("test_token", 3600)
@@ -254,8 +254,8 @@ class TestRotateRecipientToken:
 
         assert "Cannot extend" in result
 
-    @patch("dbrx_api.dltshr.recipient.WorkspaceClient")
-    @patch("dbrx_api.dltshr.recipient.get_auth_token")
+    @patch("dbrx_api.dbrx_auth.shared_client.WorkspaceClient")
+    @patch("dbrx_api.dbrx_auth.shared_client.get_auth_token")
     def test_rotate_token_max_tokens(self, mock_auth, mock_client_class):
         """Test token rotation with max tokens error."""
         mock_auth.return_value = ("test_token", 3600)
@@ -273,8 +273,8 @@ class TestRotateRecipientToken:
 
         assert "maximum number of active tokens" in result
 
-    @patch("dbrx_api.dltshr.recipient.WorkspaceClient")
-    @patch("dbrx_api.dltshr.recipient.get_auth_token")
+    @patch("dbrx_api.dbrx_auth.shared_client.WorkspaceClient")
+    @patch("dbrx_api.dbrx_auth.shared_client.get_auth_token")
     def test_rotate_token_not_owner(self, mock_auth, mock_client_class):
         """Test token rotation when not owner."""
         mock_auth.return_value = ("test_token", 3600)
@@ -290,8 +290,8 @@ class TestRotateRecipientToken:
 
         assert "Permission denied" in result
 
-    @patch("dbrx_api.dltshr.recipient.WorkspaceClient")
-    @patch("dbrx_api.dltshr.recipient.get_auth_token")
+    @patch("dbrx_api.dbrx_auth.shared_client.WorkspaceClient")
+    @patch("dbrx_api.dbrx_auth.shared_client.get_auth_token")
     def test_rotate_token_non_token_recipient(self, mock_auth, mock_client_class):
         """Test token rotation on non-TOKEN recipient."""
         mock_auth.return_value = ("test_token", 3600)
@@ -311,8 +311,8 @@ class TestRotateRecipientToken:
 class TestAddRecipientIP:
     """Tests for add_recipient_ip function."""
 
-    @patch("dbrx_api.dltshr.recipient.WorkspaceClient")
-    @patch("dbrx_api.dltshr.recipient.get_auth_token")
+    @patch("dbrx_api.dbrx_auth.shared_client.WorkspaceClient")
+    @patch("dbrx_api.dbrx_auth.shared_client.get_auth_token")
     def test_add_ip_success(self, mock_auth, mock_client_class):
         """Test successful IP addition."""
         mock_auth.return_value = ("test_token", 3600)
@@ -336,8 +336,8 @@ class TestAddRecipientIP:
 
         assert result is not None
 
-    @patch("dbrx_api.dltshr.recipient.WorkspaceClient")
-    @patch("dbrx_api.dltshr.recipient.get_auth_token")
+    @patch("dbrx_api.dbrx_auth.shared_client.WorkspaceClient")
+    @patch("dbrx_api.dbrx_auth.shared_client.get_auth_token")
     def test_add_ip_not_owner(self, mock_auth, mock_client_class):
         """Test adding IP when not owner."""
         mock_auth.return_value = ("test_token", 3600)
@@ -362,8 +362,8 @@ class TestAddRecipientIP:
 class TestRevokeRecipientIP:
     """Tests for revoke_recipient_ip function."""
 
-    @patch("dbrx_api.dltshr.recipient.WorkspaceClient")
-    @patch("dbrx_api.dltshr.recipient.get_auth_token")
+    @patch("dbrx_api.dbrx_auth.shared_client.WorkspaceClient")
+    @patch("dbrx_api.dbrx_auth.shared_client.get_auth_token")
     def test_revoke_ip_success(self, mock_auth, mock_client_class):
         """Test successful IP revocation."""
         mock_auth.return_value = ("test_token", 3600)
@@ -387,8 +387,8 @@ class TestRevokeRecipientIP:
 
         assert result is not None
 
-    @patch("dbrx_api.dltshr.recipient.WorkspaceClient")
-    @patch("dbrx_api.dltshr.recipient.get_auth_token")
+    @patch("dbrx_api.dbrx_auth.shared_client.WorkspaceClient")
+    @patch("dbrx_api.dbrx_auth.shared_client.get_auth_token")
     def test_revoke_ip_no_ips(self, mock_auth, mock_client_class):
         """Test revoking IP from recipient with no IPs."""
         mock_auth.return_value = ("test_token", 3600)
@@ -418,8 +418,8 @@ class TestRevokeRecipientIP:
 
         assert result is None
 
-    @patch("dbrx_api.dltshr.recipient.WorkspaceClient")
-    @patch("dbrx_api.dltshr.recipient.get_auth_token")
+    @patch("dbrx_api.dbrx_auth.shared_client.WorkspaceClient")
+    @patch("dbrx_api.dbrx_auth.shared_client.get_auth_token")
     def test_revoke_ip_empty_list(self, mock_auth, mock_client_class):
         """Test revoking with empty list."""
         mock_auth.return_value = ("test_token", 3600)
@@ -436,8 +436,8 @@ class TestRevokeRecipientIP:
 class TestUpdateRecipientDescription:
     """Tests for update_recipient_description function."""
 
-    @patch("dbrx_api.dltshr.recipient.WorkspaceClient")
-    @patch("dbrx_api.dltshr.recipient.get_auth_token")
+    @patch("dbrx_api.dbrx_auth.shared_client.WorkspaceClient")
+    @patch("dbrx_api.dbrx_auth.shared_client.get_auth_token")
     def test_update_description_success(self, mock_auth, mock_client_class):
         """Test successful description update."""
         mock_auth.return_value = ("test_token", 3600)
@@ -467,8 +467,8 @@ class TestUpdateRecipientDescription:
 
         assert result is None
 
-    @patch("dbrx_api.dltshr.recipient.WorkspaceClient")
-    @patch("dbrx_api.dltshr.recipient.get_auth_token")
+    @patch("dbrx_api.dbrx_auth.shared_client.WorkspaceClient")
+    @patch("dbrx_api.dbrx_auth.shared_client.get_auth_token")
     def test_update_description_not_owner(self, mock_auth, mock_client_class):
         """Test updating description when not owner."""
         mock_auth.return_value = ("test_token", 3600)
@@ -489,8 +489,8 @@ class TestUpdateRecipientDescription:
 class TestUpdateRecipientExpirationTime:
     """Tests for update_recipient_expiration_time function."""
 
-    @patch("dbrx_api.dltshr.recipient.WorkspaceClient")
-    @patch("dbrx_api.dltshr.recipient.get_auth_token")
+    @patch("dbrx_api.dbrx_auth.shared_client.WorkspaceClient")
+    @patch("dbrx_api.dbrx_auth.shared_client.get_auth_token")
     def test_update_expiration_success(self, mock_auth, mock_client_class):
         """Test successful expiration time update."""
         mock_auth.return_value = ("test_token", 3600)
@@ -509,8 +509,8 @@ class TestUpdateRecipientExpirationTime:
 
         assert result is not None
 
-    @patch("dbrx_api.dltshr.recipient.WorkspaceClient")
-    @patch("dbrx_api.dltshr.recipient.get_auth_token")
+    @patch("dbrx_api.dbrx_auth.shared_client.WorkspaceClient")
+    @patch("dbrx_api.dbrx_auth.shared_client.get_auth_token")
     def test_update_expiration_not_owner(self, mock_auth, mock_client_class):
         """Test updating expiration when not owner."""
         mock_auth.return_value = ("test_token", 3600)
@@ -531,8 +531,8 @@ class TestUpdateRecipientExpirationTime:
 class TestDeleteRecipient:
     """Tests for delete_recipient function."""
 
-    @patch("dbrx_api.dltshr.recipient.WorkspaceClient")
-    @patch("dbrx_api.dltshr.recipient.get_auth_token")
+    @patch("dbrx_api.dbrx_auth.shared_client.WorkspaceClient")
+    @patch("dbrx_api.dbrx_auth.shared_client.get_auth_token")
     def test_delete_recipient_success(self, mock_auth, mock_client_class):
         """Test successful recipient deletion."""
         mock_auth.return_value = ("test_token", 3600)
@@ -545,8 +545,8 @@ class TestDeleteRecipient:
 
         assert result is None
 
-    @patch("dbrx_api.dltshr.recipient.WorkspaceClient")
-    @patch("dbrx_api.dltshr.recipient.get_auth_token")
+    @patch("dbrx_api.dbrx_auth.shared_client.WorkspaceClient")
+    @patch("dbrx_api.dbrx_auth.shared_client.get_auth_token")
     def test_delete_recipient_not_owner(self, mock_auth, mock_client_class):
         """Test deletion when not owner."""
         mock_auth.return_value = ("test_token", 3600)
@@ -559,8 +559,8 @@ class TestDeleteRecipient:
 
         assert "not an owner" in result
 
-    @patch("dbrx_api.dltshr.recipient.WorkspaceClient")
-    @patch("dbrx_api.dltshr.recipient.get_auth_token")
+    @patch("dbrx_api.dbrx_auth.shared_client.WorkspaceClient")
+    @patch("dbrx_api.dbrx_auth.shared_client.get_auth_token")
     def test_delete_recipient_unauthorized(self, mock_auth, mock_client_class):
         """Test deletion with unauthorized access."""
         mock_auth.return_value = ("test_token", 3600)
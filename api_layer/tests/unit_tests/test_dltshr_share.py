@@ -8,6 +8,7 @@ from databricks.sdk.service.sharing import ShareInfo
 
 from dbrx_api.dltshr.share import add_data_object_to_share
 from dbrx_api.dltshr.share import add_recipients_to_share
+from dbrx_api.dltshr.share import add_recipients_to_share_bulk
 from dbrx_api.dltshr.share import create_share
 from dbrx_api.dltshr.share import delete_share
 from dbrx_api.dltshr.share import get_shares
@@ -19,8 +20,8 @@ from dbrx_api.dltshr.share import revoke_data_object_from_share
 class TestListSharesAll:
     """Tests for list_shares_all function."""
 
-    @patch("dbrx_api.dltshr.share.WorkspaceClient")
-    @patch("dbrx_api.dltshr.share.get_auth_token")
+    @patch("dbrx_api.dbrx_auth.shared_client.WorkspaceClient")
+    @patch("dbrx_api.dbrx_auth.shared_client.get_auth_token")
     def test_list_shares_all_success(self, mock_auth, mock_client_class):
         """Test successful listing of all shares."""
         mock_auth.return_value = ("test_token", 3600)
@@ -39,8 +40,8 @@ class TestListSharesAll:
         assert len(result) == 2
         mock_client.shares.list_shares.assert_called_once_with(max_results=100)
 
-    @patch("dbrx_api.dltshr.share.WorkspaceClient")
-    @patch("dbrx_api.dltshr.share.get_auth_token")
+    @patch("dbrx_api.dbrx_auth.shared_client.WorkspaceClient")
+    @patch("dbrx_api.dbrx_auth.shared_client.get_auth_token")
     def test_list_shares_all_with_prefix(self, mock_auth, mock_client_class):
         """Test listing shares with prefix filter."""
         mock_auth.return_value = ("test_token", 3600)
@@ -59,8 +60,8 @@ class TestListSharesAll:
         assert len(result) == 1
         assert result[0].name == "test_share1"
 
-    @patch("dbrx_api.dltshr.share.WorkspaceClient")
-    @patch("dbrx_api.dltshr.share.get_auth_token")
+    @patch("dbrx_api.dbrx_auth.shared_client.WorkspaceClient")
+    @patch("dbrx_api.dbrx_auth.shared_client.get_auth_token")
     def test_list_shares_all_empty(self, mock_auth, mock_client_class):
         """Test listing shares when none exist."""
         mock_auth.return_value = ("test_token", 3600)
@@ -77,8 +78,8 @@ class TestListSharesAll:
 class TestGetShares:
     """Tests for get_shares function."""
 
-    @patch("dbrx_api.dltshr.share.WorkspaceClient")
-    @patch("dbrx_api.dltshr.share.get_auth_token")
+    @patch("dbrx_api.dbrx_auth.shared_client.WorkspaceClient")
+    @patch("dbrx_api.dbrx_auth.shared_client.get_auth_token")
     def test_get_shares_success(self, mock_auth, mock_client_class):
         """Test successful retrieval of a share."""
         mock_auth.return_value = ("test_token", 3600)
@@ -97,8 +98,8 @@ class TestGetShares:
         assert result.name == "test_share"
         mock_client.shares.get.assert_called_once_with(name="test_share")
 
-    @patch("dbrx_api.dltshr.share.WorkspaceClient")
-    @patch("dbrx_api.dltshr.share.get_auth_token")
+    @patch("dbrx_api.dbrx_auth.shared_client.WorkspaceClient")
+    @patch("dbrx_api.dbrx_auth.shared_client.get_auth_token")
     def test_get_shares_not_found(self, mock_auth, mock_client_class):
         """Test retrieval when share doesn't exist."""
         mock_auth.return_value = ("test_token", 3600)
@@ -115,8 +116,8 @@ class TestGetShares:
 class TestCreateShare:
     """Tests for create_share function."""
 
-    @patch("dbrx_api.dltshr.share.WorkspaceClient")
-    @patch("dbrx_api.dltshr.share.get_auth_token")
+    @patch("dbrx_api.dbrx_auth.shared_client.WorkspaceClient")
+    @patch("dbrx_api.dbrx_auth.shared_client.get_auth_token")
     def test_create_share_success(self, mock_auth, mock_client_class):
         """Test successful share creation."""
         mock_auth.return_value = ("test_token", 3600)
@@ -158,8 +159,8 @@ class TestCreateShare:
             "invalid_state",
         ],
     )
-    @patch("dbrx_api.dltshr.share.WorkspaceClient")
-    @patch("dbrx_api.dltshr.share.get_auth_token")
+    @patch("dbrx_api.dbrx_auth.shared_client.WorkspaceClient")
+    @patch("dbrx_api.dbrx_auth.shared_client.get_auth_token")
     def test_create_share_errors(self, mock_auth, mock_client_class, error_message: str, expected_substring: str):
         """Test share creation error handling for various error scenarios."""
         mock_auth.return_value = ("test_token", 3600)
@@ -181,8 +182,8 @@ class TestCreateShare:
 class TestDeleteShare:
     """Tests for delete_share function."""
 
-    @patch("dbrx_api.dltshr.share.WorkspaceClient")
-    @patch("dbrx_api.dltshr.share.get_auth_token")
+    @patch("dbrx_api.dbrx_auth.shared_client.WorkspaceClient")
+    @patch("dbrx_api.dbrx_auth.shared_client.get_auth_token")
     def test_delete_share_success(self, mock_auth, mock_client_class):
         """Test successful share deletion."""
         mock_auth.return_value = ("test_token", 3600)
@@ -196,8 +197,8 @@ class TestDeleteShare:
         assert result is None
         mock_client.shares.delete.assert_called_once_with(name="test_share")
 
-    @patch("dbrx_api.dltshr.share.WorkspaceClient")
-    @patch("dbrx_api.dltshr.share.get_auth_token")
+    @patch("dbrx_api.dbrx_auth.shared_client.WorkspaceClient")
+    @patch("dbrx_api.dbrx_auth.shared_client.get_auth_token")
     def test_delete_share_permission_denied(self, mock_auth, mock_client_class):
         """Test share deletion with permission denied."""
         mock_auth.return_value = ("test_token", 3600)
@@ -210,8 +211,8 @@ class TestDeleteShare:
 
         assert result == "User is not an owner of Share"
 
-    @patch("dbrx_api.dltshr.share.WorkspaceClient")
-    @patch("dbrx_api.dltshr.share.get_auth_token")
+    @patch("dbrx_api.dbrx_auth.shared_client.WorkspaceClient")
+    @patch("dbrx_api.dbrx_auth.shared_client.get_auth_token")
     def test_delete_share_not_found(self, mock_auth, mock_client_class):
         """Test share deletion when share doesn't exist."""
         mock_auth.return_value = ("test_token", 3600)
@@ -228,8 +229,8 @@ class TestDeleteShare:
 class TestAddDataObjectToShare:
     """Tests for add_data_object_to_share function."""
 
-    @patch("dbrx_api.dltshr.share.WorkspaceClient")
-    @patch("dbrx_api.dltshr.share.get_auth_token")
+    @patch("dbrx_api.dbrx_auth.shared_client.WorkspaceClient")
+    @patch("dbrx_api.dbrx_auth.shared_client.get_auth_token")
     def test_add_data_objects_success(self, mock_auth, mock_client_class):
         """Test successful addition of data objects."""
         mock_auth.return_value = ("test_token", 3600)
@@ -249,8 +250,8 @@ class TestAddDataObjectToShare:
         assert result is not None
         mock_client.shares.update.assert_called_once()
 
-    @patch("dbrx_api.dltshr.share.WorkspaceClient")
-    @patch("dbrx_api.dltshr.share.get_auth_token")
+    @patch("dbrx_api.dbrx_auth.shared_client.WorkspaceClient")
+    @patch("dbrx_api.dbrx_auth.shared_client.get_auth_token")
     def test_add_data_objects_empty(self, mock_auth, mock_client_class):
         """Test adding empty objects list."""
         mock_auth.return_value = ("test_token", 3600)
@@ -263,8 +264,8 @@ class TestAddDataObjectToShare:
 
         assert result == "No data objects provided to add to share."
 
-    @patch("dbrx_api.dltshr.share.WorkspaceClient")
-    @patch("dbrx_api.dltshr.share.get_auth_token")
+    @patch("dbrx_api.dbrx_auth.shared_client.WorkspaceClient")
+    @patch("dbrx_api.dbrx_auth.shared_client.get_auth_token")
     def test_add_data_objects_none(self, mock_auth, mock_client_class):
         """Test adding None objects list."""
         mock_auth.return_value = ("test_token", 3600)
@@ -277,8 +278,8 @@ class TestAddDataObjectToShare:
 
         assert result == "No data objects provided to add to share."
 
-    @patch("dbrx_api.dltshr.share.WorkspaceClient")
-    @patch("dbrx_api.dltshr.share.get_auth_token")
+    @patch("dbrx_api.dbrx_auth.shared_client.WorkspaceClient")
+    @patch("dbrx_api.dbrx_auth.shared_client.get_auth_token")
     def test_add_data_objects_already_exists(self, mock_auth, mock_client_class):
         """Test adding object that already exists."""
         mock_auth.return_value = ("test_token", 3600)
@@ -295,8 +296,8 @@ class TestAddDataObjectToShare:
 
         assert "already exists" in result
 
-    @patch("dbrx_api.dltshr.share.WorkspaceClient")
-    @patch("dbrx_api.dltshr.share.get_auth_token")
+    @patch("dbrx_api.dbrx_auth.shared_client.WorkspaceClient")
+    @patch("dbrx_api.dbrx_auth.shared_client.get_auth_token")
     def test_add_data_objects_with_views(self, mock_auth, mock_client_class):
         """Test adding views to share."""
         mock_auth.return_value = ("test_token", 3600)
@@ -315,8 +316,8 @@ class TestAddDataObjectToShare:
 
         assert result is not None
 
-    @patch("dbrx_api.dltshr.share.WorkspaceClient")
-    @patch("dbrx_api.dltshr.share.get_auth_token")
+    @patch("dbrx_api.dbrx_auth.shared_client.WorkspaceClient")
+    @patch("dbrx_api.dbrx_auth.shared_client.get_auth_token")
     def test_add_data_objects_with_schemas(self, mock_auth, mock_client_class):
         """Test adding schemas to share."""
         mock_auth.return_value = ("test_token", 3600)
@@ -335,8 +336,8 @@ class TestAddDataObjectToShare:
 
         assert result is not None
 
-    @patch("dbrx_api.dltshr.share.WorkspaceClient")
-    @patch("dbrx_api.dltshr.share.get_auth_token")
+    @patch("dbrx_api.dbrx_auth.shared_client.WorkspaceClient")
+    @patch("dbrx_api.dbrx_auth.shared_client.get_auth_token")
     def test_add_data_objects_schema_conflict(self, mock_auth, mock_client_class):
         """Test adding schema that conflicts with individual tables."""
         mock_auth.return_value = ("test_token", 3600)
@@ -356,8 +357,8 @@ class TestAddDataObjectToShare:
 class TestRevokeDataObjectFromShare:
     """Tests for revoke_data_object_from_share function."""
 
-    @patch("dbrx_api.dltshr.share.WorkspaceClient")
-    @patch("dbrx_api.dltshr.share.get_auth_token")
+    @patch("dbrx_api.dbrx_auth.shared_client.WorkspaceClient")
+    @patch("dbrx_api.dbrx_auth.shared_client.get_auth_token")
     def test_revoke_data_objects_success(self, mock_auth, mock_client_class):
         """Test successful revocation of data objects."""
         mock_auth.return_value = ("test_token", 3600)
@@ -376,8 +377,8 @@ class TestRevokeDataObjectFromShare:
 
         assert result is not None
 
-    @patch("dbrx_api.dltshr.share.WorkspaceClient")
-    @patch("dbrx_api.dltshr.share.get_auth_token")
+    @patch("dbrx_api.dbrx_auth.shared_client.WorkspaceClient")
+    @patch("dbrx_api.dbrx_auth.shared_client.get_auth_token")
     def test_revoke_data_objects_empty(self, mock_auth, mock_client_class):
         """Test revoking empty objects list."""
         mock_auth.return_value = ("test_token", 3600)
@@ -390,8 +391,8 @@ class TestRevokeDataObjectFromShare:
 
         assert result == "No data objects provided to revoke from share."
 
-    @patch("dbrx_api.dltshr.share.WorkspaceClient")
-    @patch("dbrx_api.dltshr.share.get_auth_token")
+    @patch("dbrx_api.dbrx_auth.shared_client.WorkspaceClient")
+    @patch("dbrx_api.dbrx_auth.shared_client.get_auth_token")
     def test_revoke_data_objects_permission_denied(self, mock_auth, mock_client_class):
         """Test revoking with permission denied."""
         mock_auth.return_value = ("test_token", 3600)
@@ -412,8 +413,8 @@ class TestRevokeDataObjectFromShare:
 class TestAddRecipientsToShare:
     """Tests for add_recipients_to_share function."""
 
-    @patch("dbrx_api.dltshr.share.WorkspaceClient")
-    @patch("dbrx_api.dltshr.share.get_auth_token")
+    @patch("dbrx_api.dbrx_auth.shared_client.WorkspaceClient")
+    @patch("dbrx_api.dbrx_auth.shared_client.get_auth_token")
     def test_add_recipients_success(self, mock_auth, mock_client_class):
         """Test successful addition of recipient to share."""
         mock_auth.return_value = ("test_token", 3600)
@@ -454,8 +455,8 @@ class TestAddRecipientsToShare:
         assert result is not None
         mock_client.shares.update_permissions.assert_called_once()
 
-    @patch("dbrx_api.dltshr.share.WorkspaceClient")
-    @patch("dbrx_api.dltshr.share.get_auth_token")
+    @patch("dbrx_api.dbrx_auth.shared_client.WorkspaceClient")
+    @patch("dbrx_api.dbrx_auth.shared_client.get_auth_token")
     def test_add_recipients_not_share_owner(self, mock_auth, mock_client_class):
         """Test adding recipient when not share owner."""
         mock_auth.return_value = ("test_token", 3600)
@@ -481,8 +482,8 @@ class TestAddRecipientsToShare:
 
         assert "Permission denied" in result
 
-    @patch("dbrx_api.dltshr.share.WorkspaceClient")
-    @patch("dbrx_api.dltshr.share.get_auth_token")
+    @patch("dbrx_api.dbrx_auth.shared_client.WorkspaceClient")
+    @patch("dbrx_api.dbrx_auth.shared_client.get_auth_token")
     def test_add_recipients_already_has_access(self, mock_auth, mock_client_class):
         """Test adding recipient that already has access."""
         mock_auth.return_value = ("test_token", 3600)
@@ -522,11 +523,122 @@ class TestAddRecipientsToShare:
         assert "already has" in result
 
 
+class TestAddRecipientsToShareBulk:
+    """Tests for add_recipients_to_share_bulk function."""
+
+    @patch("dbrx_api.dbrx_auth.shared_client.WorkspaceClient")
+    @patch("dbrx_api.dbrx_auth.shared_client.get_auth_token")
+    def test_add_recipients_bulk_single_update(self, mock_auth, mock_client_class):
+        """Test that missing grants go out in one update and existing grants are skipped."""
+        mock_auth.return_value = ("test_token", 3600)
+
+        mock_client = MagicMock()
+        mock_client_class.return_value = mock_client
+
+        mock_share = MagicMock()
+        mock_share.owner = "test_user"
+        mock_client.shares.get.return_value = mock_share
+
+        mock_user = MagicMock()
+        mock_user.user_name = "test_user"
+        mock_client.current_user.me.return_value = mock_user
+
+        mock_recipient = MagicMock()
+        mock_recipient.owner = "test_user"
+        mock_client.recipients.get.return_value = mock_recipient
+
+        # recipient1 already has access
+        mock_assignment = MagicMock()
+        mock_assignment.principal = "recipient1"
+        mock_assignment.privileges = ["SELECT"]
+        mock_perms = MagicMock()
+        mock_perms.privilege_assignments = [mock_assignment]
+        mock_client.shares.share_permissions.return_value = mock_perms
+
+        result = add_recipients_to_share_bulk(
+            dltshr_workspace_url="https://test.azuredatabricks.net",
+            share_name="test_share",
+            recipient_names=["recipient1", "recipient2", "recipient3"],
+        )
+
+        assert result is mock_client.shares.update_permissions.return_value
+        mock_client.shares.update_permissions.assert_called_once()
+        changes = mock_client.shares.update_permissions.call_args.kwargs["changes"]
+        assert [c.principal for c in changes] == ["recipient2", "recipient3"]
+
+    @patch("dbrx_api.dbrx_auth.shared_client.WorkspaceClient")
+    @patch("dbrx_api.dbrx_auth.shared_client.get_auth_token")
+    def test_add_recipients_bulk_all_granted(self, mock_auth, mock_client_class):
+        """Test that no update is issued when every recipient already has access."""
+        mock_auth.return_value = ("test_token", 3600)
+
+        mock_client = MagicMock()
+        mock_client_class.return_value = mock_client
+
+        mock_share = MagicMock()
+        mock_share.owner = "test_user"
+        mock_client.shares.get.return_value = mock_share
+
+        mock_user = MagicMock()
+        mock_user.user_name = "test_user"
+        mock_client.current_user.me.return_value = mock_user
+
+        mock_assignment = MagicMock()
+        mock_assignment.principal = "recipient1"
+        mock_assignment.privileges = ["SELECT"]
+        mock_perms = MagicMock()
+        mock_perms.privilege_assignments = [mock_assignment]
+        mock_client.shares.share_permissions.return_value = mock_perms
+
+        result = add_recipients_to_share_bulk(
+            dltshr_workspace_url="https://test.azuredatabricks.net",
+            share_name="test_share",
+            recipient_names=["recipient1"],
+        )
+
+        assert result is None
+        mock_client.shares.update_permissions.assert_not_called()
+
+    @patch("dbrx_api.dbrx_auth.shared_client.WorkspaceClient")
+    @patch("dbrx_api.dbrx_auth.shared_client.get_auth_token")
+    def test_add_recipients_bulk_not_recipient_owner(self, mock_auth, mock_client_class):
+        """Test adding recipients when one recipient is owned by someone else."""
+        mock_auth.return_value = ("test_token", 3600)
+
+        mock_client = MagicMock()
+        mock_client_class.return_value = mock_client
+
+        mock_share = MagicMock()
+        mock_share.owner = "test_user"
+        mock_client.shares.get.return_value = mock_share
+
+        mock_user = MagicMock()
+        mock_user.user_name = "test_user"
+        mock_client.current_user.me.return_value = mock_user
+
+        mock_recipient = MagicMock()
+        mock_recipient.owner = "other_user"
+        mock_client.recipients.get.return_value = mock_recipient
+
+        mock_perms = MagicMock()
+        mock_perms.privilege_assignments = []
+        mock_client.shares.share_permissions.return_value = mock_perms
+
+        result = add_recipients_to_share_bulk(
+            dltshr_workspace_url="https://test.azuredatabricks.net",
+            share_name="test_share",
+            recipient_names=["recipient1"],
+        )
+
+        assert "Permission denied" in result
+        mock_client.shares.update_permissions.assert_not_called()
+
+
 class TestRemoveRecipientsFromShare:
     """Tests for remove_recipients_from_share function."""
 
-    @patch("dbrx_api.dltshr.share.WorkspaceClient")
-    @patch("dbrx_api.dltshr.share.get_auth_token")
+    @patch("dbrx_api.dbrx_auth.shared_client.WorkspaceClient")
+    @patch("dbrx_api.dbrx_auth.shared_client.get_auth_token")
     def test_remove_recipients_success(self, mock_auth, mock_client_class):
         """Test successful removal of recipient from share."""
         mock_auth.return_value = ("test_token", 3600)
@@ -568,8 +680,8 @@ class TestRemoveRecipientsFromShare:
 
         assert result is not None
 
-    @patch("dbrx_api.dltshr.share.WorkspaceClient")
-    @patch("dbrx_api.dltshr.share.get_auth_token")
+    @patch("dbrx_api.dbrx_auth.shared_client.WorkspaceClient")
+    @patch("dbrx_api.dbrx_auth.shared_client.get_auth_token")
     def test_remove_recipients_no_access(self, mock_auth, mock_client_class):
         """Test removing recipient that doesn't have access."""
         mock_auth.return_value = ("test_token", 3600)
@@ -359,3 +359,14 @@ class TestIntegrationLogging:
             assert response.status_code == 404
             # Verify warning was logged
             assert mock_logger.warning.called
+
+    def test_shutdown_flushes_enqueued_logs(self, app):
+        """Test that app shutdown waits for the enqueued stdout sink to drain."""
+        from fastapi.testclient import TestClient
+        from loguru import logger
+
+        with patch.object(logger, "complete", new_callable=AsyncMock) as mock_complete:
+            with TestClient(app):
+                mock_complete.assert_not_awaited()
+
+        mock_complete.assert_awaited_once()
@@ -0,0 +1,74 @@
+"""Unit tests for provision_sharepack_new (workflow/orchestrator/provisioning.py).
+
+Tests Step 3, which checks Databricks for recipients referenced by shares but not
+declared in the share pack.
+"""
+
+from datetime import datetime
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+
+from dbrx_api.workflow.orchestrator.provisioning import provision_sharepack_new
+
+_CONFIG = {
+    "metadata": {"workspace_url": "https://ws", "configurator": "owner@example.com"},
+    "share": [{"name": "s1", "share_assets": [], "recipients": ["found", "flaky"]}],
+}
+
+
+@pytest.fixture
+def tracker():
+    """Patch StatusTracker and the config validators; return the tracker instance."""
+    instance = MagicMock()
+    instance.fail = AsyncMock()
+    instance.complete = AsyncMock()
+    with (
+        patch("dbrx_api.workflow.orchestrator.provisioning.StatusTracker", return_value=instance),
+        patch("dbrx_api.workflow.orchestrator.provisioning.validate_metadata"),
+        patch("dbrx_api.workflow.orchestrator.provisioning.validate_sharepack_config"),
+        patch(
+            "dbrx_api.workflow.orchestrator.provisioning.get_auth_token",
+            return_value=("token", datetime.now()),
+        ),
+    ):
+        yield instance
+
+
+class TestRecipientReferenceCheck:
+    """Tests for Step 3 of provision_sharepack_new."""
+
+    @pytest.mark.asyncio
+    @patch("dbrx_api.workflow.orchestrator.provisioning.ensure_shares", new_callable=AsyncMock)
+    @patch("dbrx_api.workflow.orchestrator.provisioning.aget_recipient", new_callable=AsyncMock)
+    async def test_lookup_error_fails_validation(self, mock_aget_recipient, mock_ensure_shares, tracker):
+        """Test that a non-404 lookup error fails the share pack instead of assuming the recipient exists."""
+
+        async def lookup(name, workspace_url, token):
+            if name == "flaky":
+                raise RuntimeError("503 Service Unavailable")
+            return {"name": name}
+
+        mock_aget_recipient.side_effect = lookup
+
+        with pytest.raises(ValueError, match=r"(?s)Could not verify .*flaky \(503 Service Unavailable\)"):
+            await provision_sharepack_new(MagicMock(), {"share_pack_id": uuid4(), "config": _CONFIG})
+
+        mock_ensure_shares.assert_not_awaited()
+        tracker.fail.assert_awaited_once()
+        assert tracker.fail.call_args.args[1] == "Step 3/9: Validating recipient references"
+
+    @pytest.mark.asyncio
+    @patch("dbrx_api.workflow.orchestrator.provisioning.ensure_shares", new_callable=AsyncMock)
+    @patch("dbrx_api.workflow.orchestrator.provisioning.aget_recipient", new_callable=AsyncMock)
+    async def test_not_found_reported_as_missing(self, mock_aget_recipient, mock_ensure_shares, tracker):
+        """Test that a recipient Databricks reports as absent (404) is listed as missing."""
+        mock_aget_recipient.side_effect = lambda name, *args: None if name == "flaky" else {"name": name}
+
+        with pytest.raises(ValueError, match="Missing recipients: flaky"):
+            await provision_sharepack_new(MagicMock(), {"share_pack_id": uuid4(), "config": _CONFIG})
+
+        mock_ensure_shares.assert_not_awaited()
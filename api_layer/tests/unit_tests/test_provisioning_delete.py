@@ -0,0 +1,232 @@
+"""Unit tests for the DELETE strategy's idempotency journal (workflow/orchestrator/provisioning_delete.py).
+
+Tests how _ActionLog journals each Databricks delete (STARTED before the call, OK or
+FAILED after it) and how a redelivered share pack replays those statuses.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+
+from dbrx_api.workflow.orchestrator import concurrency
+from dbrx_api.workflow.orchestrator.provisioning_delete import _DELETED_EARLIER
+from dbrx_api.workflow.orchestrator.provisioning_delete import _ActionLog
+from dbrx_api.workflow.orchestrator.provisioning_delete import _delete_share_record
+from dbrx_api.workflow.orchestrator.provisioning_delete import _lookup_existing
+from dbrx_api.workflow.orchestrator.provisioning_delete import _PendingSoftDeletes
+from dbrx_api.workflow.orchestrator.ratelimit import TokenBucket
+
+
+@pytest.fixture(autouse=True)
+def no_rate_limit():
+    """Disable the shared Databricks item limiter so tests do not wait on permits."""
+    with patch.object(concurrency, "databricks_item_limiter", TokenBucket(0)):
+        yield
+
+
+def _action_log(statuses=None):
+    repo = AsyncMock()
+    return _ActionLog(repo, uuid4(), statuses or {}), repo
+
+
+class TestActionLog:
+    """Tests for _ActionLog."""
+
+    @pytest.mark.asyncio
+    async def test_started_is_journaled_before_the_call(self):
+        """Test that STARTED is written before the action runs and OK is queued after it."""
+        log, repo = _action_log()
+        calls = []
+        repo.record_status.side_effect = lambda _id, keys, status, **kw: calls.append((status, keys))
+
+        async def action():
+            calls.append(("CALL", None))
+
+        assert await log.once("del_share:s1", action) is True
+        assert calls == [("STARTED", ["del_share:s1"]), ("CALL", None)]
+        assert log.pending == ["del_share:s1"]
+
+    @pytest.mark.asyncio
+    async def test_failed_action_queued_as_failed(self):
+        """Test that a raising action is re-raised and flushed as FAILED, not OK."""
+        log, repo = _action_log()
+        conn = object()
+
+        async def action():
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await log.once("del_recipient:r1", action)
+        await log.flush(conn)
+
+        repo.record_completed.assert_not_awaited()
+        repo.record_status.assert_awaited_with(log.share_pack_id, ["del_recipient:r1"], "FAILED", conn=conn)
+        assert not log.done("del_recipient:r1")
+
+    @pytest.mark.asyncio
+    async def test_replay_on_redelivery(self):
+        """Test that only OK keys are skipped; STARTED and FAILED keys run again."""
+        log, repo = _action_log({"del_share:a": "OK", "del_share:b": "STARTED", "del_share:c": "FAILED"})
+        ran = []
+
+        def action_for(name):
+            async def action():
+                ran.append(name)
+
+            return action
+
+        results = [await log.once(f"del_share:{name}", action_for(name)) for name in ("a", "b", "c")]
+
+        assert results == [False, True, True]
+        assert ran == ["b", "c"]
+        assert log.pending == ["del_share:b", "del_share:c"]
+
+    @pytest.mark.asyncio
+    async def test_flush_marks_completed_and_restores_on_error(self):
+        """Test that flushed keys count as done, and keys are kept for the next flush if writing fails."""
+        log, repo = _action_log()
+        await log.once("del_share:s1", AsyncMock())
+        repo.record_completed.side_effect = RuntimeError("db down")
+
+        with pytest.raises(RuntimeError, match="db down"):
+            await log.flush(object())
+        assert log.pending == ["del_share:s1"] and not log.done("del_share:s1")
+
+        repo.record_completed.side_effect = None
+        await log.flush(object())
+        assert log.pending == [] and log.done("del_share:s1")
+
+
+class TestRedeliveredDelete:
+    """Tests for how a redelivered DELETE re-checks journaled shares against Databricks."""
+
+    @pytest.mark.asyncio
+    @patch("dbrx_api.workflow.orchestrator.provisioning_delete.list_recipients")
+    @patch("dbrx_api.workflow.orchestrator.provisioning_delete.list_shares_all")
+    async def test_started_keys_looked_up_again(self, mock_list_shares, mock_list_recipients):
+        """Test that STARTED shares come from the fresh listing while OK shares are not listed."""
+        mock_list_shares.return_value = [SimpleNamespace(name="B")]
+        log, _ = _action_log({"del_share:a": "OK", "del_share:b": "STARTED", "del_share:c": "STARTED"})
+
+        shares, recipients = await _lookup_existing(["a", "b", "c"], [], "https://ws", log)
+
+        assert shares[0] is _DELETED_EARLIER
+        assert shares[1].name == "B"
+        assert shares[2] is None
+        assert recipients == []
+        mock_list_recipients.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch("dbrx_api.workflow.orchestrator.provisioning_delete.delete_share")
+    async def test_started_share_still_present_is_deleted(self, mock_delete_share):
+        """Test that a share a crashed attempt only journaled STARTED is deleted again."""
+        mock_delete_share.return_value = None
+        log, repo = _action_log({"del_share:s1": "STARTED"})
+        share_id = uuid4()
+        pending = _PendingSoftDeletes()
+        share_repo = object()
+
+        deleted = await _delete_share_record(
+            "s1",
+            "https://ws",
+            SimpleNamespace(name="s1"),
+            {"share_id": share_id},
+            [{"share_id": share_id}],
+            share_repo,
+            "sp-1",
+            pending,
+            log,
+        )
+
+        assert deleted is True
+        mock_delete_share.assert_called_once_with(share_name="s1", dltshr_workspace_url="https://ws")
+        assert pending.ids == {share_id}
+        assert log.pending == ["del_share:s1"]
+
+    @pytest.mark.asyncio
+    @patch("dbrx_api.workflow.orchestrator.provisioning_delete.delete_share")
+    async def test_started_share_gone_is_soft_deleted_without_call(self, mock_delete_share):
+        """Test that a STARTED share missing from the listing is only soft-deleted in DB."""
+        log, repo = _action_log({"del_share:s1": "STARTED"})
+        share_id = uuid4()
+        pending = _PendingSoftDeletes()
+
+        deleted = await _delete_share_record(
+            "s1", "https://ws", None, None, [{"share_id": share_id}], object(), "sp-1", pending, log
+        )
+
+        assert deleted is False
+        mock_delete_share.assert_not_called()
+        repo.record_status.assert_not_awaited()
+        assert pending.ids == {share_id}
+
+
+class _MemoryIdempotencyRepository:
+    """In-memory IdempotencyRepository keeping the same OK-is-final rule as the SQL upsert."""
+
+    def __init__(self):
+        self.rows = {}
+
+    async def list_statuses(self, share_pack_id):
+        return dict(self.rows)
+
+    async def record_status(self, share_pack_id, action_keys, status, conn=None):
+        for key in action_keys:
+            if self.rows.get(key) != "OK":
+                self.rows[key] = status
+
+    async def record_completed(self, share_pack_id, action_keys, conn=None):
+        await self.record_status(share_pack_id, action_keys, "OK", conn=conn)
+
+    async def clear(self, share_pack_id):
+        self.rows.clear()
+
+
+class TestDeleteRecreateDelete:
+    """Tests that a share recreated by a later upload is deleted again by the next DELETE."""
+
+    async def _delete_share_once(self, repo, share_pack_id):
+        """Run the share part of one DELETE attempt: look up, delete, flush the journal."""
+        log = _ActionLog(repo, share_pack_id, await repo.list_statuses(share_pack_id))
+        (existing,), _ = await _lookup_existing(["s1"], [], "https://ws", log)
+        deleted = await _delete_share_record(
+            "s1", "https://ws", existing, None, [], object(), "sp-1", _PendingSoftDeletes(), log
+        )
+        await log.flush(object())
+        return deleted
+
+    @pytest.mark.asyncio
+    @patch("dbrx_api.workflow.orchestrator.provisioning_delete.delete_share")
+    @patch("dbrx_api.workflow.orchestrator.provisioning_delete.list_shares_all")
+    async def test_new_upload_clears_earlier_deletes(self, mock_list_shares, mock_delete_share):
+        """Test delete -> recreate -> delete under one share_pack_id: the second delete reaches Databricks."""
+        mock_list_shares.return_value = [SimpleNamespace(name="s1")]
+        mock_delete_share.return_value = None
+        repo = _MemoryIdempotencyRepository()
+        share_pack_id = uuid4()
+
+        assert await self._delete_share_once(repo, share_pack_id) is True
+        assert repo.rows == {"del_share:s1": "OK"}
+
+        # A later upload recreates s1 (it is listed again), then a new DELETE config is uploaded
+        await repo.clear(share_pack_id)
+
+        assert await self._delete_share_once(repo, share_pack_id) is True
+        assert mock_delete_share.call_count == 2
+
+    @pytest.mark.asyncio
+    @patch("dbrx_api.workflow.orchestrator.provisioning_delete.delete_share")
+    @patch("dbrx_api.workflow.orchestrator.provisioning_delete.list_shares_all")
+    async def test_redelivery_of_same_upload_skips_done_delete(self, mock_list_shares, mock_delete_share):
+        """Test that without a new upload, a redelivered DELETE does not repeat a completed delete."""
+        mock_list_shares.return_value = [SimpleNamespace(name="s1")]
+        mock_delete_share.return_value = None
+        repo = _MemoryIdempotencyRepository()
+        share_pack_id = uuid4()
+
+        assert await self._delete_share_once(repo, share_pack_id) is True
+        assert await self._delete_share_once(repo, share_pack_id) is False
+        mock_delete_share.assert_called_once()
@@ -0,0 +1,52 @@
+"""Unit tests for workflow/orchestrator/ratelimit.py."""
+
+import time
+
+import pytest
+
+from dbrx_api.workflow.orchestrator.ratelimit import TokenBucket
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+
+    def test_burst_then_waits_in_arrival_order(self):
+        """Test that the burst is served at once and later callers get increasing waits."""
+        bucket = TokenBucket(rate=10, burst=2)
+
+        waits = [bucket._reserve() for _ in range(4)]
+
+        assert waits[:2] == [0.0, 0.0]
+        assert waits[2] == pytest.approx(0.1, abs=0.01)
+        assert waits[3] == pytest.approx(0.2, abs=0.01)
+
+    def test_refills_over_time(self):
+        """Test that permits come back at `rate` per second, capped at the burst size."""
+        bucket = TokenBucket(rate=100, burst=1)
+        bucket._reserve()
+
+        time.sleep(0.05)
+
+        assert bucket._reserve() == 0.0
+
+    @pytest.mark.asyncio
+    async def test_acquire_sleeps_for_reserved_permit(self):
+        """Test that acquire waits once the burst is used up."""
+        bucket = TokenBucket(rate=20, burst=1)
+
+        start = time.monotonic()
+        await bucket.acquire()
+        await bucket.acquire()
+
+        assert time.monotonic() - start >= 0.04
+
+    @pytest.mark.asyncio
+    async def test_zero_rate_disables_limiting(self):
+        """Test that a rate of 0 never waits."""
+        bucket = TokenBucket(rate=0)
+
+        start = time.monotonic()
+        for _ in range(100):
+            await bucket.acquire()
+
+        assert time.monotonic() - start < 0.05
@@ -0,0 +1,44 @@
+"""Unit tests for workflow/orchestrator/recipient_flow.py."""
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from dbrx_api.workflow.orchestrator.recipient_flow import _apply_recipient_updates
+
+
+class TestApplyRecipientUpdates:
+    """Tests for _apply_recipient_updates."""
+
+    @patch("dbrx_api.workflow.orchestrator.concurrency.time.sleep")
+    @patch("dbrx_api.workflow.orchestrator.recipient_flow.revoke_recipient_ip")
+    @patch("dbrx_api.workflow.orchestrator.recipient_flow.add_recipient_ip")
+    @patch("dbrx_api.workflow.orchestrator.recipient_flow.update_recipient_expiration_time")
+    def test_throttled_updates_retried(self, mock_expiry, mock_add_ip, mock_revoke_ip, mock_sleep):
+        """Test that update calls answered with a 429 are retried instead of failing the recipient."""
+        throttled = "429 Too Many Requests (Retry-After: 1)"
+        mock_expiry.side_effect = [throttled, SimpleNamespace(name="r1")]
+        mock_add_ip.side_effect = [throttled, SimpleNamespace(name="r1")]
+        mock_revoke_ip.side_effect = [throttled, SimpleNamespace(name="r1")]
+        existing = SimpleNamespace(ip_access_list=SimpleNamespace(allowed_ip_addresses=["10.0.0.1"]))
+        config = {"token_expiry": 30, "recipient_ips_to_add": ["10.0.0.2"], "recipient_ips_to_remove": ["10.0.0.1"]}
+
+        _apply_recipient_updates("r1", "D2O", config, existing, "https://ws", "", "")
+
+        assert mock_expiry.call_count == 2
+        assert mock_add_ip.call_count == 2
+        assert mock_revoke_ip.call_count == 2
+        assert mock_sleep.call_count == 3
+
+    @patch("dbrx_api.workflow.orchestrator.concurrency.time.sleep")
+    @patch("dbrx_api.workflow.orchestrator.recipient_flow.update_recipient_description")
+    def test_other_errors_fail_without_retry(self, mock_description, mock_sleep):
+        """Test that a non-throttling error string still fails the update on the first attempt."""
+        mock_description.return_value = "Error: permission denied"
+
+        with pytest.raises(RuntimeError, match="permission denied"):
+            _apply_recipient_updates("r1", "D2D", {}, SimpleNamespace(), "https://ws", "new", "old")
+
+        mock_description.assert_called_once()
+        mock_sleep.assert_not_called()
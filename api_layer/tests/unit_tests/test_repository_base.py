@@ -0,0 +1,290 @@
+"""Unit tests for the bulk write paths of workflow/db (scd2.py and repository_base.py).
+
+Tests the set-based soft_delete_scd2_many statements and BaseRepository.soft_delete_many,
+including the per-entity savepoint fallback when the bulk statements fail, and
+BaseRepository.create_many_from_config.
+"""
+
+from unittest.mock import AsyncMock
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+
+from dbrx_api.workflow.db.repository_base import BaseRepository
+from dbrx_api.workflow.db.repository_base import ConfigWrite
+from dbrx_api.workflow.db.scd2 import soft_delete_scd2_many
+
+
+class _Transaction:
+    """Stand-in for asyncpg's transaction/savepoint context manager."""
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+class _FakeConn:
+    """Connection double recording statements; transaction() returns a no-op savepoint."""
+
+    def __init__(self):
+        self.fetch = AsyncMock()
+        self.execute = AsyncMock()
+        self.executemany = AsyncMock()
+
+    def transaction(self):
+        return _Transaction()
+
+
+class _FakePool:
+    """Pool double whose acquire() always hands out the same connection."""
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    def acquire(self):
+        pool = self
+
+        class _Acquire:
+            async def __aenter__(self):
+                return pool.conn
+
+            async def __aexit__(self, *exc_info):
+                return False
+
+        return _Acquire()
+
+
+class _ConfigRepository(BaseRepository):
+    """Repository with the per-table hooks create_many_from_config needs."""
+
+    def __init__(self, pool):
+        super().__init__(pool, "shares", "share_id", name_column="share_name")
+
+    def _config_fields(self, **config):
+        return {"share_name": config["share_name"], "description": config.get("description", "")}
+
+
+def _current_row(entity_id, with_request_source=True):
+    row = {
+        "record_id": uuid4(),
+        "share_id": entity_id,
+        "share_name": "s1",
+        "version": 1,
+        "created_by": "orchestrator",
+        "change_reason": "created",
+        "effective_from": None,
+        "effective_to": None,
+        "is_current": True,
+        "is_deleted": False,
+    }
+    if with_request_source:
+        row["request_source"] = "api"
+    return row
+
+
+class TestSoftDeleteScd2Many:
+    """Tests for soft_delete_scd2_many."""
+
+    @pytest.mark.asyncio
+    async def test_expires_and_copies_rows_in_three_statements(self):
+        """Test that current rows are locked, expired and copied as deleted versions in bulk."""
+        a, b, missing = uuid4(), uuid4(), uuid4()
+        rows = [_current_row(a), _current_row(b)]
+        new_a, new_b = uuid4(), uuid4()
+        conn = _FakeConn()
+        conn.fetch.side_effect = [rows, [{"share_id": a, "record_id": new_a}, {"share_id": b, "record_id": new_b}]]
+
+        current, record_ids = await soft_delete_scd2_many(
+            conn, "share", "share_id", [(a, "first"), (b, "why b"), (a, "second"), (missing, "gone")], "tester", "sync"
+        )
+
+        assert set(current) == {a, b}
+        assert record_ids == {a: new_a, b: new_b}
+        select_args = conn.fetch.call_args_list[0].args
+        assert "FOR UPDATE" in select_args[0]
+        assert select_args[1] == [a, b, missing]
+        conn.execute.assert_awaited_once()
+        assert conn.execute.call_args.args[1] == [row["record_id"] for row in rows]
+        insert_args = conn.fetch.call_args_list[1].args
+        assert "COALESCE($4::text, o.request_source)" in insert_args[0]
+        # An entity listed twice is deleted with its first reason
+        assert insert_args[2] == ["first", "why b"]
+        assert insert_args[3:] == ("tester", "sync")
+
+    @pytest.mark.asyncio
+    async def test_table_without_request_source(self):
+        """Test that request_source is only written when the table has that column."""
+        a = uuid4()
+        conn = _FakeConn()
+        conn.fetch.side_effect = [
+            [_current_row(a, with_request_source=False)],
+            [{"share_id": a, "record_id": uuid4()}],
+        ]
+
+        await soft_delete_scd2_many(conn, "share", "share_id", [(a, "r")], "tester", "sync")
+
+        insert_args = conn.fetch.call_args_list[1].args
+        assert "request_source" not in insert_args[0]
+        assert len(insert_args) == 4
+
+    @pytest.mark.asyncio
+    async def test_nothing_current_skips_writes(self):
+        """Test that no UPDATE or INSERT is issued when no entity has a current active row."""
+        conn = _FakeConn()
+        conn.fetch.return_value = []
+
+        assert await soft_delete_scd2_many(conn, "share", "share_id", [(uuid4(), "r")], "tester") == ({}, {})
+        conn.execute.assert_not_awaited()
+        assert conn.fetch.await_count == 1
+
+
+class TestSoftDeleteMany:
+    """Tests for BaseRepository.soft_delete_many."""
+
+    @pytest.mark.asyncio
+    @patch("dbrx_api.workflow.db.repository_base.soft_delete_scd2_many")
+    async def test_bulk_results_per_item(self, mock_bulk):
+        """Test per-item results in order: record_id, None for duplicates and missing entities."""
+        a, b, missing = uuid4(), uuid4(), uuid4()
+        new_a, new_b = uuid4(), uuid4()
+        mock_bulk.return_value = ({a: {"share_id": a}, b: {"share_id": b}}, {a: new_a, b: new_b})
+        conn = _FakeConn()
+        repo = BaseRepository(AsyncMock(), "share", "share_id")
+
+        result = await repo.soft_delete_many([(a, "r"), (b, "r"), (a, "again"), (missing, "r")], "tester", conn=conn)
+
+        assert result == [new_a, new_b, None, None]
+        # Both audit entries are written with one executemany
+        conn.executemany.assert_awaited_once()
+        assert [entry[1] for entry in conn.executemany.call_args.args[1]] == [a, b]
+
+    @pytest.mark.asyncio
+    @patch("dbrx_api.workflow.db.repository_base.soft_delete_scd2")
+    @patch("dbrx_api.workflow.db.repository_base.get_current_version")
+    @patch("dbrx_api.workflow.db.repository_base.soft_delete_scd2_many")
+    async def test_falls_back_per_entity_when_bulk_fails(self, mock_bulk, mock_get_current, mock_single):
+        """Test that a failed bulk statement is retried per entity, isolating the bad one."""
+        good, bad, missing = uuid4(), uuid4(), uuid4()
+        new_good = uuid4()
+        mock_bulk.side_effect = RuntimeError("bulk failed")
+        mock_get_current.return_value = {"share_id": good}
+        outcomes = {good: new_good, bad: RuntimeError("bad row"), missing: None}
+
+        async def single(conn, table, column, entity_id, *args, **kwargs):
+            outcome = outcomes[entity_id]
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        mock_single.side_effect = single
+        conn = _FakeConn()
+        repo = BaseRepository(AsyncMock(), "share", "share_id")
+
+        result = await repo.soft_delete_many([(good, "r"), (bad, "r"), (missing, "r")], "tester", conn=conn)
+
+        assert result[0] == new_good
+        assert isinstance(result[1], RuntimeError) and str(result[1]) == "bad row"
+        assert result[2] is None
+        assert mock_single.await_count == 3
+
+    @pytest.mark.asyncio
+    @patch("dbrx_api.workflow.db.repository_base.soft_delete_scd2_many")
+    async def test_audit_failure_keeps_deletes(self, mock_bulk):
+        """Test that a failed audit batch is logged and the soft-deletes are still reported."""
+        a, new_a = uuid4(), uuid4()
+        mock_bulk.return_value = ({a: {"share_id": a}}, {a: new_a})
+        conn = _FakeConn()
+        conn.executemany.side_effect = RuntimeError("audit down")
+        repo = BaseRepository(AsyncMock(), "share", "share_id")
+
+        assert await repo.soft_delete_many([(a, "r")], "tester", conn=conn) == [new_a]
+
+    @pytest.mark.asyncio
+    async def test_empty_items(self):
+        """Test that no connection is used for an empty batch."""
+        pool = AsyncMock()
+        repo = BaseRepository(pool, "share", "share_id")
+
+        assert await repo.soft_delete_many([], "tester") == []
+        pool.acquire.assert_not_called()
+
+
+class TestCreateManyFromConfig:
+    """Tests for BaseRepository.create_many_from_config."""
+
+    @pytest.mark.asyncio
+    async def test_reports_resolved_ids_and_actions(self):
+        """Test that each row reports the id actually written (active, then soft-deleted, then its own) and its action."""
+        active, deleted, new = uuid4(), uuid4(), uuid4()
+        conn = _FakeConn()
+        conn.fetch.return_value = [
+            {"share_name": "a", "share_id": deleted, "is_deleted": True},
+            {"share_name": "a", "share_id": active, "is_deleted": False},
+            {"share_name": "b", "share_id": deleted, "is_deleted": True},
+        ]
+        repo = _ConfigRepository(_FakePool(conn))
+        record_ids = [uuid4(), uuid4(), uuid4()]
+        repo._create_or_update_action_on = AsyncMock(
+            side_effect=[(record_ids[0], "updated"), (record_ids[1], "created"), (record_ids[2], "created")]
+        )
+
+        result = await repo.create_many_from_config(
+            [
+                {"share_id": uuid4(), "share_name": "a"},
+                {"share_id": uuid4(), "share_name": "b", "description": "d"},
+                {"share_id": new, "share_name": "c"},
+            ]
+        )
+
+        assert result == [
+            ConfigWrite(active, record_ids[0], "updated"),
+            ConfigWrite(deleted, record_ids[1], "created"),
+            ConfigWrite(new, record_ids[2], "created"),
+        ]
+        assert "deltashare.shares" in conn.fetch.call_args.args[0]
+        assert conn.fetch.call_args.args[1] == ["a", "b", "c"]
+        calls = repo._create_or_update_action_on.call_args_list
+        assert [call.args[1] for call in calls] == [active, deleted, new]
+        assert calls[1].args[2] == {"share_name": "b", "description": "d"}
+
+    @pytest.mark.asyncio
+    async def test_failed_row_does_not_undo_others(self):
+        """Test that a row failing in its savepoint is reported as None while the rest are written."""
+        conn = _FakeConn()
+        conn.fetch.return_value = []
+        repo = _ConfigRepository(_FakePool(conn))
+        good_id, record_id = uuid4(), uuid4()
+        repo._create_or_update_action_on = AsyncMock(side_effect=[RuntimeError("bad row"), (record_id, "created")])
+
+        result = await repo.create_many_from_config(
+            [{"share_id": uuid4(), "share_name": "bad"}, {"share_id": good_id, "share_name": "good"}]
+        )
+
+        assert result == [None, ConfigWrite(good_id, record_id, "created")]
+
+
+class TestCreateOrUpdateAction:
+    """Tests for the action BaseRepository._create_or_update_action_on reports."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "before, after_same, expected",
+        [(None, False, "created"), ("old", False, "updated"), ("old", True, "unchanged")],
+    )
+    @patch("dbrx_api.workflow.db.repository_base.expire_and_insert_scd2")
+    @patch("dbrx_api.workflow.db.repository_base.get_current_version")
+    async def test_action(self, mock_get_current, mock_expire_and_insert, before, after_same, expected):
+        """Test created for no current row, updated for a new version, unchanged when no version was written."""
+        entity_id, old_record, new_record = uuid4(), uuid4(), uuid4()
+        current = {"record_id": old_record} if before else None
+        after = {"record_id": old_record if after_same else new_record}
+        mock_get_current.side_effect = [current, after]
+        mock_expire_and_insert.return_value = after["record_id"]
+        repo = BaseRepository(AsyncMock(), "shares", "share_id")
+
+        result = await repo._create_or_update_action_on(_FakeConn(), entity_id, {"share_name": "s1"}, "tester")
+
+        assert result == (after["record_id"], expected)
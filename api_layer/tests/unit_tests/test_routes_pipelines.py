@@ -314,7 +314,7 @@ class TestListPipelinesEndpoint:
         mock_pipeline_state_info,
     ):
         """Test successfully listing all pipelines."""
-        with patch("dbrx_api.jobs.dbrx_pipelines.list_pipelines") as mock_list:
+        with patch("dbrx_api.routes.routes_pipelines.list_pipelines_sdk") as mock_list:
             mock_list.return_value = [
                 mock_pipeline_state_info(pipeline_name="pipeline1"),
                 mock_pipeline_state_info(pipeline_name="pipeline2"),
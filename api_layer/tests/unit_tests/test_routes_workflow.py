@@ -4,6 +4,7 @@ from io import BytesIO
 from unittest.mock import AsyncMock
 from unittest.mock import MagicMock
 from unittest.mock import patch
+from uuid import uuid4
 
 import pytest
 from fastapi import status
@@ -125,6 +126,45 @@ class TestWorkflowSharepackUploadEndpoint:
             data = response.json()
             assert "SharePackId" in data or "Status" in data
 
+    def test_reupload_clears_idempotency_log(self, client_with_workflow):
+        """POST for an existing share pack clears its journaled actions before storing the new config."""
+        share_pack_id = uuid4()
+        with (
+            patch("dbrx_api.workflow.parsers.parser_factory.parse_sharepack_file") as mock_parse,
+            patch(
+                "dbrx_api.workflow.validators.strategy_detector.detect_optimal_strategy", new_callable=AsyncMock
+            ) as mock_detect,
+            patch("dbrx_api.workflow.db.repository_share_pack.SharePackRepository") as mock_repo_class,
+            patch("dbrx_api.workflow.db.repository_idempotency.IdempotencyRepository") as mock_idem_class,
+        ):
+            mock_parse.return_value = MagicMock(
+                metadata=MagicMock(strategy="DELETE", requestor="test@example.com", business_line="test"),
+                recipient=[],
+                share=[],
+                dict=MagicMock(return_value={"metadata": {"strategy": "DELETE"}, "recipient": [], "share": []}),
+            )
+            mock_detect.return_value = MagicMock(
+                strategy_changed=False, get_summary=MagicMock(return_value=""), warnings=[]
+            )
+            mock_repo = MagicMock()
+            mock_repo.get_by_name = AsyncMock(
+                return_value={"share_pack_id": share_pack_id, "share_pack_name": "SharePack_test"}
+            )
+            mock_repo.create_from_config = AsyncMock(return_value=None)
+            mock_repo_class.return_value = mock_repo
+            mock_idem = MagicMock()
+            mock_idem.clear = AsyncMock(return_value=None)
+            mock_idem_class.return_value = mock_idem
+
+            response = client_with_workflow.post(
+                f"{API_BASE}/workflow/sharepack/upload_and_validate",
+                files={"file": ("pack.yaml", BytesIO(b"metadata:\n  strategy: DELETE"), "application/yaml")},
+            )
+
+            assert response.status_code == status.HTTP_202_ACCEPTED
+            mock_idem.clear.assert_awaited_once_with(share_pack_id)
+            mock_repo.create_from_config.assert_awaited_once()
+
     def test_upload_and_validate_invalid_file(self, client_with_workflow):
         """POST with invalid file returns 400."""
         with patch("dbrx_api.workflow.parsers.parser_factory.parse_sharepack_file") as mock_parse:
@@ -0,0 +1,61 @@
+"""Unit tests for dbrx_auth/shared_client.py.
+
+Tests that a decorated run shares one WorkspaceClient per workspace and that
+nothing is shared outside such a run.
+"""
+
+import asyncio
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+from unittest.mock import patch
+
+import pytest
+
+from dbrx_api.dbrx_auth.shared_client import get_shared_workspace_client
+from dbrx_api.dbrx_auth.shared_client import shared_workspace_clients
+
+
+class TestSharedWorkspaceClients:
+    """Tests for shared_workspace_clients and get_shared_workspace_client."""
+
+    def test_no_shared_client_outside_run(self):
+        """Test that helpers get None (and build their own client) outside a decorated run."""
+        assert get_shared_workspace_client("https://test.azuredatabricks.net") is None
+
+    @pytest.mark.asyncio
+    @patch("dbrx_api.dbrx_auth.shared_client.WorkspaceClient")
+    @patch("dbrx_api.dbrx_auth.shared_client.get_auth_token")
+    async def test_one_client_per_workspace_in_run(self, mock_auth, mock_client_class):
+        """Test that calls in one run, including worker threads, reuse a single client and token."""
+        mock_auth.return_value = ("test_token", datetime.now(timezone.utc) + timedelta(hours=1))
+
+        @shared_workspace_clients
+        async def run():
+            first = get_shared_workspace_client("https://test.azuredatabricks.net")
+            second = await asyncio.to_thread(get_shared_workspace_client, "https://test.azuredatabricks.net/")
+            return first, second
+
+        first, second = await run()
+
+        assert first is second
+        mock_auth.assert_called_once()
+        mock_client_class.assert_called_once()
+        assert get_shared_workspace_client("https://test.azuredatabricks.net") is None
+
+    @pytest.mark.asyncio
+    @patch("dbrx_api.dbrx_auth.shared_client.WorkspaceClient")
+    @patch("dbrx_api.dbrx_auth.shared_client.get_auth_token")
+    async def test_client_rebuilt_when_token_expiring(self, mock_auth, mock_client_class):
+        """Test that a client whose token is about to expire is replaced with a fresh one."""
+        mock_auth.return_value = ("test_token", datetime.now(timezone.utc) + timedelta(minutes=1))
+
+        @shared_workspace_clients
+        async def run():
+            get_shared_workspace_client("https://test.azuredatabricks.net")
+            get_shared_workspace_client("https://test.azuredatabricks.net")
+
+        await run()
+
+        assert mock_auth.call_count == 2
+        assert mock_client_class.call_count == 2